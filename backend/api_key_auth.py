@@ -1,10 +1,15 @@
 """API key authentication for external API access."""
 
+import hashlib
+import hmac
 import os
 import secrets
+from functools import lru_cache
 from typing import Optional
-from fastapi import HTTPException, Security
-from fastapi.security import APIKeyHeader
+from fastapi import HTTPException, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from .config import SESSION_SECRET_KEY
 
 # API key configuration
 # In production, this should be stored in environment variable
@@ -15,6 +20,14 @@ API_KEY_ENV_VAR = "API_KEY"
 # Allow multiple API keys (comma-separated)
 API_KEYS_ENV_VAR = "API_KEYS"
 
+# Request header carrying the API key
+API_KEY_HEADER = "X-API-Key"
+
+
+# Keyed BLAKE2b digests of the configured API keys are kept in memory instead
+# of the plaintext keys; BLAKE2b accepts at most a 64-byte key
+_HASH_KEY = SESSION_SECRET_KEY.encode()[:64]
+
 
 def get_valid_api_keys() -> set:
     """
@@ -41,6 +54,27 @@ def get_valid_api_keys() -> set:
     return keys
 
 
+def _hash_api_key(api_key: str) -> bytes:
+    """Compute the keyed 32-byte BLAKE2b digest of an API key."""
+    return hashlib.blake2b(api_key.encode(), key=_HASH_KEY, digest_size=32).digest()
+
+
+@lru_cache(maxsize=1)
+def _valid_api_key_hashes() -> frozenset:
+    """
+    Hash the configured API keys once and memoize the result.
+    
+    Returns a frozenset of digests. If no keys are configured,
+    returns an empty frozenset (API key auth disabled).
+    """
+    return frozenset(_hash_api_key(key) for key in get_valid_api_keys())
+
+
+def invalidate_api_key_cache() -> None:
+    """Drop the cached API key hashes so the next lookup re-reads the environment."""
+    _valid_api_key_hashes.cache_clear()
+
+
 def generate_api_key() -> str:
     """Generate a new API key with the proper format."""
     return f"{API_KEY_PREFIX}{secrets.token_hex(32)}"
@@ -48,35 +82,59 @@ def generate_api_key() -> str:
 
 def is_api_key_auth_enabled() -> bool:
     """Check if API key authentication is enabled."""
-    return bool(get_valid_api_keys())
-
+    return bool(_valid_api_key_hashes())
 
-# API key header security scheme
-api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
-
-async def get_api_key(api_key: Optional[str] = Security(api_key_header)) -> Optional[str]:
+def validate_api_key(api_key: Optional[str]) -> Optional[str]:
     """
-    Dependency to extract and validate API key from header.
+    Validate a presented API key.
     
-    Returns the API key if valid, None if not provided or invalid.
-    This is a permissive check - use require_api_key for enforcement.
+    Returns the API key if valid, None if not provided, invalid,
+    or API key auth is disabled.
     """
-    if not is_api_key_auth_enabled():
+    valid_hashes = _valid_api_key_hashes()
+    if not valid_hashes:
         # API key auth is disabled, allow request
         return None
     
     if not api_key:
         return None
     
-    valid_keys = get_valid_api_keys()
-    if api_key in valid_keys:
-        return api_key
+    # Compare the fixed-size digest against every configured key in constant
+    # time (no short-circuit) so response timing doesn't reveal which key matched
+    presented_hash = _hash_api_key(api_key)
+    valid = False
+    for key_hash in valid_hashes:
+        valid |= hmac.compare_digest(presented_hash, key_hash)
+    
+    return api_key if valid else None
+
+
+class APIKeyMiddleware(BaseHTTPMiddleware):
+    """
+    Validate the X-API-Key header once per request, before routing.
+    
+    The result is stored on request.state.api_key (the key if valid,
+    otherwise None) for the API key dependencies below to read.
+    """
     
-    return None
+    async def dispatch(self, request: Request, call_next):
+        """Validate the API key header and attach the result to the request."""
+        request.state.api_key = validate_api_key(request.headers.get(API_KEY_HEADER))
+        return await call_next(request)
+
+
+async def get_api_key(request: Request) -> Optional[str]:
+    """
+    Dependency returning the API key validated by APIKeyMiddleware.
+    
+    Returns the API key if valid, None if not provided or invalid.
+    This is a permissive check - use require_api_key for enforcement.
+    """
+    return getattr(request.state, "api_key", None)
 
 
-async def require_api_key(api_key: Optional[str] = Security(api_key_header)) -> str:
+async def require_api_key(request: Request) -> str:
     """
     Dependency that requires a valid API key.
     
@@ -89,7 +147,7 @@ async def require_api_key(api_key: Optional[str] = Security(api_key_header)) ->
             detail="API key authentication is not configured on this server"
         )
     
-    validated_key = await get_api_key(api_key)
+    validated_key = await get_api_key(request)
     if not validated_key:
         raise HTTPException(
             status_code=401,
@@ -102,7 +160,7 @@ async def require_api_key(api_key: Optional[str] = Security(api_key_header)) ->
     return validated_key
 
 
-async def optional_api_key(api_key: Optional[str] = Security(api_key_header)) -> Optional[str]:
+async def optional_api_key(request: Request) -> Optional[str]:
     """
     Dependency for optional API key authentication.
     
@@ -115,4 +173,4 @@ async def optional_api_key(api_key: Optional[str] = Security(api_key_header)) ->
         return None
     
     # API key auth is enabled, require valid key
-    return await require_api_key(api_key)
+    return await require_api_key(request)
@@ -4,9 +4,15 @@ from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import RedirectResponse
 from authlib.integrations.httpx_client import AsyncOAuth2Client
 from itsdangerous import URLSafeTimedSerializer, BadSignature
+from itsdangerous.signer import SigningAlgorithm
+from dataclasses import dataclass
 from typing import Optional
+from urllib.parse import urlsplit
 import time
 import asyncio
+import hashlib
+import httpx
+import orjson
 
 from .config import (
     GITHUB_CLIENT_ID,
@@ -17,33 +23,156 @@ from .config import (
     FRONTEND_URL,
     OAUTH_CALLBACK_URL,
 )
+from .ttl_cache import TTLCache
+
+class _OrjsonSerializer:
+    """JSON backend for itsdangerous using orjson (compact output, C speed)."""
+    @staticmethod
+    def dumps(obj) -> str:
+        # Return text so itsdangerous produces str cookies, as with stdlib json
+        return orjson.dumps(obj).decode()
+
+    loads = staticmethod(orjson.loads)
+
+
+class _Blake2bAlgorithm(SigningAlgorithm):
+    """Keyed BLAKE2b signatures: one hash pass instead of HMAC-SHA1's two."""
+
+    def get_signature(self, key: bytes, value: bytes) -> bytes:
+        # BLAKE2b accepts keys up to 64 bytes (the derived key is exactly 64)
+        return hashlib.blake2b(value, key=key[:64], digest_size=16).digest()
+
 
 # Session serializer
-serializer = URLSafeTimedSerializer(SESSION_SECRET_KEY)
+serializer = URLSafeTimedSerializer(
+    SESSION_SECRET_KEY,
+    serializer=_OrjsonSerializer,
+    signer_kwargs={"algorithm": _Blake2bAlgorithm(), "digest_method": hashlib.blake2b},
+)
 
 # Cookie settings
 SESSION_COOKIE_NAME = "llm_council_session"
 SESSION_MAX_AGE = 60 * 60 * 24 * 7  # 7 days
 
+# Cache of verified session cookies so repeat requests skip signature
+# verification and JSON decoding. Keyed by a 16-byte digest of the cookie to
+# bound memory; values are (expires_at, user_data).
+_session_cache = TTLCache(maxsize=10_000, ttl=300)
+
 # GitHub OAuth URLs
 GITHUB_AUTHORIZE_URL = "https://github.com/login/oauth/authorize"
 GITHUB_TOKEN_URL = "https://github.com/login/oauth/access_token"
 GITHUB_USER_URL = "https://api.github.com/user"
 
+
+@dataclass(frozen=True, slots=True)
+class ValidatedOAuthConfig:
+    """OAuth endpoint configuration, validated once at startup."""
+    authorize_url: str
+    token_url: str
+    user_url: str
+    frontend_url: str
+    callback_url: Optional[str]  # None means auto-detect from the request
+
+
+def _is_http_url(url: str, require_https: bool = False) -> bool:
+    """Check that a URL has an http(s) scheme and a host."""
+    parts = urlsplit(url)
+    schemes = ("https",) if require_https else ("http", "https")
+    return parts.scheme in schemes and bool(parts.netloc)
+
+
+def validate_oauth_config() -> ValidatedOAuthConfig:
+    """
+    Validate the OAuth provider endpoints and redirect URLs.
+    
+    Provider endpoints must be HTTPS. An invalid OAUTH_CALLBACK_URL is ignored
+    (with a warning) in favour of auto-detection from the request.
+    """
+    for url in (GITHUB_AUTHORIZE_URL, GITHUB_TOKEN_URL, GITHUB_USER_URL):
+        if not _is_http_url(url, require_https=True):
+            raise ValueError(f"OAuth provider endpoint must be an HTTPS URL: {url}")
+    
+    if not _is_http_url(FRONTEND_URL):
+        raise ValueError(f"FRONTEND_URL must start with http:// or https://: {FRONTEND_URL}")
+    
+    callback_url = OAUTH_CALLBACK_URL
+    if callback_url and not _is_http_url(callback_url):
+        print(f"Warning: Ignoring invalid OAUTH_CALLBACK_URL (must start with http:// or https://): {callback_url}")
+        callback_url = None
+    
+    return ValidatedOAuthConfig(
+        authorize_url=GITHUB_AUTHORIZE_URL,
+        token_url=GITHUB_TOKEN_URL,
+        user_url=GITHUB_USER_URL,
+        frontend_url=FRONTEND_URL,
+        callback_url=callback_url or None,
+    )
+
+
+oauth_config = validate_oauth_config()
+
+# Frontend redirect URLs for fixed OAuth callback failures, built once
+_AUTH_ERROR_URLS = {
+    code: f"{FRONTEND_URL}?auth_error={code}"
+    for code in (
+        "no_code",
+        "invalid_state",
+        "token_exchange_failed",
+        "user_fetch_failed",
+        "not_authorized",
+    )
+}
+
+# Shared connection pool so logins reuse keep-alive connections to GitHub
+# instead of a fresh TCP/TLS handshake per request
+_github_transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_keepalive_connections=10))
+
+# Plain client on the shared pool for GitHub API calls; it keeps no token,
+# the caller's access token is sent as a header on each request
+_github_client = httpx.AsyncClient(transport=_github_transport, timeout=10.0)
+
+
+def _new_oauth_client() -> AsyncOAuth2Client:
+    """
+    Create an OAuth client for one login, on the shared connection pool.
+    
+    fetch_token() stores the exchanged token on the client, so each login
+    gets its own client; sharing one would leave the last user's token on it
+    and let concurrent callbacks overwrite each other's. These clients are
+    not closed, since closing one would close the shared transport.
+    """
+    return AsyncOAuth2Client(
+        client_id=GITHUB_CLIENT_ID,
+        client_secret=GITHUB_CLIENT_SECRET,
+        timeout=10.0,
+        transport=_github_transport,
+    )
+
+
+async def close_oauth_client() -> None:
+    """Close the shared GitHub connection pool (call on app shutdown)."""
+    await _github_client.aclose()
+
 # Server-side OAuth state storage (in-memory cache with TTL)
 # This replaces cookie-based state storage to support mobile browsers that block third-party cookies
 oauth_state_cache = {}
 oauth_state_lock = asyncio.Lock()  # Protect concurrent access to cache
 OAUTH_STATE_TTL = 600  # 10 minutes
+OAUTH_STATE_MAX_ENTRIES = 10_000  # Hard cap so /auth/login floods can't grow memory unbounded
 _last_cleanup_time = time.time()
 CLEANUP_INTERVAL = 60  # Cleanup every 60 seconds
 
 async def store_oauth_state(state: str) -> None:
     """Store OAuth state server-side with expiration time."""
     async with oauth_state_lock:
-        oauth_state_cache[state] = time.time() + OAUTH_STATE_TTL
         # Periodic cleanup instead of on every store
         await _cleanup_if_needed()
+        # Evict the oldest states when full (insertion order is expiry order
+        # since every state gets the same TTL)
+        while len(oauth_state_cache) >= OAUTH_STATE_MAX_ENTRIES:
+            del oauth_state_cache[next(iter(oauth_state_cache))]
+        oauth_state_cache[state] = time.time() + OAUTH_STATE_TTL
 
 async def verify_oauth_state(state: str) -> bool:
     """Verify OAuth state exists and is not expired."""
@@ -71,34 +200,71 @@ async def _cleanup_if_needed() -> None:
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def get_callback_url(request: Request) -> str:
+    """Get the OAuth callback URL (explicit config if set, otherwise auto-detected)."""
+    return oauth_config.callback_url or str(request.url_for("oauth_callback"))
+
+
+# OAuth configuration is fixed at import, so whether auth is enabled is too
+_AUTH_ENABLED = bool(GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET and ALLOWED_GITHUB_USERS)
+
+
 def is_auth_enabled() -> bool:
     """Check if authentication is enabled (has OAuth credentials configured)."""
-    return bool(GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET and ALLOWED_GITHUB_USERS)
+    return _AUTH_ENABLED
 
 
 def create_session_cookie(user_data: dict) -> str:
     """Create a signed session cookie with user data."""
-    return serializer.dumps(user_data)
+    # Omit empty fields to keep the cookie (sent on every request) small
+    return serializer.dumps({k: v for k, v in user_data.items() if v is not None})
+
+
+def _session_cache_key(cookie_value: str) -> bytes:
+    """Compute the session cache key for a cookie value."""
+    return hashlib.blake2b(cookie_value.encode(), digest_size=16).digest()
 
 
 def decode_session_cookie(cookie_value: str) -> Optional[dict]:
     """Decode and verify a session cookie. Returns None if invalid."""
+    cache_key = _session_cache_key(cookie_value)
+    cached = _session_cache.get(cache_key)
+    if cached is not None:
+        expires_at, user_data = cached
+        if time.time() < expires_at:
+            return dict(user_data)
+        _session_cache.pop(cache_key)
+        return None
+    
     try:
-        return serializer.loads(cookie_value, max_age=SESSION_MAX_AGE)
+        user_data, signed_at = serializer.loads(
+            cookie_value, max_age=SESSION_MAX_AGE, return_timestamp=True
+        )
     except BadSignature:
         return None
+    
+    # Never serve a cached session past the cookie's own expiry
+    _session_cache[cache_key] = (signed_at.timestamp() + SESSION_MAX_AGE, user_data)
+    return dict(user_data)
+
+
+def invalidate_session_cookie(cookie_value: Optional[str]) -> None:
+    """Drop a session cookie from the verification cache (e.g. on logout)."""
+    if cookie_value:
+        _session_cache.pop(_session_cache_key(cookie_value))
 
 
 async def get_current_user(request: Request) -> Optional[dict]:
     """Get the current authenticated user from session cookie."""
-    if not is_auth_enabled():
-        # Auth disabled, return a dummy user
-        return {"login": "anonymous", "auth_disabled": True}
-    
     cookie_value = request.cookies.get(SESSION_COOKIE_NAME)
-    if not cookie_value:
+    if not cookie_value and _AUTH_ENABLED:
+        # Common anonymous-browser path: nothing to decode
         return None
     
+    if not _AUTH_ENABLED:
+        # Auth disabled, return a dummy user
+        return {"login": "anonymous", "auth_disabled": True}
+    
     return decode_session_cookie(cookie_value)
 
 
@@ -110,6 +276,29 @@ async def require_auth(request: Request) -> dict:
     return user
 
 
+async def fetch_github_user(access_token: str) -> dict:
+    """
+    Fetch the GitHub user for an access token.
+    
+    Only the fields used for the session (login, name, avatar_url) are kept.
+    """
+    # Token passed per request; the shared client keeps no token
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/vnd.github+json",
+    }
+    
+    resp = await _github_client.get(oauth_config.user_url, headers=headers)
+    resp.raise_for_status()
+    
+    data = orjson.loads(resp.content)
+    return {
+        "login": data.get("login"),
+        "name": data.get("name"),
+        "avatar_url": data.get("avatar_url"),
+    }
+
+
 @router.get("/status")
 async def auth_status():
     """Check if authentication is enabled."""
@@ -125,17 +314,11 @@ async def login(request: Request):
     if not is_auth_enabled():
         raise HTTPException(status_code=400, detail="Authentication is not configured")
     
-    # Build callback URL (use explicit env var if set, otherwise auto-detect)
-    callback_url = OAUTH_CALLBACK_URL or str(request.url_for("oauth_callback"))
-    
-    # Create OAuth client and get authorization URL
-    client = AsyncOAuth2Client(
-        client_id=GITHUB_CLIENT_ID,
-        client_secret=GITHUB_CLIENT_SECRET,
-    )
+    callback_url = get_callback_url(request)
     
-    authorization_url, state = client.create_authorization_url(
-        GITHUB_AUTHORIZE_URL,
+    # Get authorization URL from a per-login OAuth client
+    authorization_url, state = _new_oauth_client().create_authorization_url(
+        oauth_config.authorize_url,
         redirect_uri=callback_url,
         scope="read:user"
     )
@@ -159,56 +342,41 @@ async def oauth_callback(request: Request, code: str = None, state: str = None,
         return RedirectResponse(url=f"{FRONTEND_URL}?auth_error={error}")
     
     if not code:
-        return RedirectResponse(url=f"{FRONTEND_URL}?auth_error=no_code")
+        return RedirectResponse(url=_AUTH_ERROR_URLS["no_code"])
     
     # Verify state for CSRF protection (now using server-side storage instead of cookies)
     if not state or not await verify_oauth_state(state):
-        return RedirectResponse(url=f"{FRONTEND_URL}?auth_error=invalid_state")
+        return RedirectResponse(url=_AUTH_ERROR_URLS["invalid_state"])
     
-    # Build callback URL (use explicit env var if set, otherwise auto-detect)
-    callback_url = OAUTH_CALLBACK_URL or str(request.url_for("oauth_callback"))
+    callback_url = get_callback_url(request)
     
     # Exchange code for token
-    client = AsyncOAuth2Client(
-        client_id=GITHUB_CLIENT_ID,
-        client_secret=GITHUB_CLIENT_SECRET,
-    )
-    
     try:
-        token = await client.fetch_token(
-            GITHUB_TOKEN_URL,
+        token = await _new_oauth_client().fetch_token(
+            oauth_config.token_url,
             code=code,
             redirect_uri=callback_url,
         )
     except Exception:
-        return RedirectResponse(url=f"{FRONTEND_URL}?auth_error=token_exchange_failed")
+        return RedirectResponse(url=_AUTH_ERROR_URLS["token_exchange_failed"])
     
     # Fetch user info
     try:
-        client.token = token
-        resp = await client.get(GITHUB_USER_URL)
-        user_data = resp.json()
+        user_data = await fetch_github_user(token["access_token"])
     except Exception:
-        return RedirectResponse(url=f"{FRONTEND_URL}?auth_error=user_fetch_failed")
+        return RedirectResponse(url=_AUTH_ERROR_URLS["user_fetch_failed"])
     
     github_username = user_data.get("login")
     
     # Check if user is in allow list
     if github_username not in ALLOWED_GITHUB_USERS:
-        return RedirectResponse(url=f"{FRONTEND_URL}?auth_error=not_authorized")
-    
-    # Create session data
-    session_data = {
-        "login": github_username,
-        "name": user_data.get("name"),
-        "avatar_url": user_data.get("avatar_url"),
-    }
+        return RedirectResponse(url=_AUTH_ERROR_URLS["not_authorized"])
     
     # Create response with session cookie
     response = RedirectResponse(url=FRONTEND_URL, status_code=302)
     response.set_cookie(
         key=SESSION_COOKIE_NAME,
-        value=create_session_cookie(session_data),
+        value=create_session_cookie(user_data),
         httponly=True,
         secure=SESSION_COOKIE_SECURE,
         samesite="none",  # Required for cross-site cookies (frontend/backend on different domains)
@@ -225,16 +393,18 @@ async def get_me(user: dict = Depends(require_auth)):
 
 
 @router.post("/logout")
-async def logout():
+async def logout(request: Request):
     """Log out the current user by clearing the session cookie."""
+    invalidate_session_cookie(request.cookies.get(SESSION_COOKIE_NAME))
     response = RedirectResponse(url=FRONTEND_URL, status_code=302)
     response.delete_cookie(key=SESSION_COOKIE_NAME)
     return response
 
 
 @router.get("/logout")
-async def logout_get():
+async def logout_get(request: Request):
     """Log out the current user (GET version for browser redirect)."""
+    invalidate_session_cookie(request.cookies.get(SESSION_COOKIE_NAME))
     response = RedirectResponse(url=FRONTEND_URL, status_code=302)
     response.delete_cookie(key=SESSION_COOKIE_NAME)
     return response
@@ -2,10 +2,43 @@
 
 import os
 import secrets
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
+__all__ = [
+    "OPENROUTER_API_KEY",
+    "GITHUB_CLIENT_ID",
+    "GITHUB_CLIENT_SECRET",
+    "SESSION_SECRET_KEY",
+    "SESSION_COOKIE_SECURE",
+    "ALLOWED_GITHUB_USERS",
+    "FRONTEND_URL",
+    "OAUTH_CALLBACK_URL",
+    "API_KEYS",
+    "RATE_LIMIT_GENERAL",
+    "RATE_LIMIT_EXPENSIVE",
+    "COUNCIL_MODELS",
+    "CHAIRMAN_MODEL",
+    "ModelInfo",
+    "AVAILABLE_MODELS",
+    "AVAILABLE_MODELS_BY_ID",
+    "OPENROUTER_API_URL",
+    "DATA_DIR",
+    "DATABASE_PATH",
+    "ERROR_CATALOG_FILE",
+    "ERROR_CLASSIFICATION_ENABLED",
+    "RESPONSE_CACHE_ENABLED",
+    "RESPONSE_CACHE_TTL_SECONDS",
+    "SPECULATIVE_CHAIRMAN_ENABLED",
+    "STRUCTURED_RANKINGS_ENABLED",
+    "CSP_MODE",
+    "ERROR_TYPES",
+]
+
 # OpenRouter API key
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 
@@ -22,9 +55,9 @@ SESSION_COOKIE_SECURE = os.getenv("SESSION_COOKIE_SECURE", "false").lower() == "
 
 # Allowed GitHub usernames (comma-separated list in env var)
 # If empty or not set, authentication is disabled
-ALLOWED_GITHUB_USERS = [
+ALLOWED_GITHUB_USERS = frozenset(
     u.strip() for u in os.getenv("ALLOWED_GITHUB_USERS", "").split(",") if u.strip()
-]
+)
 
 # Frontend URL for OAuth callback redirect
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
@@ -57,31 +90,43 @@ COUNCIL_MODELS = [
 # Chairman model - synthesizes final response
 CHAIRMAN_MODEL = "x-ai/grok-4-fast"
 
+
+@dataclass(frozen=True, slots=True)
+class ModelInfo:
+    """A model that can be selected for the council or as chairman."""
+    id: str
+    name: str
+    provider: str
+
+
 # All available models for selection (council models are a subset of these)
-AVAILABLE_MODELS = [
-    {"id": "openai/gpt-5.2", "name": "GPT-5.2", "provider": "OpenAI"},
-    {"id": "openai/gpt-5.1", "name": "GPT-5.1", "provider": "OpenAI"},
-    {"id": "openai/gpt-5", "name": "GPT-5", "provider": "OpenAI"},
-    {"id": "openai/gpt-5-mini", "name": "GPT-5 Mini", "provider": "OpenAI"},
-    {"id": "openai/gpt-5-nano", "name": "GPT-5 Nano", "provider": "OpenAI"},
-    {"id": "openai/gpt-4.1", "name": "GPT-4.1", "provider": "OpenAI"},
-    {"id": "google/gemini-3-pro-preview", "name": "Gemini 3 Pro", "provider": "Google"},
-    {"id": "google/gemini-3-flash-preview", "name": "Gemini 3 Flash", "provider": "Google"},
-    {"id": "google/gemini-2.5-pro", "name": "Gemini 2.5 Pro", "provider": "Google"},
-    {"id": "google/gemini-2.5-flash", "name": "Gemini 2.5 Flash", "provider": "Google"},
-    {"id": "anthropic/claude-sonnet-4.5", "name": "Claude Sonnet 4.5", "provider": "Anthropic"},
-    {"id": "anthropic/claude-sonnet-4", "name": "Claude Sonnet 4", "provider": "Anthropic"},
-    {"id": "anthropic/claude-haiku-4.5", "name": "Claude Haiku 4.5", "provider": "Anthropic"},
-    {"id": "x-ai/grok-4.1-fast", "name": "Grok 4.1 Fast", "provider": "xAI"},
-    {"id": "x-ai/grok-4-fast", "name": "Grok 4 Fast", "provider": "xAI"},
-    {"id": "x-ai/grok-4", "name": "Grok 4", "provider": "xAI"},
-    {"id": "x-ai/grok-code-fast-1", "name": "Grok Code Fast 1", "provider": "xAI"},
-    {"id": "meta-llama/llama-4-maverick", "name": "Llama 4 Maverick", "provider": "Meta"},
-    {"id": "meta-llama/llama-3.3-70b-instruct", "name": "Llama 3.3 70B", "provider": "Meta"},
-    {"id": "deepseek/deepseek-chat-v3-0324", "name": "DeepSeek V3", "provider": "DeepSeek"},
-    {"id": "deepseek/deepseek-r1", "name": "DeepSeek R1", "provider": "DeepSeek"},
-    {"id": "mistralai/mistral-large-2411", "name": "Mistral Large", "provider": "Mistral"},
-]
+AVAILABLE_MODELS: Tuple[ModelInfo, ...] = (
+    ModelInfo("openai/gpt-5.2", "GPT-5.2", "OpenAI"),
+    ModelInfo("openai/gpt-5.1", "GPT-5.1", "OpenAI"),
+    ModelInfo("openai/gpt-5", "GPT-5", "OpenAI"),
+    ModelInfo("openai/gpt-5-mini", "GPT-5 Mini", "OpenAI"),
+    ModelInfo("openai/gpt-5-nano", "GPT-5 Nano", "OpenAI"),
+    ModelInfo("openai/gpt-4.1", "GPT-4.1", "OpenAI"),
+    ModelInfo("google/gemini-3-pro-preview", "Gemini 3 Pro", "Google"),
+    ModelInfo("google/gemini-3-flash-preview", "Gemini 3 Flash", "Google"),
+    ModelInfo("google/gemini-2.5-pro", "Gemini 2.5 Pro", "Google"),
+    ModelInfo("google/gemini-2.5-flash", "Gemini 2.5 Flash", "Google"),
+    ModelInfo("anthropic/claude-sonnet-4.5", "Claude Sonnet 4.5", "Anthropic"),
+    ModelInfo("anthropic/claude-sonnet-4", "Claude Sonnet 4", "Anthropic"),
+    ModelInfo("anthropic/claude-haiku-4.5", "Claude Haiku 4.5", "Anthropic"),
+    ModelInfo("x-ai/grok-4.1-fast", "Grok 4.1 Fast", "xAI"),
+    ModelInfo("x-ai/grok-4-fast", "Grok 4 Fast", "xAI"),
+    ModelInfo("x-ai/grok-4", "Grok 4", "xAI"),
+    ModelInfo("x-ai/grok-code-fast-1", "Grok Code Fast 1", "xAI"),
+    ModelInfo("meta-llama/llama-4-maverick", "Llama 4 Maverick", "Meta"),
+    ModelInfo("meta-llama/llama-3.3-70b-instruct", "Llama 3.3 70B", "Meta"),
+    ModelInfo("deepseek/deepseek-chat-v3-0324", "DeepSeek V3", "DeepSeek"),
+    ModelInfo("deepseek/deepseek-r1", "DeepSeek R1", "DeepSeek"),
+    ModelInfo("mistralai/mistral-large-2411", "Mistral Large", "Mistral"),
+)
+
+# Index of available models by ID for O(1) validation lookups
+AVAILABLE_MODELS_BY_ID: Mapping[str, ModelInfo] = MappingProxyType({m.id: m for m in AVAILABLE_MODELS})
 
 # OpenRouter API endpoint
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
@@ -92,12 +137,33 @@ DATA_DIR = "data/conversations"
 # SQLite database path
 DATABASE_PATH = os.getenv("DATABASE_PATH", "data/llm_council.db")
 
-# Error catalog file path
-ERROR_CATALOG_FILE = "data/error_catalog.json"
+# Error catalog file path (JSON Lines: one error per line, appended to)
+ERROR_CATALOG_FILE = "data/error_catalog.jsonl"
 
 # Feature flag for error classification
 ERROR_CLASSIFICATION_ENABLED = os.getenv("ERROR_CLASSIFICATION_ENABLED", "true").lower() == "true"
 
+# Response cache: replay stored model responses for identical (model, messages)
+# requests instead of calling OpenRouter again. Off by default because requests
+# are not sent with a fixed temperature, so responses are not deterministic;
+# useful for replaying/debugging the same questions.
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+
+# How long a cached response stays valid, in seconds
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "86400"))
+
+# Start the chairman synthesis once a majority of Stage 3 rankings are in,
+# keeping it if the remaining rankings don't change the aggregate order
+# (non-streaming council runs only). Off by default because a kept draft
+# was written without seeing the slowest rankers' evaluations.
+SPECULATIVE_CHAIRMAN_ENABLED = os.getenv("SPECULATIVE_CHAIRMAN_ENABLED", "false").lower() == "true"
+
+# Ask for Stage 3 rankings as JSON matching a schema (OpenRouter structured
+# outputs) instead of a free-text FINAL RANKING section. Models without
+# structured output support ignore the schema; their replies are still
+# parsed from the text.
+STRUCTURED_RANKINGS_ENABLED = os.getenv("STRUCTURED_RANKINGS_ENABLED", "false").lower() == "true"
+
 # Security: CSP mode for Content-Security-Policy header
 # "strict" = Production mode (no unsafe-inline, unsafe-eval)
 # "relaxed" = Development mode (allows unsafe-inline, unsafe-eval for easier debugging)
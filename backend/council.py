@@ -1,90 +1,149 @@
 """3-stage LLM Council orchestration."""
 
-import json
+import re
+import bisect
+import string
 import asyncio
-from typing import List, Dict, Any, Tuple, Callable, AsyncGenerator
-from .openrouter import query_models_parallel, query_model, query_models_parallel_streaming, query_model_streaming
-from .config import COUNCIL_MODELS, CHAIRMAN_MODEL, ERROR_TYPES
-
+import hashlib
+import orjson
+from collections import defaultdict
+from typing import List, Dict, Any, Tuple, Callable, AsyncGenerator, Optional, Awaitable
+from .openrouter import (
+    query_models_parallel,
+    query_models_parallel_as_completed,
+    query_model,
+    query_models_parallel_streaming,
+    query_model_streaming,
+    DEFAULT_MAX_INFLIGHT
+)
+from .config import COUNCIL_MODELS, CHAIRMAN_MODEL, ERROR_TYPES, STRUCTURED_RANKINGS_ENABLED
+from .error_catalog import parse_classification_response
+from .ttl_cache import TTLCache
+
+# Patterns used to parse structured sections of model responses
+_RATING_RE = re.compile(
+    r'Response ([A-Z]):\s*(ACCURATE|MOSTLY ACCURATE|MIXED|MOSTLY INACCURATE|INACCURATE)',
+    re.IGNORECASE
+)
+_MOST_RELIABLE_RE = re.compile(r'MOST RELIABLE:\s*Response ([A-Z])', re.IGNORECASE)
+_NUMBERED_RE = re.compile(r'\d+\.\s*(Response [A-Z])')
+_RESP_RE = re.compile(r'Response [A-Z]')
+_SUMMARY_RE = re.compile(r'QUESTION SUMMARY:\s*(.+?)(?:\n|$)')
+
+# Section markers that precede the structured summaries
+_FACT_CHECK_MARKER = "FACT CHECK SUMMARY:"
+_FINAL_RANKING_MARKER = "FINAL RANKING:"
+
+# Rating scores for averaging fact-check ratings (higher is better)
+_RATING_SCORES = {
+    "ACCURATE": 5,
+    "MOSTLY ACCURATE": 4,
+    "MIXED": 3,
+    "MOSTLY INACCURATE": 2,
+    "INACCURATE": 1
+}
+
+# Average-score cut-offs and the consensus rating for each band (lowest first)
+_CONSENSUS_THRESHOLDS = (1.5, 2.5, 3.5, 4.5)
+_CONSENSUS_LABELS = ("INACCURATE", "MOSTLY INACCURATE", "MIXED", "MOSTLY ACCURATE", "ACCURATE")
+
+# Generated titles keyed by a digest of the first user message, so repeated
+# questions don't pay for another model round-trip
+_title_cache = TTLCache(maxsize=1024, ttl=86_400)
+
+# Responses are anonymized as "Response A" through "Response Z"
+MAX_RESPONSE_LABELS = 26
+_RESPONSE_LABELS = tuple(f"Response {chr(65 + idx)}" for idx in range(MAX_RESPONSE_LABELS))
+
+
+class _PromptTemplate:
+    """
+    A prompt with {name} placeholders, split into literal parts at import.
 
-async def stage1_collect_responses(
-    user_query: str,
-    council_models: List[str] = None
-) -> List[Dict[str, Any]]:
+    Filling it only joins the literal parts with the values, instead of
+    re-parsing the (mostly static) template text as str.format() does.
     """
-    Stage 1: Collect individual responses from all council models.
 
-    Args:
-        user_query: The user's question
-        council_models: Optional list of model IDs to use (defaults to COUNCIL_MODELS)
+    __slots__ = ("literals", "fields")
 
-    Returns:
-        List of dicts with 'model', 'instance', and 'response' keys.
-        For duplicate models, 'instance' distinguishes between them.
-    """
-    models = council_models if council_models else COUNCIL_MODELS
-    messages = [{"role": "user", "content": user_query}]
+    def __init__(self, template: str):
+        literals = []
+        fields = []
+        for literal, field, _, _ in string.Formatter().parse(template):
+            literals.append(literal)
+            if field is not None:
+                fields.append(field)
+        # Keep literals and fields interleaved: literal, field, ..., literal
+        if len(literals) == len(fields):
+            literals.append("")
+        self.literals = tuple(literals)
+        self.fields = tuple(fields)
 
-    # Query all models in parallel (handles duplicates)
-    responses = await query_models_parallel(models, messages)
+    def fill(self, **values: str) -> str:
+        """Return the prompt with each placeholder replaced by its value."""
+        pieces = [None] * (2 * len(self.fields) + 1)
+        pieces[::2] = self.literals
+        pieces[1::2] = [values[field] for field in self.fields]
+        return "".join(pieces)
 
-    # Format results - responses is now a list, not a dict
-    stage1_results = []
-    for item in responses:
-        response = item.get('response')
-        if response is not None:  # Only include successful responses
-            result = {
-                "model": item['model'],
-                "instance": item['instance'],
-                "response": response.get('content', ''),
-                "response_time_ms": response.get('response_time_ms')
-            }
-            # Preserve reasoning_details if present (for Grok models)
-            reasoning_details = response.get('reasoning_details')
-            if reasoning_details:
-                result['reasoning_details'] = reasoning_details
-            stage1_results.append(result)
 
-    return stage1_results
+# Error taxonomy as listed in the classification prompt (fixed at import)
+_ERROR_TYPES_LIST = "\n".join(f"- {et}" for et in ERROR_TYPES)
 
 
-async def stage2_fact_check(
-    user_query: str,
-    stage1_results: List[Dict[str, Any]],
-    council_models: List[str] = None
-) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+def build_label_to_model(stage1_results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """
-    Stage 2: Each model fact-checks the other models' anonymized responses.
+    Map anonymized response labels to the models that produced them.
 
     Args:
-        user_query: The original user query
-        stage1_results: Results from Stage 1
-        council_models: Optional list of model IDs to use (defaults to COUNCIL_MODELS)
+        stage1_results: Results from Stage 1, in label order
 
     Returns:
-        Tuple of (fact_check list, label_to_model mapping).
-        label_to_model maps "Response X" to {"model": model_id, "instance": instance_idx}
-    """
-    models = council_models if council_models else COUNCIL_MODELS
-    # Create anonymized labels for responses (Response A, Response B, etc.)
-    labels = [chr(65 + i) for i in range(len(stage1_results))]  # A, B, C, ...
+        Dict mapping "Response X" to {"model": model_id, "instance": instance_idx}
 
-    # Create mapping from label to model info (includes instance for duplicates)
-    label_to_model = {
-        f"Response {label}": {
+    Raises:
+        ValueError: If there are more responses than available labels
+    """
+    if len(stage1_results) > MAX_RESPONSE_LABELS:
+        raise ValueError(
+            f"Cannot anonymize {len(stage1_results)} responses; "
+            f"at most {MAX_RESPONSE_LABELS} are supported"
+        )
+    return {
+        _RESPONSE_LABELS[idx]: {
             "model": result['model'],
             "instance": result.get('instance', idx)
         }
-        for idx, (label, result) in enumerate(zip(labels, stage1_results))
+        for idx, result in enumerate(stage1_results)
     }
 
-    # Build the fact-checking prompt
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
-        for label, result in zip(labels, stage1_results)
-    ])
 
-    fact_check_prompt = f"""You are a fact-checker evaluating different AI responses to the following question:
+def _format_responses_text(stage1_results: List[Dict[str, Any]]) -> str:
+    """Format Stage 1 responses under their anonymized labels for a prompt."""
+    return "\n\n".join(
+        f"{_RESPONSE_LABELS[idx]}:\n{result['response']}"
+        for idx, result in enumerate(stage1_results)
+    )
+
+
+
+def format_fact_check_text(fact_check_results: List[Dict[str, Any]]) -> str:
+    """
+    Format Stage 2 fact-checks, attributed to their models, for chairman prompts.
+
+    Args:
+        fact_check_results: Results from Stage 2
+
+    Returns:
+        The fact-check texts joined under "Fact-checker (model)" headers
+    """
+    return "\n\n".join(
+        f"Fact-checker ({result['model']}):\n{result['fact_check']}"
+        for result in fact_check_results
+    )
+
+# Prompt asking each council model to fact-check the anonymized responses
+_FACT_CHECK_TEMPLATE = _PromptTemplate("""You are a fact-checker evaluating different AI responses to the following question:
 
 Question: {user_query}
 
@@ -115,118 +174,28 @@ Response B: MIXED
 Response C: ACCURATE
 MOST RELIABLE: Response C
 
-Now provide your detailed fact-check analysis:"""
-
-    messages = [{"role": "user", "content": fact_check_prompt}]
-
-    # Get fact-checks from all council models in parallel
-    responses = await query_models_parallel(models, messages)
-
-    # Format results - responses is now a list
-    fact_check_results = []
-    for item in responses:
-        response = item.get('response')
-        if response is not None:
-            full_text = response.get('content', '')
-            parsed = parse_fact_check_from_text(full_text)
-            fact_check_results.append({
-                "model": item['model'],
-                "instance": item['instance'],
-                "fact_check": full_text,
-                "parsed_summary": parsed,
-                "response_time_ms": response.get('response_time_ms')
-            })
-
-    return fact_check_results, label_to_model
-
-
-def parse_fact_check_from_text(fact_check_text: str) -> Dict[str, Any]:
-    """
-    Parse the FACT CHECK SUMMARY section from the model's response.
-
-    Args:
-        fact_check_text: The full text response from the model
-
-    Returns:
-        Dict with ratings per response and most_reliable
-    """
-    import re
-
-    result = {
-        "ratings": {},
-        "most_reliable": None
-    }
-
-    # Look for "FACT CHECK SUMMARY:" section
-    if "FACT CHECK SUMMARY:" in fact_check_text:
-        # Extract everything after "FACT CHECK SUMMARY:"
-        parts = fact_check_text.split("FACT CHECK SUMMARY:")
-        if len(parts) >= 2:
-            summary_section = parts[1]
-
-            # Extract ratings (e.g., "Response A: MOSTLY ACCURATE")
-            rating_matches = re.findall(
-                r'Response ([A-Z]):\s*(ACCURATE|MOSTLY ACCURATE|MIXED|MOSTLY INACCURATE|INACCURATE)',
-                summary_section,
-                re.IGNORECASE
-            )
-            for label, rating in rating_matches:
-                result["ratings"][f"Response {label}"] = rating.upper()
-
-            # Extract most reliable
-            most_reliable_match = re.search(
-                r'MOST RELIABLE:\s*Response ([A-Z])',
-                summary_section,
-                re.IGNORECASE
-            )
-            if most_reliable_match:
-                result["most_reliable"] = f"Response {most_reliable_match.group(1)}"
-
-    return result
+Now provide your detailed fact-check analysis:""")
 
+# Final ranking format shared by both ranking prompts
+_RANKING_FORMAT_INSTRUCTIONS = """IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
+- Start with the line "FINAL RANKING:" (all caps, with colon)
+- Then list the responses from best to worst as a numbered list
+- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
+- Do not add any other text or explanations in the ranking section
 
-async def stage3_collect_rankings(
-    user_query: str,
-    stage1_results: List[Dict[str, Any]],
-    fact_check_results: List[Dict[str, Any]],
-    label_to_model: Dict[str, str],
-    council_models: List[str] = None
-) -> List[Dict[str, Any]]:
-    """
-    Stage 3: Each model ranks the anonymized responses (after seeing fact-checks).
+Example of the correct format:
 
-    Args:
-        user_query: The original user query
-        stage1_results: Results from Stage 1
-        fact_check_results: Results from Stage 2 (fact-checking)
-        label_to_model: Mapping from labels to model names
-        council_models: Optional list of model IDs to use (defaults to COUNCIL_MODELS)
+FINAL RANKING:
+1. Response C
+2. Response A
+3. Response B
 
-    Returns:
-        List of rankings from each model
-    """
-    models = council_models if council_models else COUNCIL_MODELS
-    # Get labels from label_to_model
-    labels = [label.replace("Response ", "") for label in label_to_model.keys()]
-    labels.sort()
-
-    # Build the ranking prompt with fact-check context
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
-        for label, result in zip(labels, stage1_results)
-    ])
-
-    # Build ranking prompt (with or without fact-check context)
-    if fact_check_results:
-        # Summarize fact-check findings
-        fact_check_summary = "\n\n".join([
-            f"Fact-checker {i+1}:\n{result['fact_check']}"
-            for i, result in enumerate(fact_check_results)
-        ])
-
-        ranking_prompt = f"""You are evaluating different responses to the following question:
+Now provide your evaluation and ranking:"""
 
-Question: {user_query}
+# Ranking prompts are split into a large static context (sent as a system
+# message so providers can cache it as a shared prefix) and a short task
+# message carrying the question. Context used when fact-checks are available:
+_RANKING_CONTEXT_WITH_FACT_CHECKS_TEMPLATE = _PromptTemplate("""You are evaluating different responses to a user's question.
 
 Here are the responses from different models (anonymized):
 
@@ -236,7 +205,9 @@ Here are the responses from different models (anonymized):
 
 Here are the fact-check analyses from peer reviewers:
 
-{fact_check_summary}
+{fact_check_summary}""")
+
+_RANKING_TASK_WITH_FACT_CHECKS_TEMPLATE = _PromptTemplate("""Question: {user_query}
 
 ---
 
@@ -246,16 +217,18 @@ Your task:
    - Factual accuracy (as revealed by the fact-checks)
    - Completeness and helpfulness
    - Clarity and reasoning
-3. Then, at the very end of your response, provide a final ranking."""
-    else:
-        # No fact-checking, evaluate based on quality alone
-        ranking_prompt = f"""You are evaluating different responses to the following question:
+3. Then, at the very end of your response, provide a final ranking.
 
-Question: {user_query}
+""" + _RANKING_FORMAT_INSTRUCTIONS)
+
+# Ranking context and task used when fact-checking is disabled
+_RANKING_CONTEXT_TEMPLATE = _PromptTemplate("""You are evaluating different responses to a user's question.
 
 Here are the responses from different models (anonymized):
 
-{responses_text}
+{responses_text}""")
+
+_RANKING_TASK_TEMPLATE = _PromptTemplate("""Question: {user_query}
 
 ---
 
@@ -266,88 +239,86 @@ Your task:
    - Clarity and reasoning
 2. Then, at the very end of your response, provide a final ranking.
 
-IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
-- Start with the line "FINAL RANKING:" (all caps, with colon)
-- Then list the responses from best to worst as a numbered list
-- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
-- Do not add any other text or explanations in the ranking section
+""" + _RANKING_FORMAT_INSTRUCTIONS)
 
-Example of the correct format:
 
-FINAL RANKING:
-1. Response C
-2. Response A
-3. Response B
+def _build_fact_check_prompt(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]]
+) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+    """
+    Build the Stage 2 fact-checking prompt.
 
-Now provide your evaluation and ranking:"""
+    Args:
+        user_query: The original user query
+        stage1_results: Results from Stage 1
 
-    messages = [{"role": "user", "content": ranking_prompt}]
+    Returns:
+        Tuple of (prompt text, label_to_model mapping)
+    """
+    label_to_model = build_label_to_model(stage1_results)
+    prompt = _FACT_CHECK_TEMPLATE.fill(
+        user_query=user_query,
+        responses_text=_format_responses_text(stage1_results)
+    )
+    return prompt, label_to_model
 
-    # Get rankings from all council models in parallel
-    responses = await query_models_parallel(models, messages)
 
-    # Format results - responses is now a list
-    stage3_results = []
-    for item in responses:
-        response = item.get('response')
-        if response is not None:
-            full_text = response.get('content', '')
-            parsed = parse_ranking_from_text(full_text)
-            stage3_results.append({
-                "model": item['model'],
-                "instance": item['instance'],
-                "ranking": full_text,
-                "parsed_ranking": parsed,
-                "response_time_ms": response.get('response_time_ms')
-            })
+def _context_and_task_messages(context: str, task: str) -> List[Dict[str, str]]:
+    """
+    Build a messages list with the static context first and the task last.
 
-    return stage3_results
+    The context goes in a system message so it forms a byte-identical prefix
+    across every model queried with it, which providers can serve from their
+    prompt cache; the question-specific task follows as the user message.
+    """
+    return [
+        {"role": "system", "content": context},
+        {"role": "user", "content": task}
+    ]
 
 
-async def stage4_synthesize_final(
+def _build_ranking_messages(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
-    fact_check_results: List[Dict[str, Any]],
-    stage3_results: List[Dict[str, Any]],
-    label_to_model: Dict[str, str],
-    chairman_model: str = None
-) -> Dict[str, Any]:
+    fact_check_results: List[Dict[str, Any]]
+) -> List[Dict[str, str]]:
     """
-    Stage 4: Chairman synthesizes final response with fact-check validation.
+    Build the Stage 3 ranking messages, including fact-checks when available.
 
     Args:
         user_query: The original user query
-        stage1_results: Individual model responses from Stage 1
-        fact_check_results: Fact-checks from Stage 2
-        stage3_results: Rankings from Stage 3
-        label_to_model: Mapping from labels to model names
-        chairman_model: Optional chairman model ID (defaults to CHAIRMAN_MODEL)
+        stage1_results: Results from Stage 1
+        fact_check_results: Results from Stage 2 (may be empty)
 
     Returns:
-        Dict with 'model', 'response', and 'fact_check_synthesis' keys
+        Messages list of (system context, user task)
     """
-    chairman = chairman_model if chairman_model else CHAIRMAN_MODEL
-    # Build comprehensive context for chairman
-    stage1_text = "\n\n".join([
-        f"Model: {result['model']}\nResponse: {result['response']}"
-        for result in stage1_results
-    ])
+    responses_text = _format_responses_text(stage1_results)
 
-    stage3_text = "\n\n".join([
-        f"Model: {result['model']}\nRanking: {result['ranking']}"
-        for result in stage3_results
-    ])
+    if not fact_check_results:
+        # No fact-checking, evaluate based on quality alone
+        return _context_and_task_messages(
+            _RANKING_CONTEXT_TEMPLATE.fill(responses_text=responses_text),
+            _RANKING_TASK_TEMPLATE.fill(user_query=user_query)
+        )
 
-    if fact_check_results:
-        # With fact-checking
-        fact_check_text = "\n\n".join([
-            f"Fact-checker ({result['model']}):\n{result['fact_check']}"
-            for result in fact_check_results
-        ])
+    # Summarize fact-check findings
+    fact_check_summary = "\n\n".join(
+        f"Fact-checker {i+1}:\n{result['fact_check']}"
+        for i, result in enumerate(fact_check_results)
+    )
+    return _context_and_task_messages(
+        _RANKING_CONTEXT_WITH_FACT_CHECKS_TEMPLATE.fill(
+            responses_text=responses_text,
+            fact_check_summary=fact_check_summary
+        ),
+        _RANKING_TASK_WITH_FACT_CHECKS_TEMPLATE.fill(user_query=user_query)
+    )
 
-        chairman_prompt = f"""You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question. Then each model fact-checked each other's responses. Finally, each model ranked the responses taking the fact-checks into account.
 
-Original Question: {user_query}
+# Chairman context and task used when fact-checks are available
+_CHAIRMAN_CONTEXT_WITH_FACT_CHECKS_TEMPLATE = _PromptTemplate("""You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question. Then each model fact-checked each other's responses. Finally, each model ranked the responses taking the fact-checks into account.
 
 === STAGE 1 - Individual Responses ===
 {stage1_text}
@@ -356,22 +327,9 @@ Original Question: {user_query}
 {fact_check_text}
 
 === STAGE 3 - Peer Rankings (Informed by Fact-Checks) ===
-{stage3_text}"""
-    else:
-        # Without fact-checking
-        chairman_prompt = f"""You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question. Each model has then evaluated and ranked all the responses.
-
-Original Question: {user_query}
+{stage3_text}""")
 
-=== STAGE 1 - Individual Responses ===
-{stage1_text}
-
-=== STAGE 2 - Peer Rankings ===
-{stage3_text}"""
-
-    # Add task description based on whether fact-checking was done
-    if fact_check_results:
-        chairman_prompt += """
+_CHAIRMAN_TASK_WITH_FACT_CHECKS_TEMPLATE = _PromptTemplate("""Original Question: {user_query}
 
 ---
 
@@ -402,10 +360,18 @@ Structure your response as follows:
 ## Final Council Answer
 [Your comprehensive, fact-checked answer to the user's question]
 
-Now provide your Chairman synthesis:"""
-    else:
-        # Without fact-checking, simpler synthesis
-        chairman_prompt += """
+Now provide your Chairman synthesis:""")
+
+# Chairman context and task used when fact-checking is disabled
+_CHAIRMAN_CONTEXT_TEMPLATE = _PromptTemplate("""You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question. Each model has then evaluated and ranked all the responses.
+
+=== STAGE 1 - Individual Responses ===
+{stage1_text}
+
+=== STAGE 2 - Peer Rankings ===
+{stage3_text}""")
+
+_CHAIRMAN_TASK_TEMPLATE = _PromptTemplate("""Original Question: {user_query}
 
 ---
 
@@ -432,9 +398,295 @@ Structure your response as follows:
 ## Final Council Answer
 [Your comprehensive, synthesized answer to the user's question]
 
-Now provide your Chairman synthesis:"""
+Now provide your Chairman synthesis:""")
+
+
+def _build_chairman_messages(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    fact_check_results: List[Dict[str, Any]],
+    stage3_results: List[Dict[str, Any]],
+    fact_check_text: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Build the Stage 4 chairman messages, including fact-checks when available.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Individual model responses from Stage 1
+        fact_check_results: Fact-checks from Stage 2 (may be empty)
+        stage3_results: Rankings from Stage 3
+        fact_check_text: Optional prebuilt format_fact_check_text() output
+
+    Returns:
+        Messages list of (system context, user task)
+    """
+    stage1_text = "\n\n".join(
+        f"Model: {result['model']}\nResponse: {result['response']}"
+        for result in stage1_results
+    )
+    stage3_text = "\n\n".join(
+        f"Model: {result['model']}\nRanking: {result['ranking']}"
+        for result in stage3_results
+    )
+
+    if not fact_check_results:
+        return _context_and_task_messages(
+            _CHAIRMAN_CONTEXT_TEMPLATE.fill(stage1_text=stage1_text, stage3_text=stage3_text),
+            _CHAIRMAN_TASK_TEMPLATE.fill(user_query=user_query)
+        )
+
+    if fact_check_text is None:
+        fact_check_text = format_fact_check_text(fact_check_results)
+    return _context_and_task_messages(
+        _CHAIRMAN_CONTEXT_WITH_FACT_CHECKS_TEMPLATE.fill(
+            stage1_text=stage1_text,
+            fact_check_text=fact_check_text,
+            stage3_text=stage3_text
+        ),
+        _CHAIRMAN_TASK_WITH_FACT_CHECKS_TEMPLATE.fill(user_query=user_query)
+    )
+
+
+async def stage1_collect_responses(
+    user_query: str,
+    council_models: List[str] = None,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT
+) -> List[Dict[str, Any]]:
+    """
+    Stage 1: Collect individual responses from all council models.
+
+    Args:
+        user_query: The user's question
+        council_models: Optional list of model IDs to use (defaults to COUNCIL_MODELS)
+        max_inflight: Maximum number of model requests in flight at once
+
+    Returns:
+        List of dicts with 'model', 'instance', and 'response' keys.
+        For duplicate models, 'instance' distinguishes between them.
+    """
+    models = council_models if council_models else COUNCIL_MODELS
+    messages = [{"role": "user", "content": user_query}]
+
+    # Query all models in parallel (handles duplicates), formatting each
+    # result as soon as its model returns instead of after the slowest one
+    # Results are slotted by instance, which keeps council order so response
+    # labels don't depend on completion order
+    slots = [None] * len(models)
+    async for item in query_models_parallel_as_completed(models, messages, max_inflight=max_inflight):
+        response = item.get('response')
+        if response is not None:  # Only include successful responses
+            result = {
+                "model": item['model'],
+                "instance": item['instance'],
+                "response": response.get('content', ''),
+                "response_time_ms": response.get('response_time_ms')
+            }
+            # Preserve reasoning_details if present (for Grok models)
+            reasoning_details = response.get('reasoning_details')
+            if reasoning_details:
+                result['reasoning_details'] = reasoning_details
+            slots[item['instance']] = result
+
+    # Drop the slots of models that failed
+    stage1_results = [result for result in slots if result is not None]
+
+    return stage1_results
+
+
+async def stage2_fact_check(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    council_models: List[str] = None,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT
+) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Stage 2: Each model fact-checks the other models' anonymized responses.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Results from Stage 1
+        council_models: Optional list of model IDs to use (defaults to COUNCIL_MODELS)
+        max_inflight: Maximum number of model requests in flight at once
+
+    Returns:
+        Tuple of (fact_check list, label_to_model mapping).
+        label_to_model maps "Response X" to {"model": model_id, "instance": instance_idx}
+    """
+    models = council_models if council_models else COUNCIL_MODELS
+    # Build the fact-checking prompt and anonymized label mapping
+    fact_check_prompt, label_to_model = _build_fact_check_prompt(user_query, stage1_results)
+
+    messages = [{"role": "user", "content": fact_check_prompt}]
+
+    # Get fact-checks from all council models in parallel
+    responses = await query_models_parallel(models, messages, max_inflight=max_inflight)
+
+    # Format results - responses is now a list
+    fact_check_results = [None] * len(responses)
+    count = 0
+    for item in responses:
+        response = item.get('response')
+        if response is not None:
+            full_text = response.get('content', '')
+            parsed = parse_fact_check_from_text(full_text)
+            fact_check_results[count] = {
+                "model": item['model'],
+                "instance": item['instance'],
+                "fact_check": full_text,
+                "parsed_summary": parsed,
+                "response_time_ms": response.get('response_time_ms')
+            }
+            count += 1
+    del fact_check_results[count:]
+
+    return fact_check_results, label_to_model
+
+
+def parse_fact_check_from_text(fact_check_text: str) -> Dict[str, Any]:
+    """
+    Parse the FACT CHECK SUMMARY section from the model's response.
+
+    Args:
+        fact_check_text: The full text response from the model
+
+    Returns:
+        Dict with ratings per response and most_reliable
+    """
+    result = {
+        "ratings": {},
+        "most_reliable": None
+    }
+
+    # Look for the last "FACT CHECK SUMMARY:" marker (the summary comes at the end)
+    idx = fact_check_text.rfind(_FACT_CHECK_MARKER)
+    if idx == -1:
+        return result
+
+    # Extract everything after "FACT CHECK SUMMARY:"
+    summary_section = fact_check_text[idx + len(_FACT_CHECK_MARKER):]
+
+    # Extract ratings (e.g., "Response A: MOSTLY ACCURATE")
+    rating_matches = _RATING_RE.findall(summary_section)
+    for label, rating in rating_matches:
+        result["ratings"][f"Response {label}"] = rating.upper()
+
+    # Extract most reliable
+    most_reliable_match = _MOST_RELIABLE_RE.search(summary_section)
+    if most_reliable_match:
+        result["most_reliable"] = f"Response {most_reliable_match.group(1)}"
+
+    return result
+
+
+class _SummaryTail:
+    """
+    Incrementally track the FACT CHECK SUMMARY section of a streamed response.
+
+    Holds the text from the most recent marker onwards; before any marker has
+    been seen, only enough characters are kept to catch one split across chunks.
+    """
+
+    __slots__ = ("text", "seen")
+
+    def __init__(self):
+        self.text = ""
+        self.seen = False
+
+    def feed(self, chunk_text: str) -> None:
+        """Append a streamed chunk, restarting at any new summary marker."""
+        scan_from = max(0, len(self.text) - len(_FACT_CHECK_MARKER) + 1)
+        self.text += chunk_text
+        idx = self.text.rfind(_FACT_CHECK_MARKER, scan_from)
+        if idx != -1:
+            self.text = self.text[idx:]
+            self.seen = True
+        elif not self.seen:
+            self.text = self.text[-(len(_FACT_CHECK_MARKER) - 1):]
+
+
+async def stage3_collect_rankings(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    fact_check_results: List[Dict[str, Any]],
+    label_to_model: Dict[str, str],
+    council_models: List[str] = None,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT
+) -> List[Dict[str, Any]]:
+    """
+    Stage 3: Each model ranks the anonymized responses (after seeing fact-checks).
+
+    Args:
+        user_query: The original user query
+        stage1_results: Results from Stage 1
+        fact_check_results: Results from Stage 2 (fact-checking)
+        label_to_model: Mapping from labels to model names
+        council_models: Optional list of model IDs to use (defaults to COUNCIL_MODELS)
+        max_inflight: Maximum number of model requests in flight at once
+
+    Returns:
+        List of rankings from each model
+    """
+    models = council_models if council_models else COUNCIL_MODELS
+    # Build the ranking messages (with fact-check context if available)
+    messages = _build_ranking_messages(user_query, stage1_results, fact_check_results)
+
+    # Get rankings from all council models in parallel
+    responses = await query_models_parallel(
+        models, messages, max_inflight=max_inflight,
+        response_format=_ranking_response_format(len(stage1_results))
+    )
+
+    # Format results - responses is now a list
+    stage3_results = [None] * len(responses)
+    count = 0
+    for item in responses:
+        response = item.get('response')
+        if response is not None:
+            full_text, parsed = _parse_ranking_response(response.get('content', ''))
+            stage3_results[count] = {
+                "model": item['model'],
+                "instance": item['instance'],
+                "ranking": full_text,
+                "parsed_ranking": parsed,
+                "response_time_ms": response.get('response_time_ms')
+            }
+            count += 1
+    del stage3_results[count:]
+
+    return stage3_results
+
+
+async def stage4_synthesize_final(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    fact_check_results: List[Dict[str, Any]],
+    stage3_results: List[Dict[str, Any]],
+    label_to_model: Dict[str, str],
+    chairman_model: str = None,
+    fact_check_text: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Stage 4: Chairman synthesizes final response with fact-check validation.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Individual model responses from Stage 1
+        fact_check_results: Fact-checks from Stage 2
+        stage3_results: Rankings from Stage 3
+        label_to_model: Mapping from labels to model names
+        chairman_model: Optional chairman model ID (defaults to CHAIRMAN_MODEL)
+        fact_check_text: Optional prebuilt format_fact_check_text() output,
+            so callers that also classify errors only build it once
 
-    messages = [{"role": "user", "content": chairman_prompt}]
+    Returns:
+        Dict with 'model', 'response', and 'fact_check_synthesis' keys
+    """
+    chairman = chairman_model if chairman_model else CHAIRMAN_MODEL
+    # Build comprehensive context for chairman
+    messages = _build_chairman_messages(
+        user_query, stage1_results, fact_check_results, stage3_results, fact_check_text
+    )
 
     # Query the chairman model
     response = await query_model(chairman, messages)
@@ -464,30 +716,89 @@ def parse_ranking_from_text(ranking_text: str) -> List[str]:
     Returns:
         List of response labels in ranked order
     """
-    import re
-
-    # Look for "FINAL RANKING:" section
-    if "FINAL RANKING:" in ranking_text:
+    # Look for the last "FINAL RANKING:" marker (the ranking comes at the end)
+    idx = ranking_text.rfind(_FINAL_RANKING_MARKER)
+    if idx != -1:
         # Extract everything after "FINAL RANKING:"
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[1]
-            # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r'\d+\.\s*Response [A-Z]', ranking_section)
-            if numbered_matches:
-                # Extract just the "Response X" part
-                return [re.search(r'Response [A-Z]', m).group() for m in numbered_matches]
-
-            # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r'Response [A-Z]', ranking_section)
-            return matches
+        ranking_section = ranking_text[idx + len(_FINAL_RANKING_MARKER):]
+        # Prefer the numbered list format (e.g., "1. Response A"); the pattern
+        # captures just the "Response X" part. Fall back to all "Response X"
+        # patterns in order.
+        return _NUMBERED_RE.findall(ranking_section) or _RESP_RE.findall(ranking_section)
 
     # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r'Response [A-Z]', ranking_text)
+    matches = _RESP_RE.findall(ranking_text)
     return matches
 
 
+def _ranking_response_format(num_responses: int) -> Optional[Dict[str, Any]]:
+    """
+    Build the structured output format for Stage 3 ranking requests.
+
+    Args:
+        num_responses: Number of anonymized responses being ranked
+
+    Returns:
+        OpenRouter json_schema response format, or None if structured
+        rankings are disabled
+    """
+    if not STRUCTURED_RANKINGS_ENABLED:
+        return None
+    labels = list(_RESPONSE_LABELS[:num_responses])
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "ranking",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "evaluation": {"type": "string"},
+                    "final_ranking": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": labels}
+                    }
+                },
+                "required": ["evaluation", "final_ranking"],
+                "additionalProperties": False
+            }
+        }
+    }
+
+
+def _parse_ranking_response(content: str) -> Tuple[str, List[str]]:
+    """
+    Get the ranking text and parsed ranking from a Stage 3 reply.
+
+    Structured (JSON) replies are rendered back into the evaluation followed
+    by a FINAL RANKING section, so they are displayed and stored like plain
+    text rankings. Anything else is parsed with parse_ranking_from_text().
+
+    Args:
+        content: The model's reply
+
+    Returns:
+        Tuple of (ranking text, list of response labels in ranked order)
+    """
+    if content.startswith("{"):
+        try:
+            data = orjson.loads(content)
+            evaluation = data["evaluation"]
+            labels = data["final_ranking"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            pass
+        else:
+            if isinstance(evaluation, str) and isinstance(labels, list):
+                parsed = [
+                    label for label in labels
+                    if isinstance(label, str) and _RESP_RE.fullmatch(label)
+                ]
+                numbered = "\n".join(f"{pos}. {label}" for pos, label in enumerate(parsed, 1))
+                return f"{evaluation}\n\n{_FINAL_RANKING_MARKER}\n{numbered}", parsed
+
+    return content, parse_ranking_from_text(content)
+
+
 def calculate_aggregate_rankings(
     stage2_results: List[Dict[str, Any]],
     label_to_model: Dict[str, Dict[str, Any]]
@@ -503,39 +814,40 @@ def calculate_aggregate_rankings(
         List of dicts with model info and average rank, sorted best to worst.
         For duplicate models, each instance is tracked separately.
     """
-    from collections import defaultdict
+    # Nothing to aggregate (e.g. every ranking model failed)
+    if not stage2_results or not label_to_model:
+        return []
 
-    # Track positions for each model instance (keyed by "model:instance")
+    # Track positions for each model instance (keyed by (model, instance))
     model_positions = defaultdict(list)
 
     for ranking in stage2_results:
-        ranking_text = ranking['ranking']
-
-        # Parse the ranking from the structured format
-        parsed_ranking = parse_ranking_from_text(ranking_text)
+        # Stage 3 already parsed the ranking; fall back to parsing the text
+        parsed_ranking = ranking.get('parsed_ranking') or parse_ranking_from_text(ranking['ranking'])
 
         for position, label in enumerate(parsed_ranking, start=1):
             if label in label_to_model:
                 model_info = label_to_model[label]
                 # Create unique key for this model instance
-                instance_key = f"{model_info['model']}:{model_info['instance']}"
+                instance_key = (model_info['model'], model_info['instance'])
                 model_positions[instance_key].append(position)
 
     # Calculate average position for each model instance
     aggregate = []
     for instance_key, positions in model_positions.items():
         if positions:
-            model_id, instance = instance_key.rsplit(':', 1)
+            model_id, instance = instance_key
             avg_rank = sum(positions) / len(positions)
             aggregate.append({
                 "model": model_id,
-                "instance": int(instance),
+                "instance": instance,
                 "average_rank": round(avg_rank, 2),
                 "rankings_count": len(positions)
             })
 
-    # Sort by average rank (lower is better)
-    aggregate.sort(key=lambda x: x['average_rank'])
+    # Sort by average rank (lower is better); a single-model council needs no sort
+    if len(aggregate) > 1:
+        aggregate.sort(key=lambda x: x['average_rank'])
 
     return aggregate
 
@@ -550,6 +862,11 @@ async def generate_conversation_title(user_query: str) -> str:
     Returns:
         A short title (3-5 words)
     """
+    cache_key = hashlib.blake2b(user_query.encode(), digest_size=16).digest()
+    cached_title = _title_cache.get(cache_key)
+    if cached_title is not None:
+        return cached_title
+
     title_prompt = f"""Generate a very short title (3-5 words maximum) that summarizes the following question.
 The title should be concise and descriptive. Do not use quotes or punctuation in the title.
 
@@ -575,6 +892,7 @@ Title:"""
     if len(title) > 50:
         title = title[:47] + "..."
 
+    _title_cache[cache_key] = title
     return title
 
 
@@ -593,19 +911,14 @@ def calculate_aggregate_fact_checks(
         List of dicts with model info, consensus rating, and vote breakdown.
         For duplicate models, each instance is tracked separately.
     """
-    from collections import defaultdict
-
-    # Rating scores for averaging (higher is better)
-    rating_scores = {
-        "ACCURATE": 5,
-        "MOSTLY ACCURATE": 4,
-        "MIXED": 3,
-        "MOSTLY INACCURATE": 2,
-        "INACCURATE": 1
-    }
+    # Nothing to aggregate (e.g. every fact-checking model failed)
+    if not fact_check_results or not label_to_model:
+        return []
 
-    # Track ratings and most_reliable votes for each model instance (keyed by "model:instance")
+    # Track ratings, running score totals and most_reliable votes for each
+    # model instance (keyed by (model, instance))
     model_ratings = defaultdict(list)
+    model_score_sum = defaultdict(int)
     most_reliable_votes = defaultdict(int)
 
     for fact_check in fact_check_results:
@@ -617,39 +930,30 @@ def calculate_aggregate_fact_checks(
         for label, rating in ratings.items():
             if label in label_to_model:
                 model_info = label_to_model[label]
-                instance_key = f"{model_info['model']}:{model_info['instance']}"
+                instance_key = (model_info['model'], model_info['instance'])
                 model_ratings[instance_key].append(rating)
+                model_score_sum[instance_key] += _RATING_SCORES.get(rating, 3)
 
         # Count most_reliable votes
         if most_reliable and most_reliable in label_to_model:
             model_info = label_to_model[most_reliable]
-            instance_key = f"{model_info['model']}:{model_info['instance']}"
+            instance_key = (model_info['model'], model_info['instance'])
             most_reliable_votes[instance_key] += 1
 
     # Calculate aggregate for each model instance
     aggregate = []
     for instance_key, ratings in model_ratings.items():
         if ratings:
-            model_id, instance = instance_key.rsplit(':', 1)
+            model_id, instance = instance_key
             # Calculate average score
-            scores = [rating_scores.get(r, 3) for r in ratings]
-            avg_score = sum(scores) / len(scores)
+            avg_score = model_score_sum[instance_key] / len(ratings)
 
             # Map back to rating label
-            if avg_score >= 4.5:
-                consensus = "ACCURATE"
-            elif avg_score >= 3.5:
-                consensus = "MOSTLY ACCURATE"
-            elif avg_score >= 2.5:
-                consensus = "MIXED"
-            elif avg_score >= 1.5:
-                consensus = "MOSTLY INACCURATE"
-            else:
-                consensus = "INACCURATE"
+            consensus = _CONSENSUS_LABELS[bisect.bisect_right(_CONSENSUS_THRESHOLDS, avg_score)]
 
             aggregate.append({
                 "model": model_id,
-                "instance": int(instance),
+                "instance": instance,
                 "consensus_rating": consensus,
                 "average_score": round(avg_score, 2),
                 "ratings_count": len(ratings),
@@ -657,8 +961,9 @@ def calculate_aggregate_fact_checks(
                 "rating_breakdown": ratings
             })
 
-    # Sort by average score (higher is better)
-    aggregate.sort(key=lambda x: x['average_score'], reverse=True)
+    # Sort by average score (higher is better); a single-model council needs no sort
+    if len(aggregate) > 1:
+        aggregate.sort(key=lambda x: x['average_score'], reverse=True)
 
     return aggregate
 
@@ -667,7 +972,8 @@ async def classify_errors(
     user_query: str,
     fact_check_results: List[Dict[str, Any]],
     label_to_model: Dict[str, Dict[str, Any]],
-    chairman_model: str = None
+    chairman_model: str = None,
+    fact_check_text: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Have the chairman classify inaccuracies found during fact-checking.
@@ -677,29 +983,23 @@ async def classify_errors(
         fact_check_results: Results from Stage 2 (fact-checking)
         label_to_model: Mapping from labels to {"model": model_id, "instance": idx}
         chairman_model: Optional chairman model ID (defaults to CHAIRMAN_MODEL)
+        fact_check_text: Optional prebuilt format_fact_check_text() output
 
     Returns:
         List of classified errors ready for cataloging
     """
-    from .error_catalog import parse_classification_response
-
     chairman = chairman_model if chairman_model else CHAIRMAN_MODEL
 
     # Build fact-check context
-    fact_check_text = "\n\n".join([
-        f"Fact-checker ({result['model']}):\n{result['fact_check']}"
-        for result in fact_check_results
-    ])
-
-    # Build the error types list for the prompt
-    error_types_list = "\n".join([f"- {et}" for et in ERROR_TYPES])
+    if fact_check_text is None:
+        fact_check_text = format_fact_check_text(fact_check_results)
 
-    # Create a simplified label_to_model mapping with just model IDs (no instances)
+    # List the label mapping with just model IDs (no instances)
     # This ensures errors are cataloged against the model itself, not specific instances
-    simple_label_to_model = {
-        label: info['model'] if isinstance(info, dict) else info
+    label_mapping_text = "\n".join(
+        f'  "{label}": "{info["model"] if isinstance(info, dict) else info}"'
         for label, info in label_to_model.items()
-    }
+    )
 
     classification_prompt = f"""You are classifying factual errors found during a fact-checking process.
 
@@ -712,7 +1012,7 @@ Here are the fact-check analyses from multiple reviewers:
 ---
 
 The anonymous response labels map to these models:
-{json.dumps(simple_label_to_model, indent=2)}
+{label_mapping_text}
 
 ---
 
@@ -721,7 +1021,7 @@ Your task:
 2. Identify ALL claims that were flagged as INACCURATE by fact-checkers
 3. For EACH inaccurate claim, classify it into ONE of these error types:
 
-{error_types_list}
+{_ERROR_TYPES_LIST}
 
 IMPORTANT FORMATTING REQUIREMENTS:
 - Summarize the question context in 10 words or fewer
@@ -763,8 +1063,7 @@ Now classify the errors:"""
 
     # Extract question summary
     question_summary = ""
-    import re
-    summary_match = re.search(r'QUESTION SUMMARY:\s*(.+?)(?:\n|$)', response_text)
+    summary_match = _SUMMARY_RE.search(response_text)
     if summary_match:
         question_summary = summary_match.group(1).strip()
     else:
@@ -784,7 +1083,8 @@ Now classify the errors:"""
 async def stage1_collect_responses_streaming(
     user_query: str,
     on_chunk: Callable[[str, int, str], None],
-    council_models: List[str] = None
+    council_models: List[str] = None,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT
 ) -> List[Dict[str, Any]]:
     """
     Stage 1 with streaming: Collect individual responses from all council models.
@@ -794,6 +1094,7 @@ async def stage1_collect_responses_streaming(
         user_query: The user's question
         on_chunk: Async callback (model, instance, chunk_text) -> None
         council_models: Optional list of model IDs to use
+        max_inflight: Maximum number of model requests in flight at once
 
     Returns:
         List of dicts with 'model', 'instance', and 'response' keys.
@@ -802,10 +1103,11 @@ async def stage1_collect_responses_streaming(
     messages = [{"role": "user", "content": user_query}]
 
     # Query all models in parallel with streaming
-    responses = await query_models_parallel_streaming(models, messages, on_chunk)
+    responses = await query_models_parallel_streaming(models, messages, on_chunk, max_inflight=max_inflight)
 
     # Format results
-    stage1_results = []
+    stage1_results = [None] * len(responses)
+    count = 0
     for item in responses:
         response = item.get('response')
         if response is not None:
@@ -819,7 +1121,9 @@ async def stage1_collect_responses_streaming(
             reasoning_details = response.get('reasoning_details')
             if reasoning_details:
                 result['reasoning_details'] = reasoning_details
-            stage1_results.append(result)
+            stage1_results[count] = result
+            count += 1
+    del stage1_results[count:]
 
     return stage1_results
 
@@ -828,7 +1132,8 @@ async def stage2_fact_check_streaming(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
     on_chunk: Callable[[str, int, str], None],
-    council_models: List[str] = None
+    council_models: List[str] = None,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
     """
     Stage 2 with streaming: Each model fact-checks the other models' responses.
@@ -838,77 +1143,47 @@ async def stage2_fact_check_streaming(
         stage1_results: Results from Stage 1
         on_chunk: Async callback (model, instance, chunk_text) -> None
         council_models: Optional list of model IDs to use
+        max_inflight: Maximum number of model requests in flight at once
 
     Returns:
         Tuple of (fact_check list, label_to_model mapping).
     """
     models = council_models if council_models else COUNCIL_MODELS
-    labels = [chr(65 + i) for i in range(len(stage1_results))]
-
-    label_to_model = {
-        f"Response {label}": {
-            "model": result['model'],
-            "instance": result.get('instance', idx)
-        }
-        for idx, (label, result) in enumerate(zip(labels, stage1_results))
-    }
-
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
-        for label, result in zip(labels, stage1_results)
-    ])
-
-    fact_check_prompt = f"""You are a fact-checker evaluating different AI responses to the following question:
-
-Question: {user_query}
-
-Here are the responses from different models (anonymized):
-
-{responses_text}
-
-Your task is to fact-check each response thoroughly:
-
-1. For EACH response, identify:
-   - **Accurate Claims**: List specific claims that are factually correct
-   - **Inaccurate Claims**: List specific claims that are factually incorrect or misleading, and explain why
-   - **Unverifiable Claims**: List claims that cannot be easily verified or are speculative
-   - **Missing Important Information**: Note any crucial information the response failed to include
-
-2. At the very end of your analysis, provide a summary section.
-
-IMPORTANT: Your summary MUST be formatted EXACTLY as follows:
-- Start with the line "FACT CHECK SUMMARY:" (all caps, with colon)
-- For each response, on a new line write: "Response X: [ACCURATE/MOSTLY ACCURATE/MIXED/MOSTLY INACCURATE/INACCURATE]"
-- After rating all responses, add a line: "MOST RELIABLE: Response X" (the single most factually reliable response)
-
-Example of the correct format for your summary:
+    fact_check_prompt, label_to_model = _build_fact_check_prompt(user_query, stage1_results)
 
-FACT CHECK SUMMARY:
-Response A: MOSTLY ACCURATE
-Response B: MIXED
-Response C: ACCURATE
-MOST RELIABLE: Response C
+    messages = [{"role": "user", "content": fact_check_prompt}]
 
-Now provide your detailed fact-check analysis:"""
+    # Track each stream's summary section as it arrives, so parsing at the
+    # end only has to look at the summary rather than the whole fact-check
+    summary_tails: Dict[Tuple[str, int], _SummaryTail] = {}
 
-    messages = [{"role": "user", "content": fact_check_prompt}]
+    async def on_chunk_with_summary(model: str, instance: int, chunk_text: str):
+        tail = summary_tails.get((model, instance))
+        if tail is None:
+            tail = summary_tails[(model, instance)] = _SummaryTail()
+        tail.feed(chunk_text)
+        await on_chunk(model, instance, chunk_text)
 
     # Get fact-checks with streaming
-    responses = await query_models_parallel_streaming(models, messages, on_chunk)
+    responses = await query_models_parallel_streaming(models, messages, on_chunk_with_summary, max_inflight=max_inflight)
 
-    fact_check_results = []
+    fact_check_results = [None] * len(responses)
+    count = 0
     for item in responses:
         response = item.get('response')
         if response is not None:
             full_text = response.get('content', '')
-            parsed = parse_fact_check_from_text(full_text)
-            fact_check_results.append({
+            tail = summary_tails.get((item['model'], item['instance']))
+            parsed = parse_fact_check_from_text(tail.text if tail is not None else full_text)
+            fact_check_results[count] = {
                 "model": item['model'],
                 "instance": item['instance'],
                 "fact_check": full_text,
                 "parsed_summary": parsed,
                 "response_time_ms": response.get('response_time_ms')
-            })
+            }
+            count += 1
+    del fact_check_results[count:]
 
     return fact_check_results, label_to_model
 
@@ -919,7 +1194,8 @@ async def stage3_collect_rankings_streaming(
     fact_check_results: List[Dict[str, Any]],
     label_to_model: Dict[str, str],
     on_chunk: Callable[[str, int, str], None],
-    council_models: List[str] = None
+    council_models: List[str] = None,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT
 ) -> List[Dict[str, Any]]:
     """
     Stage 3 with streaming: Each model ranks the anonymized responses.
@@ -931,81 +1207,32 @@ async def stage3_collect_rankings_streaming(
         label_to_model: Mapping from labels to model names
         on_chunk: Async callback (model, instance, chunk_text) -> None
         council_models: Optional list of model IDs to use
+        max_inflight: Maximum number of model requests in flight at once
 
     Returns:
         List of rankings from each model
     """
     models = council_models if council_models else COUNCIL_MODELS
-    labels = [label.replace("Response ", "") for label in label_to_model.keys()]
-    labels.sort()
-
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
-        for label, result in zip(labels, stage1_results)
-    ])
-
-    fact_check_summary = "\n\n".join([
-        f"Fact-checker {i+1}:\n{result['fact_check']}"
-        for i, result in enumerate(fact_check_results)
-    ])
-
-    ranking_prompt = f"""You are evaluating different responses to the following question:
-
-Question: {user_query}
-
-Here are the responses from different models (anonymized):
-
-{responses_text}
-
----
-
-Here are the fact-check analyses from peer reviewers:
-
-{fact_check_summary}
-
----
-
-Your task:
-1. Consider both the quality of each response AND the fact-check findings.
-2. Evaluate each response individually, taking into account:
-   - Factual accuracy (as revealed by the fact-checks)
-   - Completeness and helpfulness
-   - Clarity and reasoning
-3. Then, at the very end of your response, provide a final ranking.
-
-IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
-- Start with the line "FINAL RANKING:" (all caps, with colon)
-- Then list the responses from best to worst as a numbered list
-- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
-- Do not add any other text or explanations in the ranking section
-
-Example of the correct format:
-
-FINAL RANKING:
-1. Response C
-2. Response A
-3. Response B
-
-Now provide your evaluation and ranking:"""
-
-    messages = [{"role": "user", "content": ranking_prompt}]
+    messages = _build_ranking_messages(user_query, stage1_results, fact_check_results)
 
     # Get rankings with streaming
-    responses = await query_models_parallel_streaming(models, messages, on_chunk)
+    responses = await query_models_parallel_streaming(models, messages, on_chunk, max_inflight=max_inflight)
 
-    stage3_results = []
+    stage3_results = [None] * len(responses)
+    count = 0
     for item in responses:
         response = item.get('response')
         if response is not None:
-            full_text = response.get('content', '')
-            parsed = parse_ranking_from_text(full_text)
-            stage3_results.append({
+            full_text, parsed = _parse_ranking_response(response.get('content', ''))
+            stage3_results[count] = {
                 "model": item['model'],
                 "instance": item['instance'],
                 "ranking": full_text,
                 "parsed_ranking": parsed,
                 "response_time_ms": response.get('response_time_ms')
-            })
+            }
+            count += 1
+    del stage3_results[count:]
 
     return stage3_results
 
@@ -1017,7 +1244,8 @@ async def stage4_synthesize_final_streaming(
     stage3_results: List[Dict[str, Any]],
     label_to_model: Dict[str, str],
     on_chunk: Callable[[str, int, str], None],
-    chairman_model: str = None
+    chairman_model: str = None,
+    fact_check_text: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Stage 4 with streaming: Chairman synthesizes final response with fact-check validation.
@@ -1030,6 +1258,8 @@ async def stage4_synthesize_final_streaming(
         label_to_model: Mapping from labels to model names
         on_chunk: Async callback (model, instance, chunk_text) -> None
         chairman_model: Optional chairman model ID (defaults to CHAIRMAN_MODEL)
+        fact_check_text: Optional prebuilt format_fact_check_text() output,
+            so callers that also classify errors only build it once
 
     Returns:
         Dict with 'model', 'response', and 'response_time_ms' keys
@@ -1037,113 +1267,9 @@ async def stage4_synthesize_final_streaming(
     chairman = chairman_model if chairman_model else CHAIRMAN_MODEL
 
     # Build comprehensive context for chairman
-    stage1_text = "\n\n".join([
-        f"Model: {result['model']}\nResponse: {result['response']}"
-        for result in stage1_results
-    ])
-
-    stage3_text = "\n\n".join([
-        f"Model: {result['model']}\nRanking: {result['ranking']}"
-        for result in stage3_results
-    ])
-
-    if fact_check_results:
-        # With fact-checking
-        fact_check_text = "\n\n".join([
-            f"Fact-checker ({result['model']}):\n{result['fact_check']}"
-            for result in fact_check_results
-        ])
-
-        chairman_prompt = f"""You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question. Then each model fact-checked each other's responses. Finally, each model ranked the responses taking the fact-checks into account.
-
-Original Question: {user_query}
-
-=== STAGE 1 - Individual Responses ===
-{stage1_text}
-
-=== STAGE 2 - Fact-Check Analyses ===
-{fact_check_text}
-
-=== STAGE 3 - Peer Rankings (Informed by Fact-Checks) ===
-{stage3_text}"""
-    else:
-        # Without fact-checking
-        chairman_prompt = f"""You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question. Each model has then evaluated and ranked all the responses.
-
-Original Question: {user_query}
-
-=== STAGE 1 - Individual Responses ===
-{stage1_text}
-
-=== STAGE 2 - Peer Rankings ===
-{stage3_text}"""
-
-    # Add task description based on whether fact-checking was done
-    if fact_check_results:
-        chairman_prompt += """
-
----
-
-Your task as Chairman is comprehensive. You must:
-
-1. **FACT-CHECK SYNTHESIS**: First, analyze all the fact-check reports. Identify:
-   - Claims that multiple fact-checkers agreed were ACCURATE
-   - Claims that multiple fact-checkers agreed were INACCURATE (these are confirmed errors)
-   - Claims where fact-checkers DISAGREED (these need your judgment)
-   - Any factual errors that were missed by some fact-checkers
-
-2. **FACT-CHECK VALIDATION**: Review the fact-checkers themselves. Did any fact-checker make errors in their fact-checking? Note any corrections needed.
-
-3. **FINAL ANSWER**: Synthesize all of this into a single, comprehensive, FACTUALLY ACCURATE answer to the user's question. Your answer should:
-   - Incorporate the best insights from all responses
-   - EXCLUDE or CORRECT any claims that were identified as inaccurate
-   - Note any areas of genuine uncertainty where fact-checkers disagreed
-   - Be clear about what is well-established fact vs. what is opinion or speculation
-
-Structure your response as follows:
-
-## Fact-Check Synthesis
-[Your analysis of the fact-checking results - what was confirmed accurate, what was confirmed inaccurate, and any disagreements]
-
-## Fact-Checker Validation
-[Any corrections to the fact-checkers themselves, or confirmation that their analyses were sound]
-
-## Final Council Answer
-[Your comprehensive, fact-checked answer to the user's question]
-
-Now provide your Chairman synthesis:"""
-    else:
-        # Without fact-checking, simpler synthesis
-        chairman_prompt += """
-
----
-
-Your task as Chairman is to synthesize the council's responses and rankings. You must:
-
-1. **RANKING ANALYSIS**: Review the peer rankings provided by each model. Identify:
-   - Which responses were consistently ranked highly
-   - Any significant disagreements in the rankings
-   - The reasoning behind the evaluations
-
-2. **SYNTHESIS**: Create a comprehensive answer that:
-   - Incorporates the best insights from all responses
-   - Prioritizes information from higher-ranked responses
-   - Combines complementary perspectives
-   - Resolves any contradictions based on your judgment
-
-3. **FINAL ANSWER**: Provide a clear, comprehensive answer to the user's question.
-
-Structure your response as follows:
-
-## Ranking Analysis
-[Your analysis of the peer rankings and which responses were considered strongest]
-
-## Final Council Answer
-[Your comprehensive, synthesized answer to the user's question]
-
-Now provide your Chairman synthesis:"""
-
-    messages = [{"role": "user", "content": chairman_prompt}]
+    messages = _build_chairman_messages(
+        user_query, stage1_results, fact_check_results, stage3_results, fact_check_text
+    )
 
     # Query the chairman model with streaming (instance 0 since single model)
     response = await query_model_streaming(chairman, messages, 0, on_chunk)
@@ -1162,11 +1288,111 @@ Now provide your Chairman synthesis:"""
     }
 
 
+async def _stage3_with_chairman_draft(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    fact_check_results: List[Dict[str, Any]],
+    label_to_model: Dict[str, Dict[str, Any]],
+    council_models: List[str] = None,
+    chairman_model: str = None,
+    fact_check_text: Optional[str] = None,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Awaitable[Dict[str, Any]]]:
+    """
+    Stage 3, speculatively starting the Stage 4 chairman on a majority of rankings.
+
+    Once at least half of the rankers have returned, the chairman starts a
+    draft from those rankings while the slower rankers finish. If the
+    complete aggregate ranking order matches the one the draft was based
+    on, the draft is kept; otherwise it is cancelled and the chairman is
+    rerun on the complete rankings.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Results from Stage 1
+        fact_check_results: Results from Stage 2 (may be empty)
+        label_to_model: Mapping from labels to {"model": model_id, "instance": idx}
+        council_models: Optional list of model IDs to use (defaults to COUNCIL_MODELS)
+        chairman_model: Optional chairman model ID (defaults to CHAIRMAN_MODEL)
+        fact_check_text: Optional prebuilt format_fact_check_text() output
+        max_inflight: Maximum number of model requests in flight at once
+
+    Returns:
+        Tuple of (stage3_results, aggregate_rankings, awaitable Stage 4 result)
+    """
+    models = council_models if council_models else COUNCIL_MODELS
+    messages = _build_ranking_messages(user_query, stage1_results, fact_check_results)
+
+    # Rankings are slotted by instance so they stay in council order
+    quorum = (len(models) + 1) // 2
+    slots = [None] * len(models)
+    completed = 0
+    draft_task = None
+    draft_order = None
+
+    try:
+        async for item in query_models_parallel_as_completed(
+            models, messages, max_inflight=max_inflight,
+            response_format=_ranking_response_format(len(stage1_results))
+        ):
+            completed += 1
+            response = item.get('response')
+            if response is not None:
+                full_text, parsed = _parse_ranking_response(response.get('content', ''))
+                slots[item['instance']] = {
+                    "model": item['model'],
+                    "instance": item['instance'],
+                    "ranking": full_text,
+                    "parsed_ranking": parsed,
+                    "response_time_ms": response.get('response_time_ms')
+                }
+
+            # Start the chairman draft once a majority of rankers are done
+            # (unless everyone is, in which case there is nothing to hide)
+            if draft_task is None and quorum <= completed < len(models):
+                partial_results = [result for result in slots if result is not None]
+                if partial_results:
+                    draft_order = _ranking_order(
+                        calculate_aggregate_rankings(partial_results, label_to_model)
+                    )
+                    draft_task = asyncio.create_task(stage4_synthesize_final(
+                        user_query, stage1_results, fact_check_results, partial_results,
+                        label_to_model, chairman_model, fact_check_text=fact_check_text
+                    ))
+    except BaseException:
+        if draft_task is not None:
+            draft_task.cancel()
+        raise
+
+    stage3_results = [result for result in slots if result is not None]
+    aggregate_rankings = calculate_aggregate_rankings(stage3_results, label_to_model)
+
+    if draft_task is not None and _ranking_order(aggregate_rankings) == draft_order:
+        return stage3_results, aggregate_rankings, draft_task
+
+    # The late rankings changed the outcome; synthesize from all of them
+    if draft_task is not None:
+        draft_task.cancel()
+    stage4 = stage4_synthesize_final(
+        user_query, stage1_results, fact_check_results, stage3_results,
+        label_to_model, chairman_model, fact_check_text=fact_check_text
+    )
+    return stage3_results, aggregate_rankings, stage4
+
+
+def _ranking_order(aggregate_rankings: List[Dict[str, Any]]) -> List[Tuple[str, int]]:
+    """Model instances of an aggregate ranking, best first."""
+    return [(entry['model'], entry['instance']) for entry in aggregate_rankings]
+
+
 async def run_full_council(
     user_query: str,
     council_models: List[str] = None,
     chairman_model: str = None,
-    fact_checking_enabled: bool = True
+    fact_checking_enabled: bool = True,
+    error_classification_enabled: bool = False,
+    speculative_chairman: bool = False,
+    on_stage_complete: Optional[Callable[[str, Any], None]] = None
 ) -> Tuple[List, List, List, Dict, Dict]:
     """
     Run the complete 4-stage council process.
@@ -1175,56 +1401,94 @@ async def run_full_council(
         user_query: The user's question
         council_models: Optional list of model IDs for the council (defaults to COUNCIL_MODELS)
         chairman_model: Optional chairman model ID (defaults to CHAIRMAN_MODEL)
+        fact_checking_enabled: Whether to run the Stage 2 fact-check
+        error_classification_enabled: Whether to classify fact-check errors alongside
+            Stage 4 (only applies when fact-checking is enabled)
+        speculative_chairman: Whether to start Stage 4 once a majority of Stage 3
+            rankings are in (see _stage3_with_chairman_draft)
+        on_stage_complete: Optional callback (stage, results) -> None, called as
+            each of "stage1", "fact_check", "stage3" and "stage4" finishes so
+            results can be persisted incrementally
 
     Returns:
-        Tuple of (stage1_results, fact_check_results, stage3_results, stage4_result, metadata)
+        Tuple of (stage1_results, fact_check_results, stage3_results, stage4_result, metadata).
+        When errors were classified, metadata includes 'classified_errors'.
     """
+    def stage_complete(stage: str, results: Any):
+        if on_stage_complete is not None:
+            on_stage_complete(stage, results)
+
     # Stage 1: Collect individual responses
     stage1_results = await stage1_collect_responses(user_query, council_models)
+    stage_complete("stage1", stage1_results)
 
     # If no models responded successfully, return error
     if not stage1_results:
-        return [], [], [], {
+        stage4_result = {
             "model": "error",
             "response": "All models failed to respond. Please try again."
-        }, {}
+        }
+        stage_complete("fact_check", [])
+        stage_complete("stage3", [])
+        stage_complete("stage4", stage4_result)
+        return [], [], [], stage4_result, {}
 
     # Stage 2: Fact-check each other's responses (optional)
     if fact_checking_enabled:
         fact_check_results, label_to_model = await stage2_fact_check(user_query, stage1_results, council_models)
-        # Calculate aggregate fact-check ratings
-        aggregate_fact_checks = calculate_aggregate_fact_checks(fact_check_results, label_to_model)
     else:
         # Skip fact-checking stage
         fact_check_results = []
         # Create simple label mapping without fact-checking
-        labels = [chr(65 + i) for i in range(len(stage1_results))]  # A, B, C, ...
-        label_to_model = {
-            f"Response {label}": {
-                "model": result['model'],
-                "instance": result.get('instance', idx)
-            }
-            for idx, (label, result) in enumerate(zip(labels, stage1_results))
-        }
-        aggregate_fact_checks = []
-
-    # Stage 3: Collect rankings (informed by fact-checks if enabled)
-    stage3_results = await stage3_collect_rankings(
-        user_query, stage1_results, fact_check_results, label_to_model, council_models
+        label_to_model = build_label_to_model(stage1_results)
+    stage_complete("fact_check", fact_check_results)
+
+    # Fact-check context shared by the chairman synthesis and error classification
+    fact_check_text = format_fact_check_text(fact_check_results) if fact_check_results else None
+
+    # Stage 3: Collect rankings (informed by fact-checks if enabled). It runs
+    # as a task, so the aggregates are computed while the rankers work
+    if speculative_chairman:
+        # Stage 4 is drafted as soon as a majority of rankings are in
+        stage3_task = asyncio.create_task(_stage3_with_chairman_draft(
+            user_query, stage1_results, fact_check_results, label_to_model,
+            council_models, chairman_model, fact_check_text=fact_check_text
+        ))
+    else:
+        stage3_task = asyncio.create_task(stage3_collect_rankings(
+            user_query, stage1_results, fact_check_results, label_to_model, council_models
+        ))
+    # Let the task send its requests before doing pure-Python work
+    await asyncio.sleep(0)
+
+    # Calculate aggregate fact-check ratings
+    aggregate_fact_checks = (
+        calculate_aggregate_fact_checks(fact_check_results, label_to_model)
+        if fact_checking_enabled else []
     )
 
-    # Calculate aggregate rankings
-    aggregate_rankings = calculate_aggregate_rankings(stage3_results, label_to_model)
+    if speculative_chairman:
+        stage3_results, aggregate_rankings, stage4_coro = await stage3_task
+        stage4_task = asyncio.ensure_future(stage4_coro)
+    else:
+        stage3_results = await stage3_task
 
-    # Stage 4: Synthesize final answer with fact-check validation
-    stage4_result = await stage4_synthesize_final(
-        user_query,
-        stage1_results,
-        fact_check_results,
-        stage3_results,
-        label_to_model,
-        chairman_model
-    )
+        # Stage 4: Synthesize final answer with fact-check validation
+        stage4_task = asyncio.create_task(stage4_synthesize_final(
+            user_query,
+            stage1_results,
+            fact_check_results,
+            stage3_results,
+            label_to_model,
+            chairman_model,
+            fact_check_text=fact_check_text
+        ))
+        await asyncio.sleep(0)
+
+        # Calculate aggregate rankings while the chairman works
+        aggregate_rankings = calculate_aggregate_rankings(stage3_results, label_to_model)
+
+    stage_complete("stage3", stage3_results)
 
     # Prepare metadata
     metadata = {
@@ -1234,4 +1498,19 @@ async def run_full_council(
         "fact_checking_enabled": fact_checking_enabled
     }
 
+    if error_classification_enabled and fact_checking_enabled:
+        # Error classification only needs the Stage 2 output, so run it
+        # concurrently with the chairman synthesis
+        stage4_result, classified_errors = await asyncio.gather(
+            stage4_task,
+            classify_errors(
+                user_query, fact_check_results, label_to_model, chairman_model,
+                fact_check_text=fact_check_text
+            )
+        )
+        metadata["classified_errors"] = classified_errors
+    else:
+        stage4_result = await stage4_task
+    stage_complete("stage4", stage4_result)
+
     return stage1_results, fact_check_results, stage3_results, stage4_result, metadata
@@ -1,10 +1,14 @@
 """SQLite database module for conversation storage with user associations."""
 
 import sqlite3
-import json
+import orjson
 import os
+import time
+import zlib
+import threading
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 
 from .config import DATABASE_PATH
@@ -18,83 +22,222 @@ def get_db_path() -> str:
     return DATABASE_PATH
 
 
-@contextmanager
-def get_db_connection():
-    """Context manager for database connections."""
+# Whether init_database() has already created the schema in this process
+_initialized = False
+_init_lock = threading.Lock()
+
+# Schema version recorded in PRAGMA user_version once init_database() has
+# created/migrated the schema; bump it whenever the schema setup changes
+_SCHEMA_VERSION = 2
+
+# Each thread keeps one open connection and reuses it for every operation
+_local = threading.local()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open and configure a new database connection."""
     conn = sqlite3.connect(get_db_path())
     conn.row_factory = sqlite3.Row
+    # WAL (set in init_database) only needs a full sync at checkpoints, and
+    # temporary tables/indices for sorting are kept in memory
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    # Page cache of up to 64 MiB per connection (negative values are KiB)
+    conn.execute("PRAGMA cache_size = -65536")
+    # Enforce the messages -> conversations foreign key
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+# Stage columns holding full model outputs; these are stored zlib-compressed
+# (as BLOBs), while stage4 stays plain JSON text so json_extract() can read it
+_COMPRESSED_STAGES = frozenset({"stage1", "fact_check", "stage3"})
+
+
+def _encode_stage(stage: str, payload: Any):
+    """Serialize a stage payload for its messages column."""
+    data = orjson.dumps(payload)
+    if stage in _COMPRESSED_STAGES:
+        return zlib.compress(data)
+    return data.decode()
+
+
+def _decode_stage(value: Any) -> Any:
+    """Deserialize a messages stage column (compressed BLOB or JSON text)."""
+    if not value:
+        return None
+    if isinstance(value, bytes):
+        value = zlib.decompress(value)
+    return orjson.loads(value)
+
+
+@contextmanager
+def get_db_connection():
+    """
+    Context manager for database connections.
+
+    Yields this thread's connection, opening it on first use (and creating
+    the schema first if that hasn't happened yet). Each context is its own
+    transaction: committed on success, rolled back on error.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        init_database()
+        conn = _local.conn = _connect()
     try:
         yield conn
         conn.commit()
     except Exception:
         conn.rollback()
         raise
-    finally:
+
+
+def close_db_connection():
+    """Close the current thread's database connection, if one is open."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        _local.conn = None
         conn.close()
 
 
 def init_database():
-    """Initialize the database schema if it doesn't exist."""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Create conversations table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS conversations (
-                id TEXT PRIMARY KEY,
-                user_id TEXT NOT NULL,
-                title TEXT NOT NULL DEFAULT 'New Conversation',
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        
-        # Create messages table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS messages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                conversation_id TEXT NOT NULL,
-                role TEXT NOT NULL,
-                content TEXT,
-                stage1 TEXT,
-                fact_check TEXT,
-                stage3 TEXT,
-                stage4 TEXT,
-                timestamp TEXT NOT NULL,
-                FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Create indexes for efficient queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_conversations_user_id 
-            ON conversations(user_id)
-        """)
+    """
+    Initialize the database schema if it doesn't exist (once per process).
+    
+    Called at application startup; connections also call it on first use,
+    so importing this module never touches the database file.
+    """
+    global _initialized
+    if _initialized:
+        return
+    
+    with _init_lock:
+        if _initialized:
+            return
+        conn = _connect()
+        try:
+            _create_schema(conn)
+        finally:
+            conn.close()
+        _initialized = True
+
+
+def _create_schema(conn: sqlite3.Connection):
+    """Create and migrate the schema, unless this database is already up to date."""
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] >= _SCHEMA_VERSION:
+        return
+    
+    # Write-ahead logging lets readers proceed while a write is in progress;
+    # the journal mode is persistent, so it only needs setting once
+    cursor.execute("PRAGMA journal_mode = WAL")
+    
+    # Create conversations table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS conversations (
+            id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            title TEXT NOT NULL DEFAULT 'New Conversation',
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            message_count INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    
+    # Migrate databases created before conversations tracked message_count
+    cursor.execute("PRAGMA table_info(conversations)")
+    if "message_count" not in {column["name"] for column in cursor.fetchall()}:
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_messages_conversation_id 
-            ON messages(conversation_id)
+            ALTER TABLE conversations
+            ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0
         """)
-        
-        # Create model_configurations table
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS model_configurations (
-                id TEXT PRIMARY KEY,
-                user_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                council_models TEXT NOT NULL,
-                chairman_model TEXT NOT NULL,
-                is_default INTEGER NOT NULL DEFAULT 0,
-                created_at TEXT NOT NULL
+            UPDATE conversations
+            SET message_count = (
+                SELECT COUNT(*) FROM messages m WHERE m.conversation_id = conversations.id
             )
         """)
-        
-        # Create index for model configurations
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_model_configurations_user_id 
-            ON model_configurations(user_id)
-        """)
-        
-        conn.commit()
+    
+    # Create messages table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            conversation_id TEXT NOT NULL,
+            role TEXT NOT NULL,
+            content TEXT,
+            stage1 TEXT,
+            fact_check TEXT,
+            stage3 TEXT,
+            stage4 TEXT,
+            timestamp TEXT NOT NULL,
+            FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
+        )
+    """)
+    
+    # Create indexes for efficient queries. A user's conversation list is
+    # read straight from this index, already in (updated_at, id) order,
+    # without touching the table (it supersedes the old user_id-only index
+    # and the earlier index without the id tie-breaker order).
+    cursor.execute("DROP INDEX IF EXISTS idx_conversations_user_id")
+    cursor.execute("DROP INDEX IF EXISTS idx_conversations_user_updated")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_conversations_user_updated_id
+        ON conversations(user_id, updated_at DESC, id DESC, title, created_at, message_count)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_messages_conversation_id 
+        ON messages(conversation_id)
+    """)
+    
+    # Create model_configurations table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS model_configurations (
+            id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            council_models TEXT NOT NULL,
+            chairman_model TEXT NOT NULL,
+            is_default INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL
+        )
+    """)
+    
+    # Create index for model configurations
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_model_configurations_user_id 
+        ON model_configurations(user_id)
+    """)
+    
+    # Cached responses are disposable, so a cache table from before
+    # created_at_ms was introduced is simply recreated
+    cursor.execute("PRAGMA table_info(response_cache)")
+    cache_columns = {column["name"] for column in cursor.fetchall()}
+    if cache_columns and "created_at_ms" not in cache_columns:
+        cursor.execute("DROP TABLE response_cache")
+    
+    # Create response_cache table (model responses keyed by request digest).
+    # Entries are only compared by age, never returned to clients, so the
+    # creation time is stored as compact epoch milliseconds
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS response_cache (
+            key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            content TEXT NOT NULL,
+            reasoning_details TEXT,
+            response_time_ms INTEGER,
+            created_at_ms INTEGER NOT NULL
+        )
+    """)
+    
+    # Create index for expiring cached responses
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_response_cache_created_at_ms 
+        ON response_cache(created_at_ms)
+    """)
+    
+    cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    conn.commit()
 
 
 def create_conversation(conversation_id: str, user_id: str) -> Dict[str, Any]:
@@ -127,6 +270,11 @@ def create_conversation(conversation_id: str, user_id: str) -> Dict[str, Any]:
     }
 
 
+# Assistant message columns that hold per-stage JSON payloads, in stage order
+_STAGE_ORDER = ("stage1", "fact_check", "stage3", "stage4")
+_STAGE_COLUMNS = frozenset(_STAGE_ORDER)
+
+
 def get_conversation(conversation_id: str, user_id: str = None) -> Optional[Dict[str, Any]]:
     """
     Load a conversation from the database.
@@ -138,24 +286,35 @@ def get_conversation(conversation_id: str, user_id: str = None) -> Optional[Dict
     Returns:
         Conversation dict or None if not found (or not owned by user)
     """
+    # Fetch the conversation and its messages in one query; a conversation
+    # without messages yields a single row with NULL message columns
+    query = """
+        SELECT c.id, c.user_id, c.title, c.created_at, c.updated_at,
+               m.role, m.content, m.stage1, m.fact_check, m.stage3, m.stage4, m.timestamp
+        FROM conversations c
+        LEFT JOIN messages m ON m.conversation_id = c.id
+        WHERE c.id = ?{owner_filter}
+        ORDER BY m.id ASC
+    """
+    
     with get_db_connection() as conn:
         cursor = conn.cursor()
         
         if user_id:
-            cursor.execute("""
-                SELECT id, user_id, title, created_at, updated_at
-                FROM conversations
-                WHERE id = ? AND user_id = ?
-            """, (conversation_id, user_id))
+            cursor.execute(
+                query.format(owner_filter=" AND c.user_id = ?"),
+                (conversation_id, user_id)
+            )
         else:
-            cursor.execute("""
-                SELECT id, user_id, title, created_at, updated_at
-                FROM conversations
-                WHERE id = ?
-            """, (conversation_id,))
+            cursor.execute(
+                query.format(owner_filter=""),
+                (conversation_id,)
+            )
         
+        # Rows are consumed straight from the cursor rather than materialized
+        # with fetchall(), so a long conversation is never held twice
         row = cursor.fetchone()
-        if not row:
+        if row is None:
             return None
         
         conversation = {
@@ -167,15 +326,10 @@ def get_conversation(conversation_id: str, user_id: str = None) -> Optional[Dict
             "messages": []
         }
         
-        # Load messages
-        cursor.execute("""
-            SELECT role, content, stage1, fact_check, stage3, stage4, timestamp
-            FROM messages
-            WHERE conversation_id = ?
-            ORDER BY id ASC
-        """, (conversation_id,))
-        
-        for msg_row in cursor.fetchall():
+        for msg_row in chain((row,), cursor):
+            if msg_row["role"] is None:
+                # Conversation has no messages
+                continue
             if msg_row["role"] == "user":
                 conversation["messages"].append({
                     "role": "user",
@@ -183,18 +337,63 @@ def get_conversation(conversation_id: str, user_id: str = None) -> Optional[Dict
                     "timestamp": msg_row["timestamp"]
                 })
             else:
-                conversation["messages"].append({
-                    "role": "assistant",
-                    "stage1": json.loads(msg_row["stage1"]) if msg_row["stage1"] else None,
-                    "fact_check": json.loads(msg_row["fact_check"]) if msg_row["fact_check"] else None,
-                    "stage3": json.loads(msg_row["stage3"]) if msg_row["stage3"] else None,
-                    "stage4": json.loads(msg_row["stage4"]) if msg_row["stage4"] else None,
-                    "timestamp": msg_row["timestamp"]
-                })
+                message = {"role": "assistant"}
+                for stage in _STAGE_ORDER:
+                    message[stage] = _decode_stage(msg_row[stage])
+                message["timestamp"] = msg_row["timestamp"]
+                conversation["messages"].append(message)
         
         return conversation
 
 
+def get_conversation_summary(conversation_id: str, user_id: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Load a conversation's metadata without its messages.
+    
+    Stage payloads are never decoded; the latest chairman model is read
+    directly from the stored Stage 4 JSON.
+    
+    Args:
+        conversation_id: Unique identifier for the conversation
+        user_id: Optional user ID to verify ownership
+    
+    Returns:
+        Metadata dict (including 'message_count' and 'chairman_model') or None
+        if not found (or not owned by user)
+    """
+    query = """
+        SELECT c.id, c.user_id, c.title, c.created_at, c.updated_at,
+               c.message_count,
+               (SELECT json_extract(m.stage4, '$.model') FROM messages m
+                WHERE m.conversation_id = c.id AND m.role = 'assistant'
+                ORDER BY m.id DESC LIMIT 1) AS chairman_model
+        FROM conversations c
+        WHERE c.id = ?{owner_filter}
+    """
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        
+        if user_id:
+            cursor.execute(query.format(owner_filter=" AND c.user_id = ?"), (conversation_id, user_id))
+        else:
+            cursor.execute(query.format(owner_filter=""), (conversation_id,))
+        
+        row = cursor.fetchone()
+        if not row:
+            return None
+        
+        return {
+            "id": row["id"],
+            "user_id": row["user_id"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "title": row["title"],
+            "message_count": row["message_count"],
+            "chairman_model": row["chairman_model"]
+        }
+
+
 def save_conversation(conversation: Dict[str, Any]):
     """
     Save a conversation to the database.
@@ -214,27 +413,48 @@ def save_conversation(conversation: Dict[str, Any]):
         """, (conversation.get("title", "New Conversation"), now, conversation["id"]))
 
 
-def list_conversations(user_id: str) -> List[Dict[str, Any]]:
+def list_conversations(
+    user_id: str,
+    limit: Optional[int] = None,
+    before: Optional[Tuple[str, str]] = None
+) -> List[Dict[str, Any]]:
     """
-    List all conversations for a specific user (metadata only).
+    List conversations for a specific user (metadata only), most recently
+    updated first (ties broken by descending id).
     
     Args:
         user_id: User's identifier
+        limit: Optional maximum number of conversations to return
+        before: Optional (updated_at, id) of the last conversation on the
+            previous page; only conversations after it in this order are returned
     
     Returns:
         List of conversation metadata dicts
     """
+    # Keyset pagination: each page starts where the previous one ended in
+    # the (user_id, updated_at, id) index, rather than skipping rows with
+    # OFFSET. The id tie-breaker keeps conversations updated at the same
+    # instant from being skipped or repeated across pages.
+    query = """
+        SELECT id, title, created_at, updated_at, message_count
+        FROM conversations
+        WHERE user_id = ?{before_filter}
+        ORDER BY updated_at DESC, id DESC
+        LIMIT ?
+    """
+    # SQLite treats a negative LIMIT as no limit
+    row_limit = -1 if limit is None else limit
+    
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT c.id, c.title, c.created_at, c.updated_at,
-                   COUNT(m.id) as message_count
-            FROM conversations c
-            LEFT JOIN messages m ON c.id = m.conversation_id
-            WHERE c.user_id = ?
-            GROUP BY c.id
-            ORDER BY c.updated_at DESC
-        """, (user_id,))
+        
+        if before is not None:
+            cursor.execute(
+                query.format(before_filter=" AND (updated_at, id) < (?, ?)"),
+                (user_id, *before, row_limit)
+            )
+        else:
+            cursor.execute(query.format(before_filter=""), (user_id, row_limit))
         
         conversations = []
         for row in cursor.fetchall():
@@ -272,16 +492,13 @@ def search_conversations(user_id: str, search_query: str) -> List[Dict[str, Any]
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
-            SELECT DISTINCT c.id, c.title, c.created_at, c.updated_at,
-                   COUNT(m.id) as message_count
+            SELECT c.id, c.title, c.created_at, c.updated_at, c.message_count
             FROM conversations c
-            LEFT JOIN messages m ON c.id = m.conversation_id
             WHERE c.user_id = ?
               AND (c.title LIKE ? ESCAPE '\\' OR 
-                   EXISTS (SELECT 1 FROM messages m2 
-                          WHERE m2.conversation_id = c.id 
-                            AND m2.content LIKE ? ESCAPE '\\'))
-            GROUP BY c.id
+                   EXISTS (SELECT 1 FROM messages m 
+                          WHERE m.conversation_id = c.id 
+                            AND m.content LIKE ? ESCAPE '\\'))
             ORDER BY c.updated_at DESC
         """, (user_id, search_term, search_term))
         
@@ -298,6 +515,46 @@ def search_conversations(user_id: str, search_query: str) -> List[Dict[str, Any]
         return conversations
 
 
+def _touch_conversation(cursor: sqlite3.Cursor, conversation_id: str, user_id: Optional[str], now: str):
+    """
+    Bump a conversation's updated_at and message count for a new message.
+    
+    The update doubles as the existence (and ownership) check, so adding a
+    message needs no separate lookup.
+    
+    Raises:
+        ValueError: If the conversation doesn't exist (or isn't owned by user_id)
+    """
+    if user_id:
+        cursor.execute("""
+            UPDATE conversations
+            SET updated_at = ?, message_count = message_count + 1
+            WHERE id = ? AND user_id = ?
+        """, (now, conversation_id, user_id))
+    else:
+        cursor.execute("""
+            UPDATE conversations
+            SET updated_at = ?, message_count = message_count + 1
+            WHERE id = ?
+        """, (now, conversation_id))
+    if cursor.rowcount == 0:
+        raise ValueError(f"Conversation {conversation_id} not found")
+
+
+def _insert_message(cursor: sqlite3.Cursor, conversation_id: str, sql: str, params: tuple) -> int:
+    """
+    Insert a message row, reporting a foreign key violation as a missing conversation.
+    
+    Returns:
+        ID of the new message
+    """
+    try:
+        cursor.execute(sql, params)
+    except sqlite3.IntegrityError:
+        raise ValueError(f"Conversation {conversation_id} not found")
+    return cursor.lastrowid
+
+
 def add_user_message(conversation_id: str, content: str, user_id: str = None):
     """
     Add a user message to a conversation.
@@ -307,70 +564,61 @@ def add_user_message(conversation_id: str, content: str, user_id: str = None):
         content: User message content
         user_id: Optional user ID to verify ownership
     """
-    # Verify conversation exists (and optionally belongs to user)
-    conversation = get_conversation(conversation_id, user_id)
-    if conversation is None:
-        raise ValueError(f"Conversation {conversation_id} not found")
-    
     now = datetime.utcnow().isoformat()
     
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
+        _touch_conversation(cursor, conversation_id, user_id, now)
+        _insert_message(cursor, conversation_id, """
             INSERT INTO messages (conversation_id, role, content, timestamp)
             VALUES (?, 'user', ?, ?)
         """, (conversation_id, content, now))
-        
-        # Update conversation's updated_at timestamp
-        cursor.execute("""
-            UPDATE conversations SET updated_at = ? WHERE id = ?
-        """, (now, conversation_id))
 
 
-def add_assistant_message(
-    conversation_id: str,
-    stage1: List[Dict[str, Any]],
-    fact_check: List[Dict[str, Any]],
-    stage3: List[Dict[str, Any]],
-    stage4: Dict[str, Any],
-    user_id: str = None
-):
+def create_assistant_message(conversation_id: str, user_id: str = None) -> int:
     """
-    Add an assistant message with all 4 stages to a conversation.
+    Add an assistant message whose stages are filled in as they complete.
     
     Args:
         conversation_id: Conversation identifier
-        stage1: List of individual model responses
-        fact_check: List of fact-check analyses from each model
-        stage3: List of model rankings (informed by fact-checks)
-        stage4: Final synthesized response with fact-check validation
         user_id: Optional user ID to verify ownership
-    """
-    # Verify conversation exists (and optionally belongs to user)
-    conversation = get_conversation(conversation_id, user_id)
-    if conversation is None:
-        raise ValueError(f"Conversation {conversation_id} not found")
     
+    Returns:
+        ID of the new message, for update_assistant_message_stage()
+    """
     now = datetime.utcnow().isoformat()
     
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO messages (conversation_id, role, stage1, fact_check, stage3, stage4, timestamp)
-            VALUES (?, 'assistant', ?, ?, ?, ?, ?)
-        """, (
-            conversation_id,
-            json.dumps(stage1),
-            json.dumps(fact_check),
-            json.dumps(stage3),
-            json.dumps(stage4),
-            now
-        ))
+        _touch_conversation(cursor, conversation_id, user_id, now)
+        message_id = _insert_message(cursor, conversation_id, """
+            INSERT INTO messages (conversation_id, role, timestamp)
+            VALUES (?, 'assistant', ?)
+        """, (conversation_id, now))
+    
+    return message_id
+
+
+def update_assistant_message_stage(message_id: int, stage: str, payload: Any):
+    """
+    Store one stage's results on an assistant message.
+    
+    Args:
+        message_id: ID returned by create_assistant_message()
+        stage: One of "stage1", "fact_check", "stage3", "stage4"
+        payload: The stage's results
+    """
+    if stage not in _STAGE_COLUMNS:
+        raise ValueError(f"Unknown stage {stage!r}")
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            UPDATE messages SET {stage} = ? WHERE id = ? AND role = 'assistant'
+        """, (_encode_stage(stage, payload), message_id))
         
-        # Update conversation's updated_at timestamp
-        cursor.execute("""
-            UPDATE conversations SET updated_at = ? WHERE id = ?
-        """, (now, conversation_id))
+        if cursor.rowcount == 0:
+            raise ValueError(f"Assistant message {message_id} not found")
 
 
 def update_conversation_title(conversation_id: str, title: str, user_id: str = None):
@@ -479,7 +727,7 @@ def create_model_configuration(
             config_id,
             user_id,
             name,
-            json.dumps(council_models),
+            orjson.dumps(council_models).decode(),
             chairman_model,
             1 if is_default else 0,
             now
@@ -519,7 +767,7 @@ def list_model_configurations(user_id: str) -> List[Dict[str, Any]]:
             configurations.append({
                 "id": row["id"],
                 "name": row["name"],
-                "council_models": json.loads(row["council_models"]),
+                "council_models": orjson.loads(row["council_models"]),
                 "chairman_model": row["chairman_model"],
                 "is_default": bool(row["is_default"]),
                 "created_at": row["created_at"]
@@ -563,7 +811,7 @@ def get_model_configuration(config_id: str, user_id: str = None) -> Optional[Dic
             "id": row["id"],
             "user_id": row["user_id"],
             "name": row["name"],
-            "council_models": json.loads(row["council_models"]),
+            "council_models": orjson.loads(row["council_models"]),
             "chairman_model": row["chairman_model"],
             "is_default": bool(row["is_default"]),
             "created_at": row["created_at"]
@@ -607,7 +855,7 @@ def update_model_configuration(
     
     if council_models is not None:
         updates.append("council_models = ?")
-        values.append(json.dumps(council_models))
+        values.append(orjson.dumps(council_models).decode())
     
     if chairman_model is not None:
         updates.append("chairman_model = ?")
@@ -670,5 +918,79 @@ def delete_model_configuration(config_id: str, user_id: str = None) -> bool:
         return cursor.rowcount > 0
 
 
-# Initialize database on module import
-init_database()
+def _epoch_ms() -> int:
+    """Current time as integer milliseconds since the Unix epoch."""
+    return time.time_ns() // 1_000_000
+
+
+def get_cached_response(key: str, max_age_seconds: int) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached model response.
+    
+    Args:
+        key: Request digest (see openrouter.response_cache_key)
+        max_age_seconds: Ignore entries older than this
+    
+    Returns:
+        Response dict with 'content', 'reasoning_details', and 'response_time_ms',
+        or None if not cached or expired
+    """
+    cutoff_ms = _epoch_ms() - max_age_seconds * 1000
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT content, reasoning_details, response_time_ms
+            FROM response_cache
+            WHERE key = ? AND created_at_ms >= ?
+        """, (key, cutoff_ms))
+        
+        row = cursor.fetchone()
+        if not row:
+            return None
+        
+        return {
+            "content": row["content"],
+            "reasoning_details": orjson.loads(row["reasoning_details"]) if row["reasoning_details"] else None,
+            "response_time_ms": row["response_time_ms"]
+        }
+
+
+def cache_response(
+    key: str,
+    model: str,
+    response: Dict[str, Any],
+    max_age_seconds: Optional[int] = None
+):
+    """
+    Store a model response in the cache, replacing any previous entry.
+    
+    Args:
+        key: Request digest (see openrouter.response_cache_key)
+        model: Model that produced the response
+        response: Response dict with 'content' and optional
+            'reasoning_details' and 'response_time_ms'
+        max_age_seconds: If given, also remove entries older than this, so
+            the cache doesn't keep growing with expired responses
+    """
+    reasoning_details = response.get("reasoning_details")
+    now_ms = _epoch_ms()
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        if max_age_seconds is not None:
+            cursor.execute("""
+                DELETE FROM response_cache WHERE created_at_ms < ?
+            """, (now_ms - max_age_seconds * 1000,))
+        cursor.execute("""
+            INSERT OR REPLACE INTO response_cache
+            (key, model, content, reasoning_details, response_time_ms, created_at_ms)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (
+            key,
+            model,
+            response["content"],
+            orjson.dumps(reasoning_details).decode() if reasoning_details else None,
+            response.get("response_time_ms"),
+            now_ms
+        ))
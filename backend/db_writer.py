@@ -0,0 +1,59 @@
+"""Background writer that runs storage writes off the event loop."""
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from . import database
+
+# A single worker thread: writes run one at a time, in submission order,
+# on that thread's reused database connection
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+
+
+def _log_failure(future: Future) -> None:
+    """Report an exception from a write nobody is waiting on."""
+    if not future.cancelled() and future.exception() is not None:
+        print(f"Warning: background database write failed: {future.exception()}")
+
+
+def submit(fn: Callable[..., Any], *args: Any) -> Future:
+    """
+    Queue a write without waiting for it.
+
+    Failures are logged, since no caller will see the exception.
+
+    Args:
+        fn: Storage function to call on the writer thread
+        *args: Arguments for fn
+
+    Returns:
+        Future for the write's result
+    """
+    future = _executor.submit(fn, *args)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+async def write(fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a write on the writer thread and wait for it to commit.
+
+    Args:
+        fn: Storage function to call on the writer thread
+        *args: Arguments for fn
+
+    Returns:
+        fn's return value (its exceptions propagate to the caller)
+    """
+    return await asyncio.wrap_future(_executor.submit(fn, *args))
+
+
+async def flush() -> None:
+    """Wait until every write queued so far has finished."""
+    await asyncio.wrap_future(_executor.submit(lambda: None))
+
+
+def close() -> None:
+    """Finish queued writes, then close the writer's database connection."""
+    _executor.submit(database.close_db_connection).result()
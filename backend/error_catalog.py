@@ -2,33 +2,107 @@
 
 import json
 import os
+import re
+import threading
 import uuid
+from collections import Counter
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
 from .config import ERROR_CATALOG_FILE, ERROR_TYPES
 
+# Known error types, for validating classified errors
+_ERROR_TYPE_SET = frozenset(ERROR_TYPES)
+
+# Patterns used to parse the chairman's error classifications
+_CLASSIFICATION_HEADER = "ERROR CLASSIFICATIONS:"
+_BLOCK_SEPARATOR_RE = re.compile(r'\n---+\n?')
+_MODEL_RE = re.compile(r'MODEL:\s*(.+?)(?:\n|$)', re.IGNORECASE)
+_ERROR_TYPE_RE = re.compile(r'ERROR_TYPE:\s*(.+?)(?:\n|$)', re.IGNORECASE)
+_CLAIM_RE = re.compile(
+    r'CLAIM:\s*(.+?)(?:\n(?:ERROR_TYPE|EXPLANATION|MODEL):|$)', re.IGNORECASE | re.DOTALL
+)
+_EXPLANATION_RE = re.compile(
+    r'EXPLANATION:\s*(.+?)(?:\n(?:ERROR_TYPE|CLAIM|MODEL):|$)', re.IGNORECASE | re.DOTALL
+)
+
+
+# Catalog file used before errors were stored one per line; its errors are
+# carried over the first time the JSON Lines catalog is created
+_LEGACY_CATALOG_FILE = os.path.splitext(ERROR_CATALOG_FILE)[0] + ".json"
+
 
 def _ensure_catalog_exists() -> None:
     """Ensure the error catalog file and its directory exist."""
     os.makedirs(os.path.dirname(ERROR_CATALOG_FILE), exist_ok=True)
     if not os.path.exists(ERROR_CATALOG_FILE):
-        with open(ERROR_CATALOG_FILE, 'w') as f:
-            json.dump({"errors": []}, f)
+        errors = []
+        if os.path.exists(_LEGACY_CATALOG_FILE):
+            with open(_LEGACY_CATALOG_FILE, 'r') as f:
+                errors = json.load(f).get("errors", [])
+        _write_errors(errors)
+
+
+def _write_errors(errors: List[Dict[str, Any]]) -> None:
+    """Replace the catalog file's contents with errors."""
+    with open(ERROR_CATALOG_FILE, 'w') as f:
+        f.write("".join(json.dumps(error) + "\n" for error in errors))
+
+
+# Parsed catalog, reused until the file's (mtime, size) stamp changes, plus
+# the summary computed from it. Writes happen on the database writer thread,
+# so access is guarded by a lock.
+_cache_lock = threading.Lock()
+_cache: Dict[str, Any] = {"stamp": None, "errors": [], "summary": None}
+
+
+def _invalidate_cache() -> None:
+    """Forget the parsed catalog so the next read reloads the file."""
+    with _cache_lock:
+        _cache["stamp"] = None
+
+
+def _cached_errors() -> List[Dict[str, Any]]:
+    """
+    Get the catalog's errors, re-reading the file only if it has changed.
+
+    Returns:
+        The shared cached list (callers must not modify it)
+    """
+    _ensure_catalog_exists()
+    with _cache_lock:
+        st = os.stat(ERROR_CATALOG_FILE)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == _cache["stamp"]:
+            return _cache["errors"]
+
+        errors = []
+        with open(ERROR_CATALOG_FILE, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    errors.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # e.g. a line cut short by a crash mid-append
+                    print(f"Warning: skipping unreadable error catalog line: {line[:80]!r}")
+
+        _cache["stamp"] = stamp
+        _cache["errors"] = errors
+        _cache["summary"] = None
+        return errors
 
 
 def load_catalog() -> Dict[str, Any]:
     """Load the error catalog from disk."""
-    _ensure_catalog_exists()
-    with open(ERROR_CATALOG_FILE, 'r') as f:
-        return json.load(f)
+    return {"errors": list(_cached_errors())}
 
 
 def save_catalog(catalog: Dict[str, Any]) -> None:
-    """Save the error catalog to disk."""
+    """Save the error catalog to disk, replacing its contents."""
     _ensure_catalog_exists()
-    with open(ERROR_CATALOG_FILE, 'w') as f:
-        json.dump(catalog, f, indent=2)
+    _write_errors(catalog.get("errors", []))
+    _invalidate_cache()
 
 
 def add_errors(errors: List[Dict[str, Any]]) -> None:
@@ -47,39 +121,71 @@ def add_errors(errors: List[Dict[str, Any]]) -> None:
     if not errors:
         return
 
-    catalog = load_catalog()
+    # Errors from one classification share a timestamp
+    timestamp = datetime.utcnow().isoformat()
 
-    for error in errors:
-        catalog["errors"].append({
+    # Build all entries up front, then append them to the file in one write
+    entries = [
+        {
             "id": str(uuid.uuid4()),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "conversation_id": error.get("conversation_id", "unknown"),
             "model": error.get("model", "unknown"),
             "error_type": error.get("error_type", "Other"),
             "claim": error.get("claim", ""),
             "explanation": error.get("explanation", ""),
             "question_summary": error.get("question_summary", "")
-        })
+        }
+        for error in errors
+    ]
+
+    _ensure_catalog_exists()
+    with open(ERROR_CATALOG_FILE, 'a') as f:
+        f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+    _invalidate_cache()
+
+
+def query_errors(
+    model: Optional[str] = None,
+    error_type: Optional[str] = None,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get errors from the catalog matching all of the given filters.
+
+    Args:
+        model: Only include errors made by this model
+        error_type: Only include errors of this type
+        limit: Only include the most recent this many matching errors
 
-    save_catalog(catalog)
+    Returns:
+        Matching errors, oldest first (catalog order)
+    """
+    errors = _cached_errors()
+    if model is not None or error_type is not None:
+        errors = [
+            e for e in errors
+            if (model is None or e.get("model") == model)
+            and (error_type is None or e.get("error_type") == error_type)
+        ]
+    if limit is not None:
+        return errors[-limit:] if limit > 0 else []
+    return list(errors)
 
 
 def get_all_errors() -> List[Dict[str, Any]]:
     """Get all errors from the catalog."""
-    catalog = load_catalog()
-    return catalog.get("errors", [])
+    return query_errors()
 
 
 def get_errors_by_model(model: str) -> List[Dict[str, Any]]:
     """Get all errors for a specific model."""
-    all_errors = get_all_errors()
-    return [e for e in all_errors if e.get("model") == model]
+    return query_errors(model=model)
 
 
 def get_errors_by_type(error_type: str) -> List[Dict[str, Any]]:
     """Get all errors of a specific type."""
-    all_errors = get_all_errors()
-    return [e for e in all_errors if e.get("error_type") == error_type]
+    return query_errors(error_type=error_type)
 
 
 def get_error_summary() -> Dict[str, Any]:
@@ -89,30 +195,40 @@ def get_error_summary() -> Dict[str, Any]:
     Returns:
         Dict with 'by_model' and 'by_type' breakdowns
     """
-    all_errors = get_all_errors()
+    all_errors = _cached_errors()
+    with _cache_lock:
+        if _cache["summary"] is not None and _cache["errors"] is all_errors:
+            return _cache["summary"]
+
+    # Count each (model, error type) pair in a single pass, then roll the
+    # pair counts up into the per-model and per-type totals
+    pair_counts = Counter(
+        (error.get("model", "unknown"), error.get("error_type", "Other"))
+        for error in all_errors
+    )
 
     by_model: Dict[str, int] = {}
     by_type: Dict[str, int] = {}
     by_model_and_type: Dict[str, Dict[str, int]] = {}
 
-    for error in all_errors:
-        model = error.get("model", "unknown")
-        error_type = error.get("error_type", "Other")
-
-        by_model[model] = by_model.get(model, 0) + 1
-        by_type[error_type] = by_type.get(error_type, 0) + 1
+    for (model, error_type), count in pair_counts.items():
+        by_model[model] = by_model.get(model, 0) + count
+        by_type[error_type] = by_type.get(error_type, 0) + count
+        by_model_and_type.setdefault(model, {})[error_type] = count
 
-        if model not in by_model_and_type:
-            by_model_and_type[model] = {}
-        by_model_and_type[model][error_type] = by_model_and_type[model].get(error_type, 0) + 1
-
-    return {
+    summary = {
         "total_errors": len(all_errors),
         "by_model": by_model,
         "by_type": by_type,
         "by_model_and_type": by_model_and_type
     }
 
+    # Reuse the summary until the catalog changes
+    with _cache_lock:
+        if _cache["errors"] is all_errors:
+            _cache["summary"] = summary
+    return summary
+
 
 def parse_classification_response(response_text: str) -> List[Dict[str, Any]]:
     """
@@ -134,23 +250,16 @@ def parse_classification_response(response_text: str) -> List[Dict[str, Any]]:
     Returns:
         List of parsed error dicts
     """
-    import re
-
     errors = []
 
-    # Look for ERROR CLASSIFICATIONS section
-    if "ERROR CLASSIFICATIONS:" not in response_text:
-        return errors
-
-    # Split by the section header
-    parts = response_text.split("ERROR CLASSIFICATIONS:")
-    if len(parts) < 2:
+    # Look for ERROR CLASSIFICATIONS section (up to any repeated header)
+    _, found, classification_section = response_text.partition(_CLASSIFICATION_HEADER)
+    if not found:
         return errors
-
-    classification_section = parts[1]
+    classification_section = classification_section.partition(_CLASSIFICATION_HEADER)[0]
 
     # Split by error separators (---)
-    error_blocks = re.split(r'\n---+\n?', classification_section)
+    error_blocks = _BLOCK_SEPARATOR_RE.split(classification_section)
 
     for block in error_blocks:
         block = block.strip()
@@ -160,26 +269,26 @@ def parse_classification_response(response_text: str) -> List[Dict[str, Any]]:
         error = {}
 
         # Extract MODEL
-        model_match = re.search(r'MODEL:\s*(.+?)(?:\n|$)', block, re.IGNORECASE)
+        model_match = _MODEL_RE.search(block)
         if model_match:
             error["model"] = model_match.group(1).strip()
 
         # Extract ERROR_TYPE
-        type_match = re.search(r'ERROR_TYPE:\s*(.+?)(?:\n|$)', block, re.IGNORECASE)
+        type_match = _ERROR_TYPE_RE.search(block)
         if type_match:
             error_type = type_match.group(1).strip()
             # Validate against known types
-            if error_type not in ERROR_TYPES:
+            if error_type not in _ERROR_TYPE_SET:
                 error_type = "Other"
             error["error_type"] = error_type
 
         # Extract CLAIM
-        claim_match = re.search(r'CLAIM:\s*(.+?)(?:\n(?:ERROR_TYPE|EXPLANATION|MODEL):|$)', block, re.IGNORECASE | re.DOTALL)
+        claim_match = _CLAIM_RE.search(block)
         if claim_match:
             error["claim"] = claim_match.group(1).strip()
 
         # Extract EXPLANATION
-        explanation_match = re.search(r'EXPLANATION:\s*(.+?)(?:\n(?:ERROR_TYPE|CLAIM|MODEL):|$)', block, re.IGNORECASE | re.DOTALL)
+        explanation_match = _EXPLANATION_RE.search(block)
         if explanation_match:
             error["explanation"] = explanation_match.group(1).strip()
 
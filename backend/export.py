@@ -1,85 +1,230 @@
 """Export conversations to various formats."""
 
-from typing import Dict, Any, Literal
+from itertools import count
+from types import MappingProxyType
+from typing import Dict, Any, List, Literal, Callable, Iterator
 from datetime import datetime, timezone
 
 ExportMode = Literal["all", "final_only", "rankings_and_final"]
 
+# Shared read-only defaults for missing stage fields, so lookups on sparse
+# messages don't allocate a new empty list/dict each time
+_EMPTY_LIST = ()
+_EMPTY_DICT = MappingProxyType({})
 
-def _get_header(conversation: Dict[str, Any]) -> str:
-    """Generate common header for exports."""
-    lines = []
-    lines.append(f"# {conversation.get('title', 'LLM Council Conversation')}")
-    lines.append("")
-    lines.append(f"**Created:** {conversation.get('created_at', 'Unknown')}")
-    lines.append(f"**Conversation ID:** {conversation.get('id', 'Unknown')}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    return '\n'.join(lines)
+# Appends one message's lines; query_numbers numbers the user queries
+MessageBuilder = Callable[[List[str], Dict[str, Any], Iterator[int]], None]
 
 
-def _get_footer() -> str:
-    """Generate common footer for exports."""
-    lines = []
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    lines.append(f"*Exported from LLM Council on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC*")
-    lines.append("")
-    return '\n'.join(lines)
+def _get_header(conversation: Dict[str, Any]) -> List[str]:
+    """Generate common header lines for exports."""
+    return [
+        f"# {conversation.get('title', 'LLM Council Conversation')}",
+        "",
+        f"**Created:** {conversation.get('created_at', 'Unknown')}",
+        f"**Conversation ID:** {conversation.get('id', 'Unknown')}",
+        "",
+        "---",
+        "",
+    ]
 
 
-def export_final_answer_only(conversation: Dict[str, Any]) -> str:
+def _get_footer() -> List[str]:
+    """Generate common footer lines for exports."""
+    return [
+        "",
+        "---",
+        "",
+        f"*Exported from LLM Council on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC*",
+        "",
+    ]
+
+
+# Section headings. Exports are joined with newlines, so each heading entry
+# ending in "\n" is followed by a blank line, as is each entry's separator.
+_COUNCIL_RESPONSE_HEADING = "### Council Response\n"
+_STAGE1_HEADING = "#### Stage 1: Individual Model Responses\n"
+_FACT_CHECK_HEADING = "#### Stage 2: Fact-Checking Analysis\n"
+_STAGE3_HEADING = "#### Stage 3: Peer Rankings\n"
+_STAGE4_HEADING = "#### Stage 4: Final Council Answer\n"
+_PEER_RANKINGS_HEADING = "#### Peer Rankings\n"
+_FINAL_ANSWER_HEADING = "#### Final Council Answer\n"
+_FINAL_ONLY_HEADING = "### Final Council Answer\n"
+_SEPARATOR = "---\n"
+
+
+def _response_time_suffix(response_time: Any) -> str:
+    """Response time line (with its leading newline), or "" if unknown."""
+    if response_time and isinstance(response_time, (int, float)):
+        return f"\n*Response Time: {response_time:.0f}ms*"
+    return ""
+
+
+def _add_user_message(lines: List[str], message: Dict[str, Any], query_numbers: Iterator[int]) -> None:
+    """Add a user query section."""
+    lines.append(f"## Query {next(query_numbers)}\n\n**User:** {message['content']}\n")
+
+
+def _add_stage1(lines: List[str], stage1: List[Dict[str, Any]]) -> None:
+    """Add the individual model responses."""
+    lines.append(_STAGE1_HEADING)
+    for response in stage1:
+        model_name = response.get('model', 'Unknown Model')
+        content = response.get('response', '')
+        response_time = _response_time_suffix(response.get('response_time_ms'))
+        lines.append(f"**{model_name}**{response_time}\n\n{content}\n\n---\n")
+
+
+def _add_fact_checks(lines: List[str], fact_check: List[Dict[str, Any]]) -> None:
+    """Add the fact-checking analyses."""
+    lines.append(_FACT_CHECK_HEADING)
+    for fc in fact_check:
+        model_name = fc.get('model', 'Unknown Model')
+        content = fc.get('fact_check', '')
+        
+        # Include parsed summary if available
+        ratings = ""
+        parsed = fc.get('parsed_summary', _EMPTY_DICT)
+        if parsed.get('ratings'):
+            ratings = "*Ratings:*\n" + "".join(
+                f"- {response_label}: {rating}\n"
+                for response_label, rating in parsed['ratings'].items()
+            )
+            if parsed.get('most_reliable'):
+                ratings += f"- Most Reliable: {parsed['most_reliable']}\n"
+            ratings += "\n"
+        
+        lines.append(f"**Fact-Checker: {model_name}**\n\n{ratings}{content}\n\n---\n")
+
+
+def _add_rankings(lines: List[str], stage3: List[Dict[str, Any]], heading: str) -> None:
+    """Add the peer rankings under the given heading."""
+    lines.append(heading)
+    for ranking in stage3:
+        model_name = ranking.get('model', 'Unknown Model')
+        content = ranking.get('ranking', '')
+        
+        # Include parsed ranking if available
+        order = ""
+        parsed = ranking.get('parsed_ranking', _EMPTY_LIST)
+        if parsed:
+            order = "*Ranking:*\n" + "".join(
+                f"{i}. {response_label}\n" for i, response_label in enumerate(parsed, 1)
+            ) + "\n"
+        
+        lines.append(f"**Ranker: {model_name}**\n\n{order}{content}\n\n---\n")
+
+
+def _add_final_answer(lines: List[str], stage4: Dict[str, Any], heading: str) -> None:
+    """Add the chairman's synthesis under the given heading."""
+    model_name = stage4.get('model', 'Unknown Model')
+    content = stage4.get('response', '')
+    response_time = _response_time_suffix(stage4.get('response_time_ms'))
+    lines.append(heading)
+    lines.append(f"**Chairman: {model_name}**{response_time}\n\n{content}\n")
+
+
+def _add_final_only(lines: List[str], message: Dict[str, Any], query_numbers: Iterator[int]) -> None:
+    """Add only the Stage 4 answer of an assistant message."""
+    stage4 = message.get('stage4', _EMPTY_DICT)
+    if stage4:
+        _add_final_answer(lines, stage4, _FINAL_ONLY_HEADING)
+        lines.append(_SEPARATOR)
+
+
+def _add_rankings_and_final(lines: List[str], message: Dict[str, Any], query_numbers: Iterator[int]) -> None:
+    """Add the Stage 3 rankings and Stage 4 answer of an assistant message."""
+    lines.append(_COUNCIL_RESPONSE_HEADING)
+    
+    stage3 = message.get('stage3', _EMPTY_LIST)
+    if stage3:
+        _add_rankings(lines, stage3, _PEER_RANKINGS_HEADING)
+    
+    stage4 = message.get('stage4', _EMPTY_DICT)
+    if stage4:
+        _add_final_answer(lines, stage4, _FINAL_ANSWER_HEADING)
+    
+    lines.append(_SEPARATOR)
+
+
+def _add_all_stages(lines: List[str], message: Dict[str, Any], query_numbers: Iterator[int]) -> None:
+    """Add all 4 stages of an assistant message."""
+    lines.append(_COUNCIL_RESPONSE_HEADING)
+    
+    stage1 = message.get('stage1', _EMPTY_LIST)
+    if stage1:
+        _add_stage1(lines, stage1)
+    
+    fact_check = message.get('fact_check', _EMPTY_LIST)
+    if fact_check:
+        _add_fact_checks(lines, fact_check)
+    
+    stage3 = message.get('stage3', _EMPTY_LIST)
+    if stage3:
+        _add_rankings(lines, stage3, _STAGE3_HEADING)
+    
+    stage4 = message.get('stage4', _EMPTY_DICT)
+    if stage4:
+        _add_final_answer(lines, stage4, _STAGE4_HEADING)
+    
+    lines.append(_SEPARATOR)
+
+
+# Per-mode builders, by message role (messages with other roles are skipped)
+_FINAL_ONLY_BUILDERS: Dict[str, MessageBuilder] = {
+    "user": _add_user_message,
+    "assistant": _add_final_only,
+}
+_RANKINGS_AND_FINAL_BUILDERS: Dict[str, MessageBuilder] = {
+    "user": _add_user_message,
+    "assistant": _add_rankings_and_final,
+}
+_ALL_STAGES_BUILDERS: Dict[str, MessageBuilder] = {
+    "user": _add_user_message,
+    "assistant": _add_all_stages,
+}
+
+
+def _export(conversation: Dict[str, Any], builders: Dict[str, MessageBuilder]) -> str:
     """
-    Export only the final chairman answers from the conversation.
+    Export a conversation using the given per-role message builders.
     
     Args:
         conversation: Full conversation dict with messages
+        builders: Mapping from message role to the function adding its lines
         
     Returns:
-        Markdown-formatted string with only final answers
+        Markdown-formatted string
     """
-    lines = []
-    
-    # Header
-    lines.append(_get_header(conversation))
+    # Header (every line of the export is joined once, at the end)
+    lines = _get_header(conversation)
     
     # Process each message
-    query_counter = 0
-    for message in conversation.get('messages', []):
-        if message['role'] == 'user':
-            query_counter += 1
-            lines.append(f"## Query {query_counter}")
-            lines.append("")
-            lines.append(f"**User:** {message['content']}")
-            lines.append("")
-            
-        elif message['role'] == 'assistant':
-            # Only Stage 4: Chairman Synthesis
-            stage4 = message.get('stage4', {})
-            if stage4:
-                lines.append("### Final Council Answer")
-                lines.append("")
-                model_name = stage4.get('model', 'Unknown Model')
-                content = stage4.get('response', '')
-                response_time = stage4.get('response_time_ms')
-                
-                lines.append(f"**Chairman: {model_name}**")
-                if response_time and isinstance(response_time, (int, float)):
-                    lines.append(f"*Response Time: {response_time:.0f}ms*")
-                lines.append("")
-                lines.append(content)
-                lines.append("")
-                lines.append("---")
-                lines.append("")
+    query_numbers = count(1)
+    for message in conversation.get('messages', _EMPTY_LIST):
+        builder = builders.get(message['role'])
+        if builder is not None:
+            builder(lines, message, query_numbers)
     
     # Footer
-    lines.append(_get_footer())
+    lines.extend(_get_footer())
     
     return '\n'.join(lines)
 
 
+def export_final_answer_only(conversation: Dict[str, Any]) -> str:
+    """
+    Export only the final chairman answers from the conversation.
+    
+    Args:
+        conversation: Full conversation dict with messages
+        
+    Returns:
+        Markdown-formatted string with only final answers
+    """
+    return _export(conversation, _FINAL_ONLY_BUILDERS)
+
+
 def export_rankings_and_final(conversation: Dict[str, Any]) -> str:
     """
     Export rankings and final answer from the conversation.
@@ -90,73 +235,7 @@ def export_rankings_and_final(conversation: Dict[str, Any]) -> str:
     Returns:
         Markdown-formatted string with rankings and final answer
     """
-    lines = []
-    
-    # Header
-    lines.append(_get_header(conversation))
-    
-    # Process each message
-    query_counter = 0
-    for message in conversation.get('messages', []):
-        if message['role'] == 'user':
-            query_counter += 1
-            lines.append(f"## Query {query_counter}")
-            lines.append("")
-            lines.append(f"**User:** {message['content']}")
-            lines.append("")
-            
-        elif message['role'] == 'assistant':
-            lines.append("### Council Response")
-            lines.append("")
-            
-            # Stage 3: Peer Rankings
-            stage3 = message.get('stage3', [])
-            if stage3:
-                lines.append("#### Peer Rankings")
-                lines.append("")
-                for ranking in stage3:
-                    model_name = ranking.get('model', 'Unknown Model')
-                    content = ranking.get('ranking', '')
-                    
-                    lines.append(f"**Ranker: {model_name}**")
-                    lines.append("")
-                    
-                    # Include parsed ranking if available
-                    parsed = ranking.get('parsed_ranking', [])
-                    if parsed:
-                        lines.append("*Ranking:*")
-                        for i, response_label in enumerate(parsed, 1):
-                            lines.append(f"{i}. {response_label}")
-                        lines.append("")
-                    
-                    lines.append(content)
-                    lines.append("")
-                    lines.append("---")
-                    lines.append("")
-            
-            # Stage 4: Chairman Synthesis
-            stage4 = message.get('stage4', {})
-            if stage4:
-                lines.append("#### Final Council Answer")
-                lines.append("")
-                model_name = stage4.get('model', 'Unknown Model')
-                content = stage4.get('response', '')
-                response_time = stage4.get('response_time_ms')
-                
-                lines.append(f"**Chairman: {model_name}**")
-                if response_time and isinstance(response_time, (int, float)):
-                    lines.append(f"*Response Time: {response_time:.0f}ms*")
-                lines.append("")
-                lines.append(content)
-                lines.append("")
-            
-            lines.append("---")
-            lines.append("")
-    
-    # Footer
-    lines.append(_get_footer())
-    
-    return '\n'.join(lines)
+    return _export(conversation, _RANKINGS_AND_FINAL_BUILDERS)
 
 
 def export_conversation_to_markdown(conversation: Dict[str, Any]) -> str:
@@ -169,121 +248,7 @@ def export_conversation_to_markdown(conversation: Dict[str, Any]) -> str:
     Returns:
         Markdown-formatted string
     """
-    lines = []
-    
-    # Header
-    lines.append(_get_header(conversation))
-    
-    # Process each message
-    query_counter = 0
-    for _, message in enumerate(conversation.get('messages', [])):
-        if message['role'] == 'user':
-            # User message
-            query_counter += 1
-            lines.append(f"## Query {query_counter}")
-            lines.append("")
-            lines.append(f"**User:** {message['content']}")
-            lines.append("")
-            
-        elif message['role'] == 'assistant':
-            # Assistant message with all 4 stages
-            lines.append("### Council Response")
-            lines.append("")
-            
-            # Stage 1: Individual Responses
-            stage1 = message.get('stage1', [])
-            if stage1:
-                lines.append("#### Stage 1: Individual Model Responses")
-                lines.append("")
-                for response in stage1:
-                    model_name = response.get('model', 'Unknown Model')
-                    content = response.get('response', '')
-                    response_time = response.get('response_time_ms')
-                    
-                    lines.append(f"**{model_name}**")
-                    if response_time and isinstance(response_time, (int, float)):
-                        lines.append(f"*Response Time: {response_time:.0f}ms*")
-                    lines.append("")
-                    lines.append(content)
-                    lines.append("")
-                    lines.append("---")
-                    lines.append("")
-            
-            # Stage 2: Fact-Checking
-            fact_check = message.get('fact_check', [])
-            if fact_check:
-                lines.append("#### Stage 2: Fact-Checking Analysis")
-                lines.append("")
-                for fc in fact_check:
-                    model_name = fc.get('model', 'Unknown Model')
-                    content = fc.get('fact_check', '')
-                    
-                    lines.append(f"**Fact-Checker: {model_name}**")
-                    lines.append("")
-                    
-                    # Include parsed summary if available
-                    parsed = fc.get('parsed_summary', {})
-                    if parsed.get('ratings'):
-                        lines.append("*Ratings:*")
-                        for response_label, rating in parsed['ratings'].items():
-                            lines.append(f"- {response_label}: {rating}")
-                        if parsed.get('most_reliable'):
-                            lines.append(f"- Most Reliable: {parsed['most_reliable']}")
-                        lines.append("")
-                    
-                    lines.append(content)
-                    lines.append("")
-                    lines.append("---")
-                    lines.append("")
-            
-            # Stage 3: Peer Rankings
-            stage3 = message.get('stage3', [])
-            if stage3:
-                lines.append("#### Stage 3: Peer Rankings")
-                lines.append("")
-                for ranking in stage3:
-                    model_name = ranking.get('model', 'Unknown Model')
-                    content = ranking.get('ranking', '')
-                    
-                    lines.append(f"**Ranker: {model_name}**")
-                    lines.append("")
-                    
-                    # Include parsed ranking if available
-                    parsed = ranking.get('parsed_ranking', [])
-                    if parsed:
-                        lines.append("*Ranking:*")
-                        for i, response_label in enumerate(parsed, 1):
-                            lines.append(f"{i}. {response_label}")
-                        lines.append("")
-                    
-                    lines.append(content)
-                    lines.append("")
-                    lines.append("---")
-                    lines.append("")
-            
-            # Stage 4: Chairman Synthesis
-            stage4 = message.get('stage4', {})
-            if stage4:
-                lines.append("#### Stage 4: Final Council Answer")
-                lines.append("")
-                model_name = stage4.get('model', 'Unknown Model')
-                content = stage4.get('response', '')
-                response_time = stage4.get('response_time_ms')
-                
-                lines.append(f"**Chairman: {model_name}**")
-                if response_time and isinstance(response_time, (int, float)):
-                    lines.append(f"*Response Time: {response_time:.0f}ms*")
-                lines.append("")
-                lines.append(content)
-                lines.append("")
-            
-            lines.append("---")
-            lines.append("")
-    
-    # Footer
-    lines.append(_get_footer())
-    
-    return '\n'.join(lines)
+    return _export(conversation, _ALL_STAGES_BUILDERS)
 
 
 def export_conversation(conversation: Dict[str, Any], mode: ExportMode = "all") -> str:
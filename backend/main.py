@@ -2,22 +2,24 @@
 
 import os
 import re
+import time
 from urllib.parse import quote
-from datetime import datetime, timezone
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, Response
+from fastapi.responses import JSONResponse, StreamingResponse, Response
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 import uuid
-import json
 import asyncio
+import orjson
+from contextlib import asynccontextmanager
 
 from . import storage
 from . import database
+from . import db_writer
 from .config import (
-    AVAILABLE_MODELS, COUNCIL_MODELS, CHAIRMAN_MODEL, 
-    ERROR_CLASSIFICATION_ENABLED,
+    AVAILABLE_MODELS, AVAILABLE_MODELS_BY_ID, COUNCIL_MODELS, CHAIRMAN_MODEL,
+    ERROR_CLASSIFICATION_ENABLED, SPECULATIVE_CHAIRMAN_ENABLED,
     RATE_LIMIT_GENERAL, RATE_LIMIT_EXPENSIVE
 )
 from .council import (
@@ -33,16 +35,76 @@ from .council import (
     stage4_synthesize_final_streaming,
     calculate_aggregate_rankings,
     calculate_aggregate_fact_checks,
-    classify_errors
+    classify_errors,
+    build_label_to_model,
+    format_fact_check_text,
+    MAX_RESPONSE_LABELS
 )
 from . import error_catalog
-from .auth import router as auth_router, require_auth, is_auth_enabled, get_current_user
+from .auth import router as auth_router, require_auth, is_auth_enabled, get_current_user, close_oauth_client
 from .export import export_conversation
 from .rate_limiter import RateLimiter
 from .security_headers import SecurityHeadersMiddleware
-from .api_key_auth import optional_api_key, is_api_key_auth_enabled
+from .api_key_auth import APIKeyMiddleware, optional_api_key, is_api_key_auth_enabled
 
-app = FastAPI(title="LLM Council API")
+# Export filenames: characters replaced in titles, then runs collapsed to one hyphen
+_EXPORT_UNSAFE_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s\-_]')
+_EXPORT_SEPARATOR_RUN_RE = re.compile(r'[\s\-]+')
+
+# Additional CORS origins must be http(s) URLs
+_CORS_ORIGIN_SCHEME_RE = re.compile(r'https?://')
+
+# Export filename timestamp, reformatted only when the UTC second changes
+_export_timestamp = {"second": None, "text": ""}
+
+# Server-sent events are written as bytes; fixed events and the start of each
+# stage's chunk events are encoded once here
+_SSE_CATALOGING_START = b'data: {"type":"cataloging_start"}\n\n'
+_SSE_COMPLETE = b'data: {"type":"complete"}\n\n'
+_SSE_CHUNK_PREFIXES = {
+    stage: b'data: {"type":"' + stage.encode() + b'_chunk","model":'
+    for stage in ("stage1", "fact_check", "stage3", "stage4")
+}
+
+
+def _sse_event(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as a server-sent event."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+class _ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Set as response_class only on endpoints without a response_model:
+    those are already serialized straight to bytes by Pydantic, which a
+    custom response class would turn off. Endpoints may also return it
+    directly to skip response_model validation of data already in shape.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # Create or migrate the database schema before serving requests
+    database.init_database()
+    # Start new tasks eagerly, so stage tasks that finish without suspending
+    # (e.g. cache hits) skip a scheduler round-trip (Python 3.12+ only)
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    yield
+    # Release pooled connections held by shared HTTP clients
+    await close_oauth_client()
+    # Finish queued writes and close the database connections
+    db_writer.close()
+    database.close_db_connection()
+
+
+app = FastAPI(title="LLM Council API", lifespan=lifespan)
 
 # CORS configuration for local development and production
 # In production on Render, set FRONTEND_URL environment variable
@@ -61,11 +123,14 @@ if additional_origins:
     for origin in additional_origins.split(","):
         origin = origin.strip()
         # Validate that origin is a properly formatted URL
-        if origin and (origin.startswith("http://") or origin.startswith("https://")):
+        if origin and _CORS_ORIGIN_SCHEME_RE.match(origin):
             cors_origins.append(origin)
         elif origin:
             print(f"Warning: Skipping invalid CORS origin (must start with http:// or https://): {origin}")
 
+# Drop repeated origins (keeping their order) so each check scans a shorter list
+cors_origins = list(dict.fromkeys(cors_origins))
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
@@ -79,6 +144,9 @@ app.add_middleware(
 # Add security headers middleware
 app.add_middleware(SecurityHeadersMiddleware)
 
+# Validate the X-API-Key header once per request (read by the API key dependencies)
+app.add_middleware(APIKeyMiddleware)
+
 # Add rate limiting middleware
 # Configurable via environment variables: RATE_LIMIT_GENERAL and RATE_LIMIT_EXPENSIVE
 app.add_middleware(
@@ -99,7 +167,7 @@ class CreateConversationRequest(BaseModel):
 class SendMessageRequest(BaseModel):
     """Request to send a message in a conversation."""
     content: str = Field(..., max_length=50000)
-    council_models: List[str] = None
+    council_models: List[str] = Field(None, max_length=MAX_RESPONSE_LABELS)
     chairman_model: str = None
     fact_checking_enabled: bool = True
 
@@ -125,8 +193,8 @@ class Conversation(BaseModel):
 class SynthesizeRequest(BaseModel):
     """Request to synthesize a final answer from provided or generated responses."""
     question: str = Field(..., max_length=50000)
-    responses: Optional[List[Dict[str, str]]] = None  # Optional: [{"model": "...", "content": "..."}]
-    council_models: Optional[List[str]] = None  # Used only if responses not provided
+    responses: Optional[List[Dict[str, str]]] = Field(None, max_length=MAX_RESPONSE_LABELS)  # Optional: [{"model": "...", "content": "..."}]
+    council_models: Optional[List[str]] = Field(None, max_length=MAX_RESPONSE_LABELS)  # Used only if responses not provided
     chairman_model: Optional[str] = None
     fact_checking_enabled: bool = False  # Default to false for simple synthesis
     include_metadata: bool = False  # Whether to return full metadata
@@ -146,13 +214,60 @@ async def optional_auth(request: Request) -> dict:
     return {"login": "anonymous", "auth_disabled": True}
 
 
+async def require_session_or_api_key(
+    user: dict = Depends(optional_auth),
+    api_key: Optional[str] = Depends(optional_api_key)
+) -> dict:
+    """
+    Require a valid session or API key, for whichever mechanisms are enabled.
+
+    Returns:
+        The current user (anonymous if authenticated by API key or if
+        authentication is disabled)
+    """
+    # Each flag is read once; the tailored messages below reuse them
+    session_auth_enabled = is_auth_enabled()
+    api_key_auth_enabled = is_api_key_auth_enabled()
+    auth_required = session_auth_enabled or api_key_auth_enabled
+    has_session = user.get("login") != "anonymous"
+    has_api_key = bool(api_key)
+
+    if auth_required and not (has_session or has_api_key):
+        # Tailor error message based on which auth mechanisms are enabled
+        if session_auth_enabled and api_key_auth_enabled:
+            message = (
+                "This endpoint requires either session authentication or an API key. "
+                "Provide a valid API key in the X-API-Key header or authenticate via GitHub OAuth."
+            )
+        elif api_key_auth_enabled:
+            message = (
+                "This endpoint requires an API key. "
+                "Provide a valid API key in the X-API-Key header."
+            )
+        else:  # Only session auth is enabled
+            message = (
+                "This endpoint requires session authentication. "
+                "Authenticate via GitHub OAuth to access this endpoint."
+            )
+
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "error": "Authentication required",
+                "message": message
+            }
+        )
+
+    return user
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
     return {"status": "ok", "service": "LLM Council API"}
 
 
-@app.get("/api/models")
+@app.get("/api/models", response_class=_ORJSONResponse)
 async def get_models(user: dict = Depends(optional_auth)):
     """Get available models and default configuration."""
     return {
@@ -165,8 +280,7 @@ async def get_models(user: dict = Depends(optional_auth)):
 @app.post("/api/synthesize", response_model=SynthesizeResponse)
 async def synthesize_answer(
     request: SynthesizeRequest, 
-    user: dict = Depends(optional_auth),
-    api_key: str = Depends(optional_api_key)
+    user: dict = Depends(require_session_or_api_key)
 ):
     """
     Synthesize a final answer from the chairman model.
@@ -190,37 +304,6 @@ async def synthesize_answer(
     Returns:
         SynthesizeResponse with the chairman's synthesized answer
     """
-    # Verify authentication - must have either valid session or API key, depending on what is enabled
-    auth_required = is_auth_enabled() or is_api_key_auth_enabled()
-    has_session = user.get("login") != "anonymous"
-    has_api_key = bool(api_key)
-
-    if auth_required and not (has_session or has_api_key):
-        # Tailor error message based on which auth mechanisms are enabled
-        if is_auth_enabled() and is_api_key_auth_enabled():
-            message = (
-                "This endpoint requires either session authentication or an API key. "
-                "Provide a valid API key in the X-API-Key header or authenticate via GitHub OAuth."
-            )
-        elif is_api_key_auth_enabled():
-            message = (
-                "This endpoint requires an API key. "
-                "Provide a valid API key in the X-API-Key header."
-            )
-        else:  # Only session auth is enabled
-            message = (
-                "This endpoint requires session authentication. "
-                "Authenticate via GitHub OAuth to access this endpoint."
-            )
-
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": "Authentication required",
-                "message": message
-            }
-        )
-    
     chairman = request.chairman_model if request.chairman_model else CHAIRMAN_MODEL
     
     # If responses are provided, use them directly (fast path)
@@ -236,14 +319,7 @@ async def synthesize_answer(
             })
         
         # Create label mapping for de-anonymization
-        labels = [chr(65 + i) for i in range(len(stage1_results))]
-        label_to_model = {
-            f"Response {label}": {
-                "model": result['model'],
-                "instance": result.get('instance', idx)
-            }
-            for idx, (label, result) in enumerate(zip(labels, stage1_results))
-        }
+        label_to_model = build_label_to_model(stage1_results)
         
         # Skip fact-checking and rankings - go straight to synthesis
         fact_check_results = []
@@ -279,7 +355,8 @@ async def synthesize_answer(
             request.question,
             request.council_models,
             chairman,
-            request.fact_checking_enabled
+            request.fact_checking_enabled,
+            speculative_chairman=SPECULATIVE_CHAIRMAN_ENABLED
         )
         
         response_data = {
@@ -301,10 +378,29 @@ async def synthesize_answer(
 
 
 @app.get("/api/conversations", response_model=List[ConversationMetadata])
-async def list_conversations_endpoint(user: dict = Depends(optional_auth)):
-    """List all conversations for the current user (metadata only)."""
+async def list_conversations_endpoint(
+    limit: Optional[int] = None,
+    before: Optional[str] = None,
+    user: dict = Depends(optional_auth)
+):
+    """
+    List conversations for the current user (metadata only), most recently updated first.
+    
+    Args:
+        limit: Optional page size (all conversations if omitted)
+        before: Optional "<updated_at>,<id>" of the last conversation on the
+            previous page, to fetch the next page
+    """
+    if limit is not None and limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be a positive integer")
+    cursor = None
+    if before is not None:
+        updated_at, _, conversation_id = before.partition(",")
+        if not updated_at or not conversation_id:
+            raise HTTPException(status_code=400, detail="before must be '<updated_at>,<id>'")
+        cursor = (updated_at, conversation_id)
     user_id = user.get("login", "anonymous")
-    return storage.list_conversations(user_id)
+    return storage.list_conversations(user_id, limit, cursor)
 
 
 @app.get("/api/conversations/search", response_model=List[ConversationMetadata])
@@ -324,7 +420,8 @@ async def create_conversation(request: CreateConversationRequest, user: dict = D
     """Create a new conversation for the current user."""
     conversation_id = str(uuid.uuid4())
     user_id = user.get("login", "anonymous")
-    conversation = storage.create_conversation(conversation_id, user_id)
+    # Insert on the writer thread so the commit doesn't block the event loop
+    conversation = await db_writer.write(storage.create_conversation, conversation_id, user_id)
     return conversation
 
 
@@ -335,7 +432,12 @@ async def get_conversation(conversation_id: str, user: dict = Depends(optional_a
     conversation = storage.get_conversation(conversation_id, user_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
-    return conversation
+    # Apart from the owner's user_id, the stored dict already has the
+    # Conversation shape (response_model is kept for the API schema);
+    # returning it encoded skips re-validating every message's stage
+    # payloads against Dict[str, Any]
+    conversation.pop("user_id", None)
+    return _ORJSONResponse(conversation)
 
 
 @app.delete("/api/conversations/{conversation_id}")
@@ -377,8 +479,8 @@ async def export_conversation_endpoint(
     # Create a safe filename from the conversation title
     title = conversation.get('title', 'conversation')
     # Replace special characters with hyphens, then normalize multiple hyphens/spaces
-    safe_title = re.sub(r'[^a-zA-Z0-9\s\-_]', '-', title)
-    safe_title = re.sub(r'[\s\-]+', '-', safe_title.strip())
+    safe_title = _EXPORT_UNSAFE_CHARS_RE.sub('-', title)
+    safe_title = _EXPORT_SEPARATOR_RUN_RE.sub('-', safe_title.strip())
     # Ensure filename is not empty and not too long
     if not safe_title or safe_title == '-':
         safe_title = 'conversation'
@@ -389,7 +491,11 @@ async def export_conversation_endpoint(
     mode_label = mode.replace('_', '-')  # e.g., "final_only" becomes "final-only"
     
     # Add timestamp in YYYYMMDD-HHMMSS format for uniqueness
-    timestamp = datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')
+    second = int(time.time())
+    if second != _export_timestamp["second"]:
+        _export_timestamp["text"] = time.strftime('%Y%m%d-%H%M%S', time.gmtime(second))
+        _export_timestamp["second"] = second
+    timestamp = _export_timestamp["text"]
     
     # Final filename format: title_mode_timestamp.md
     # Example: "What-is-Python_final-only_20260120-163000.md"
@@ -409,7 +515,7 @@ async def export_conversation_endpoint(
     )
 
 
-@app.post("/api/conversations/{conversation_id}/message")
+@app.post("/api/conversations/{conversation_id}/message", response_class=_ORJSONResponse)
 async def send_message(conversation_id: str, request: SendMessageRequest, user: dict = Depends(optional_auth)):
     """
     Send a message and run the 4-stage council process.
@@ -417,52 +523,63 @@ async def send_message(conversation_id: str, request: SendMessageRequest, user:
     """
     user_id = user.get("login", "anonymous")
     
-    # Check if conversation exists and belongs to user
-    conversation = storage.get_conversation(conversation_id, user_id)
+    # Check if conversation exists and belongs to user (only its message
+    # count is needed, so the messages themselves aren't loaded)
+    conversation = storage.get_conversation_summary(conversation_id, user_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     # Check if this is the first message
-    is_first_message = len(conversation["messages"]) == 0
+    is_first_message = conversation["message_count"] == 0
 
-    # Add user message
-    storage.add_user_message(conversation_id, request.content, user_id)
+    # Add user message (writes run on the database writer thread so commits
+    # don't block the event loop)
+    await db_writer.write(storage.add_user_message, conversation_id, request.content, user_id)
 
-    # If this is the first message, generate a title
+    # If this is the first message, generate a title in parallel with the council
+    title_task = None
     if is_first_message:
-        title = await generate_conversation_title(request.content)
-        storage.update_conversation_title(conversation_id, title, user_id)
-
-    # Run the 4-stage council process
-    stage1_results, fact_check_results, stage3_results, stage4_result, metadata = await run_full_council(
-        request.content,
-        request.council_models,
-        request.chairman_model,
-        request.fact_checking_enabled
-    )
+        title_task = asyncio.create_task(generate_conversation_title(request.content))
+
+    # Save the assistant message stage by stage as the council progresses,
+    # so completed stages survive a failure in a later one
+    message_id = await db_writer.write(storage.create_assistant_message, conversation_id, user_id)
+
+    def save_stage(stage: str, results: Any):
+        # Queued without waiting; the council carries on with the next stage
+        db_writer.submit(storage.update_assistant_message_stage, message_id, stage, results)
 
-    # Classify and catalog any errors found during fact-checking (if enabled)
-    if ERROR_CLASSIFICATION_ENABLED and request.fact_checking_enabled:
-        classified_errors = await classify_errors(
+    # Run the 4-stage council process (errors are classified alongside Stage 4)
+    try:
+        stage1_results, fact_check_results, stage3_results, stage4_result, metadata = await run_full_council(
             request.content,
-            fact_check_results,
-            metadata.get("label_to_model", {}),
-            request.chairman_model
+            request.council_models,
+            request.chairman_model,
+            request.fact_checking_enabled,
+            error_classification_enabled=ERROR_CLASSIFICATION_ENABLED,
+            speculative_chairman=SPECULATIVE_CHAIRMAN_ENABLED,
+            on_stage_complete=save_stage
         )
-        if classified_errors:
-            for error in classified_errors:
-                error["conversation_id"] = conversation_id
-            error_catalog.add_errors(classified_errors)
-
-    # Add assistant message with all stages
-    storage.add_assistant_message(
-        conversation_id,
-        stage1_results,
-        fact_check_results,
-        stage3_results,
-        stage4_result,
-        user_id
-    )
+    except BaseException:
+        # Nothing will await the title if the council fails, so stop its model call
+        if title_task:
+            title_task.cancel()
+        raise
+
+    if title_task:
+        title = await title_task
+        db_writer.submit(storage.update_conversation_title, conversation_id, title, user_id)
+
+    # Make sure every stage (and the title) is stored before responding
+    await db_writer.flush()
+
+    # Catalog any errors found during fact-checking. Nothing in the response
+    # depends on the catalog, so this write finishes after the reply is sent
+    classified_errors = metadata.pop("classified_errors", None)
+    if classified_errors:
+        for error in classified_errors:
+            error["conversation_id"] = conversation_id
+        db_writer.submit(error_catalog.add_errors, classified_errors)
 
     # Return the complete response with metadata
     return {
@@ -483,16 +600,18 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest,
     """
     user_id = user.get("login", "anonymous")
     
-    # Check if conversation exists and belongs to user
-    conversation = storage.get_conversation(conversation_id, user_id)
+    # Check if conversation exists and belongs to user (only its message
+    # count is needed, so the messages themselves aren't loaded)
+    conversation = storage.get_conversation_summary(conversation_id, user_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     # Check if this is the first message
-    is_first_message = len(conversation["messages"]) == 0
+    is_first_message = conversation["message_count"] == 0
 
     async def event_generator():
-        # Queue to collect chunks from parallel model queries
+        # Queue to collect chunks from parallel model queries; each stage
+        # ends its chunks with a None marker
         chunk_queue = asyncio.Queue()
 
         # Track the current stage for chunk events
@@ -500,25 +619,39 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest,
 
         async def on_chunk(model: str, instance: int, text: str):
             """Callback for streaming chunks from individual models."""
-            await chunk_queue.put({
-                "type": f"{current_stage['stage']}_chunk",
-                "model": model,
-                "instance": instance,
-                "text": text
-            })
+            # Chunk events are the bulk of the stream, so they are encoded
+            # directly rather than through an intermediate dict
+            await chunk_queue.put(
+                _SSE_CHUNK_PREFIXES[current_stage["stage"]] + orjson.dumps(model)
+                + b',"instance":' + orjson.dumps(instance)
+                + b',"text":' + orjson.dumps(text) + b'}\n\n'
+            )
 
-        async def stream_chunks_until_done(done_event: asyncio.Event):
-            """Yield chunks from queue until stage is done."""
-            while not done_event.is_set() or not chunk_queue.empty():
-                try:
-                    chunk = await asyncio.wait_for(chunk_queue.get(), timeout=0.1)
-                    yield f"data: {json.dumps(chunk)}\n\n"
-                except asyncio.TimeoutError:
-                    continue
+        async def end_chunks_when_done(stage):
+            """Await a stage, then queue the marker that ends its chunks (even if it fails)."""
+            try:
+                return await stage
+            finally:
+                chunk_queue.put_nowait(None)
+
+        async def stream_chunks_until_done():
+            """Yield chunks from queue until the running stage's end marker."""
+            while True:
+                chunk = await chunk_queue.get()
+                if chunk is None:
+                    return
+                yield chunk
 
         try:
-            # Add user message
-            storage.add_user_message(conversation_id, request.content, user_id)
+            # Add user message (on the database writer thread)
+            await db_writer.write(storage.add_user_message, conversation_id, request.content, user_id)
+
+            # Save the assistant message stage by stage as each one completes,
+            # so the writes overlap the following stages' model calls
+            message_id = await db_writer.write(storage.create_assistant_message, conversation_id, user_id)
+
+            def save_stage(stage: str, results: Any):
+                db_writer.submit(storage.update_assistant_message_stage, message_id, stage, results)
 
             # Start title generation in parallel (don't await yet)
             title_task = None
@@ -530,153 +663,135 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest,
 
             # Stage 1: Collect responses with streaming
             current_stage["stage"] = "stage1"
-            yield f"data: {json.dumps({'type': 'stage1_start', 'models': models})}\n\n"
+            yield _sse_event({'type': 'stage1_start', 'models': models})
 
             # Run stage 1 with streaming chunks
-            stage1_done = asyncio.Event()
-
-            async def run_stage1():
-                result = await stage1_collect_responses_streaming(
+            stage1_task = asyncio.create_task(end_chunks_when_done(
+                stage1_collect_responses_streaming(
                     request.content, on_chunk, request.council_models
                 )
-                stage1_done.set()
-                return result
-
-            stage1_task = asyncio.create_task(run_stage1())
+            ))
 
             # Stream chunks while stage 1 runs
-            async for chunk_event in stream_chunks_until_done(stage1_done):
+            async for chunk_event in stream_chunks_until_done():
                 yield chunk_event
 
             stage1_results = await stage1_task
-            yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
+            save_stage("stage1", stage1_results)
+            yield _sse_event({'type': 'stage1_complete', 'data': stage1_results})
 
             # Stage 2: Fact-check with streaming (optional)
             if request.fact_checking_enabled:
                 current_stage["stage"] = "fact_check"
-                yield f"data: {json.dumps({'type': 'fact_check_start', 'models': models})}\n\n"
-
-                fact_check_done = asyncio.Event()
+                yield _sse_event({'type': 'fact_check_start', 'models': models})
 
-                async def run_fact_check():
-                    result = await stage2_fact_check_streaming(
+                fact_check_task = asyncio.create_task(end_chunks_when_done(
+                    stage2_fact_check_streaming(
                         request.content, stage1_results, on_chunk, request.council_models
                     )
-                    fact_check_done.set()
-                    return result
-
-                fact_check_task = asyncio.create_task(run_fact_check())
+                ))
 
                 # Stream chunks while fact-check runs
-                async for chunk_event in stream_chunks_until_done(fact_check_done):
+                async for chunk_event in stream_chunks_until_done():
                     yield chunk_event
 
                 fact_check_results, label_to_model = await fact_check_task
+                save_stage("fact_check", fact_check_results)
                 aggregate_fact_checks = calculate_aggregate_fact_checks(fact_check_results, label_to_model)
-                yield f"data: {json.dumps({'type': 'fact_check_complete', 'data': fact_check_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_fact_checks': aggregate_fact_checks}})}\n\n"
+                yield _sse_event({'type': 'fact_check_complete', 'data': fact_check_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_fact_checks': aggregate_fact_checks}})
             else:
                 # Skip fact-checking stage
                 fact_check_results = []
+                save_stage("fact_check", fact_check_results)
                 # Create simple label mapping without fact-checking
-                labels = [chr(65 + i) for i in range(len(stage1_results))]  # A, B, C, ...
-                label_to_model = {
-                    f"Response {label}": {
-                        "model": result['model'],
-                        "instance": result.get('instance', idx)
-                    }
-                    for idx, (label, result) in enumerate(zip(labels, stage1_results))
-                }
+                label_to_model = build_label_to_model(stage1_results)
                 aggregate_fact_checks = []
 
             # Stage 3: Collect rankings with streaming
             current_stage["stage"] = "stage3"
-            yield f"data: {json.dumps({'type': 'stage3_start', 'models': models})}\n\n"
-
-            stage3_done = asyncio.Event()
+            yield _sse_event({'type': 'stage3_start', 'models': models})
 
-            async def run_stage3():
-                result = await stage3_collect_rankings_streaming(
+            stage3_task = asyncio.create_task(end_chunks_when_done(
+                stage3_collect_rankings_streaming(
                     request.content, stage1_results, fact_check_results,
                     label_to_model, on_chunk, request.council_models
                 )
-                stage3_done.set()
-                return result
-
-            stage3_task = asyncio.create_task(run_stage3())
+            ))
 
             # Stream chunks while stage 3 runs
-            async for chunk_event in stream_chunks_until_done(stage3_done):
+            async for chunk_event in stream_chunks_until_done():
                 yield chunk_event
 
             stage3_results = await stage3_task
+            save_stage("stage3", stage3_results)
             aggregate_rankings = calculate_aggregate_rankings(stage3_results, label_to_model)
-            yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_results, 'metadata': {'aggregate_rankings': aggregate_rankings}})}\n\n"
+            yield _sse_event({'type': 'stage3_complete', 'data': stage3_results, 'metadata': {'aggregate_rankings': aggregate_rankings}})
 
             # Stage 4: Synthesize final answer with streaming
             current_stage["stage"] = "stage4"
             chairman = request.chairman_model if request.chairman_model else CHAIRMAN_MODEL
-            yield f"data: {json.dumps({'type': 'stage4_start', 'models': [chairman]})}\n\n"
+            yield _sse_event({'type': 'stage4_start', 'models': [chairman]})
 
-            stage4_done = asyncio.Event()
+            # Fact-check context shared by the chairman synthesis and error classification
+            fact_check_text = format_fact_check_text(fact_check_results) if fact_check_results else None
 
-            async def run_stage4():
-                result = await stage4_synthesize_final_streaming(
+            stage4_task = asyncio.create_task(end_chunks_when_done(
+                stage4_synthesize_final_streaming(
                     request.content, stage1_results, fact_check_results,
-                    stage3_results, label_to_model, on_chunk, request.chairman_model
+                    stage3_results, label_to_model, on_chunk, request.chairman_model,
+                    fact_check_text=fact_check_text
                 )
-                stage4_done.set()
-                return result
+            ))
 
-            stage4_task = asyncio.create_task(run_stage4())
+            # Error classification only needs the Stage 2 output, so start it
+            # now and let it run concurrently with the chairman synthesis
+            classify_task = None
+            if ERROR_CLASSIFICATION_ENABLED and request.fact_checking_enabled:
+                classify_task = asyncio.create_task(classify_errors(
+                    request.content,
+                    fact_check_results,
+                    label_to_model,
+                    request.chairman_model,
+                    fact_check_text=fact_check_text
+                ))
 
             # Stream chunks while stage 4 runs
-            async for chunk_event in stream_chunks_until_done(stage4_done):
+            async for chunk_event in stream_chunks_until_done():
                 yield chunk_event
 
             stage4_result = await stage4_task
-            yield f"data: {json.dumps({'type': 'stage4_complete', 'data': stage4_result})}\n\n"
+            save_stage("stage4", stage4_result)
+            yield _sse_event({'type': 'stage4_complete', 'data': stage4_result})
 
-            # Classify and catalog any errors found during fact-checking (if enabled)
-            if ERROR_CLASSIFICATION_ENABLED and request.fact_checking_enabled:
-                yield f"data: {json.dumps({'type': 'cataloging_start'})}\n\n"
-                classified_errors = await classify_errors(
-                    request.content,
-                    fact_check_results,
-                    label_to_model,
-                    request.chairman_model
-                )
+            # Catalog any errors found during fact-checking (if enabled)
+            if classify_task:
+                yield _SSE_CATALOGING_START
+                classified_errors = await classify_task
                 errors_cataloged = 0
                 if classified_errors:
                     for error in classified_errors:
                         error["conversation_id"] = conversation_id
-                    error_catalog.add_errors(classified_errors)
+                    db_writer.submit(error_catalog.add_errors, classified_errors)
                     errors_cataloged = len(classified_errors)
-                yield f"data: {json.dumps({'type': 'cataloging_complete', 'data': {'errors_cataloged': errors_cataloged}})}\n\n"
+                yield _sse_event({'type': 'cataloging_complete', 'data': {'errors_cataloged': errors_cataloged}})
 
             # Wait for title generation if it was started
             if title_task:
                 title = await title_task
-                storage.update_conversation_title(conversation_id, title, user_id)
-                yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
-
-            # Save complete assistant message
-            storage.add_assistant_message(
-                conversation_id,
-                stage1_results,
-                fact_check_results,
-                stage3_results,
-                stage4_result,
-                user_id
-            )
+                db_writer.submit(storage.update_conversation_title, conversation_id, title, user_id)
+                yield _sse_event({'type': 'title_complete', 'data': {'title': title}})
+
+            # Make sure every stage is stored before reporting completion
+            await db_writer.flush()
 
             # Send completion event
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            yield _SSE_COMPLETE
 
         except Exception as e:
             import traceback
             traceback.print_exc()
             # Send error event
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield _sse_event({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         event_generator(),
@@ -688,27 +803,15 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest,
     )
 
 
-@app.get("/api/errors")
+@app.get("/api/errors", response_class=_ORJSONResponse)
 async def get_errors(
-    user: dict = Depends(optional_auth),
-    api_key: str = Depends(optional_api_key)
+    user: dict = Depends(require_session_or_api_key)
 ):
     """
     Get all cataloged errors with summary statistics.
     
     **Authentication:** Requires either valid session or API key if auth is enabled.
     """
-    # Verify authentication if enabled
-    auth_required = is_auth_enabled() or is_api_key_auth_enabled()
-    has_session = user.get("login") != "anonymous"
-    has_api_key = bool(api_key)
-
-    if auth_required and not (has_session or has_api_key):
-        raise HTTPException(
-            status_code=401,
-            detail="Authentication required"
-        )
-    
     return {
         "errors": error_catalog.get_all_errors(),
         "summary": error_catalog.get_error_summary()
@@ -724,7 +827,9 @@ async def clear_errors(
     
     **Authentication:** Requires valid session authentication (cannot use API key for destructive operations).
     """
-    error_catalog.save_catalog({"errors": []})
+    # Rewrite on the writer thread, so the clear can't interleave with an
+    # append queued there by a running council
+    await db_writer.write(error_catalog.save_catalog, {"errors": []})
     return {"status": "ok", "message": "Error catalog cleared"}
 
 
@@ -805,14 +910,13 @@ async def create_model_config(
         )
     
     # Validate that all models exist in AVAILABLE_MODELS
-    available_model_ids = {model["id"] for model in AVAILABLE_MODELS}
-    invalid_council = [m for m in request.council_models if m not in available_model_ids]
+    invalid_council = [m for m in request.council_models if m not in AVAILABLE_MODELS_BY_ID]
     if invalid_council:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid council models: {', '.join(invalid_council)}"
         )
-    if request.chairman_model not in available_model_ids:
+    if request.chairman_model not in AVAILABLE_MODELS_BY_ID:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid chairman model: {request.chairman_model}"
@@ -891,17 +995,15 @@ async def update_model_config(
     
     # Validate models if provided
     if request.council_models or request.chairman_model:
-        available_model_ids = {model["id"] for model in AVAILABLE_MODELS}
-        
         if request.council_models:
-            invalid_council = [m for m in request.council_models if m not in available_model_ids]
+            invalid_council = [m for m in request.council_models if m not in AVAILABLE_MODELS_BY_ID]
             if invalid_council:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Invalid council models: {', '.join(invalid_council)}"
                 )
         
-        if request.chairman_model and request.chairman_model not in available_model_ids:
+        if request.chairman_model and request.chairman_model not in AVAILABLE_MODELS_BY_ID:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid chairman model: {request.chairman_model}"
@@ -3,8 +3,26 @@
 import httpx
 import time
 import asyncio
+import hashlib
+import sqlite3
+import orjson
 from typing import List, Dict, Any, Optional, AsyncGenerator, Callable
-from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
+from . import database
+from . import db_writer
+from .config import (
+    OPENROUTER_API_KEY,
+    OPENROUTER_API_URL,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_TTL_SECONDS
+)
+
+# Default cap on concurrent requests per parallel fan-out
+DEFAULT_MAX_INFLIGHT = 8
+
+# Retry policy for rate-limited (HTTP 429) responses
+MAX_RATE_LIMIT_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
 
 
 def is_grok_model(model: str) -> bool:
@@ -20,10 +38,184 @@ def is_grok_model(model: str) -> bool:
     return model.lower().startswith('x-ai/grok')
 
 
+def supports_cache_control(model: str) -> bool:
+    """
+    Check if a model needs explicit cache_control breakpoints for prompt caching.
+
+    Anthropic models only cache prompt prefixes that are marked; other
+    providers cache long stable prefixes automatically.
+
+    Args:
+        model: OpenRouter model identifier
+
+    Returns:
+        True if the model is an Anthropic model, False otherwise
+    """
+    return model.lower().startswith('anthropic/')
+
+
+def _mark_cacheable(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert system message text into content blocks marked as cacheable."""
+    return [
+        {
+            "role": message["role"],
+            "content": [{
+                "type": "text",
+                "text": message["content"],
+                "cache_control": {"type": "ephemeral"}
+            }]
+        }
+        if message["role"] == "system" and isinstance(message["content"], str)
+        else message
+        for message in messages
+    ]
+
+
+def serialize_messages(messages: List[Dict[str, str]], cache_control: bool = False) -> bytes:
+    """
+    Serialize a messages list to JSON once so it can be shared across requests.
+
+    Args:
+        messages: List of message dicts with 'role' and 'content'
+        cache_control: Whether to mark system messages as cacheable prefixes
+
+    Returns:
+        JSON-encoded messages array
+    """
+    if cache_control:
+        messages = _mark_cacheable(messages)
+    return orjson.dumps(messages)
+
+
+def serialize_messages_for_models(
+    models: List[str],
+    messages: List[Dict[str, str]]
+) -> Dict[str, bytes]:
+    """
+    Serialize shared messages once per wire format the given models need.
+
+    Args:
+        models: List of OpenRouter model identifiers (may contain duplicates)
+        messages: List of message dicts with 'role' and 'content'
+
+    Returns:
+        Dict mapping each model to its serialize_messages() output
+    """
+    variants: Dict[bool, bytes] = {}
+    serialized: Dict[str, bytes] = {}
+    for model in models:
+        if model not in serialized:
+            cacheable = supports_cache_control(model)
+            if cacheable not in variants:
+                variants[cacheable] = serialize_messages(messages, cache_control=cacheable)
+            serialized[model] = variants[cacheable]
+    return serialized
+
+
+def build_request_body(
+    model: str,
+    messages_json: bytes,
+    stream: bool = False,
+    response_format: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """
+    Build the JSON request body for a model around pre-serialized messages.
+
+    Only the small per-model fields are encoded here; the (potentially large)
+    messages array is spliced in as-is.
+
+    Args:
+        model: OpenRouter model identifier
+        messages_json: Output of serialize_messages()
+        stream: Whether to request a streaming response
+        response_format: Optional structured output format (e.g. a JSON schema)
+
+    Returns:
+        JSON-encoded request body
+    """
+    parts = [b'{"model":', orjson.dumps(model), b',"messages":', messages_json]
+    if stream:
+        parts.append(b',"stream":true')
+    if response_format is not None:
+        parts.append(b',"response_format":' + orjson.dumps(response_format))
+    # Enable reasoning mode for Grok models
+    if is_grok_model(model):
+        parts.append(b',"reasoning":{"enabled":true}')
+    parts.append(b'}')
+    return b"".join(parts)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a rate-limited request.
+
+    Honors a numeric Retry-After header, otherwise backs off exponentially.
+
+    Args:
+        response: The 429 response
+        attempt: Zero-based index of the attempt that was rate limited
+
+    Returns:
+        Delay in seconds, capped at RETRY_MAX_DELAY
+    """
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = RETRY_BASE_DELAY * (2 ** attempt)
+    return min(delay, RETRY_MAX_DELAY)
+
+
+def response_cache_key(model: str, messages_json: bytes) -> str:
+    """
+    Digest identifying a (model, messages) request in the response cache.
+
+    Args:
+        model: OpenRouter model identifier
+        messages_json: Output of serialize_messages()
+
+    Returns:
+        Hex digest of the model and serialized messages
+    """
+    return hashlib.blake2b(model.encode() + b"\0" + messages_json, digest_size=32).hexdigest()
+
+
+async def _cached_response(cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Return the cached response for cache_key, treating cache errors as a miss."""
+    if cache_key is None:
+        return None
+    try:
+        # Read on a worker thread so the query doesn't block the event loop
+        return await asyncio.to_thread(
+            database.get_cached_response, cache_key, RESPONSE_CACHE_TTL_SECONDS
+        )
+    except sqlite3.Error as e:
+        print(f"Warning: response cache lookup failed: {e}")
+        return None
+
+
+def _store_response(cache_key: Optional[str], model: str, response: Dict[str, Any]) -> None:
+    """Queue a successful, non-empty response for caching; failures are only logged."""
+    if cache_key is None or not response.get('content'):
+        return
+    # Written on the database writer thread (a copy, since callers may go on
+    # to modify the result); expired entries are pruned in the same write
+    db_writer.submit(
+        database.cache_response, cache_key, model, dict(response), RESPONSE_CACHE_TTL_SECONDS
+    )
+
+
+async def _bounded(semaphore: asyncio.Semaphore, coro):
+    """Await coro while holding a slot in semaphore."""
+    async with semaphore:
+        return await coro
+
+
 async def query_model(
     model: str,
     messages: List[Dict[str, str]],
-    timeout: float = 120.0
+    timeout: float = 120.0,
+    pre_serialized: Optional[bytes] = None,
+    response_format: Optional[Dict[str, Any]] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Query a single model via OpenRouter API.
@@ -32,6 +224,9 @@ async def query_model(
         model: OpenRouter model identifier (e.g., "openai/gpt-4o")
         messages: List of message dicts with 'role' and 'content'
         timeout: Request timeout in seconds
+        pre_serialized: Optional serialize_messages() output for messages
+        response_format: Optional structured output format for models that
+            support it (others ignore it and reply in plain text)
 
     Returns:
         Response dict with 'content', optional 'reasoning_details', and 'response_time_ms', or None if failed
@@ -41,24 +236,37 @@ async def query_model(
         "Content-Type": "application/json",
     }
 
-    payload = {
-        "model": model,
-        "messages": messages,
-    }
-    
-    # Enable reasoning mode for Grok models
-    if is_grok_model(model):
-        payload["reasoning"] = {"enabled": True}
+    if pre_serialized is None:
+        pre_serialized = serialize_messages(messages, cache_control=supports_cache_control(model))
+
+    # Replay an identical earlier request from the response cache if enabled
+    cache_key = None
+    if RESPONSE_CACHE_ENABLED:
+        cache_input = pre_serialized
+        if response_format is not None:
+            cache_input += orjson.dumps(response_format)
+        cache_key = response_cache_key(model, cache_input)
+    cached = await _cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    body = build_request_body(model, pre_serialized, response_format=response_format)
 
     start_time = time.time()
 
     try:
         async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                response = await client.post(
+                    OPENROUTER_API_URL,
+                    headers=headers,
+                    content=body
+                )
+                # Back off and retry when rate limited
+                if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                    await asyncio.sleep(_retry_delay(response, attempt))
+                    continue
+                break
             response.raise_for_status()
 
             end_time = time.time()
@@ -67,11 +275,13 @@ async def query_model(
             data = response.json()
             message = data['choices'][0]['message']
 
-            return {
+            result = {
                 'content': message.get('content'),
                 'reasoning_details': message.get('reasoning_details'),
                 'response_time_ms': response_time_ms
             }
+            _store_response(cache_key, model, result)
+            return result
 
     except Exception as e:
         print(f"Error querying model {model}: {e}")
@@ -80,7 +290,9 @@ async def query_model(
 
 async def query_models_parallel(
     models: List[str],
-    messages: List[Dict[str, str]]
+    messages: List[Dict[str, str]],
+    max_inflight: int = DEFAULT_MAX_INFLIGHT,
+    response_format: Optional[Dict[str, Any]] = None
 ) -> List[Dict[str, Any]]:
     """
     Query multiple models in parallel.
@@ -88,15 +300,24 @@ async def query_models_parallel(
     Args:
         models: List of OpenRouter model identifiers (may contain duplicates)
         messages: List of message dicts to send to each model
+        max_inflight: Maximum number of requests in flight at once
+        response_format: Optional structured output format passed to each model
 
     Returns:
         List of dicts, each containing 'model', 'instance' (index), and response data.
         This preserves order and handles duplicate models correctly.
     """
-    import asyncio
+    # Serialize the shared messages once rather than once per model
+    messages_json = serialize_messages_for_models(models, messages)
 
-    # Create tasks for all models (including duplicates)
-    tasks = [query_model(model, messages) for model in models]
+    # Create tasks for all models (including duplicates), bounded by max_inflight
+    semaphore = asyncio.Semaphore(max_inflight)
+    tasks = [
+        _bounded(semaphore, query_model(
+            model, messages, pre_serialized=messages_json[model], response_format=response_format
+        ))
+        for model in models
+    ]
 
     # Wait for all to complete
     responses = await asyncio.gather(*tasks)
@@ -112,12 +333,54 @@ async def query_models_parallel(
     return results
 
 
+async def query_models_parallel_as_completed(
+    models: List[str],
+    messages: List[Dict[str, str]],
+    max_inflight: int = DEFAULT_MAX_INFLIGHT,
+    response_format: Optional[Dict[str, Any]] = None
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Query multiple models in parallel, yielding each result as soon as it completes.
+
+    Args:
+        models: List of OpenRouter model identifiers (may contain duplicates)
+        messages: List of message dicts to send to each model
+        max_inflight: Maximum number of requests in flight at once
+        response_format: Optional structured output format passed to each model
+
+    Yields:
+        Dicts containing 'model', 'instance' (index), and response data,
+        in completion order rather than council order.
+    """
+    # Serialize the shared messages once rather than once per model
+    messages_json = serialize_messages_for_models(models, messages)
+
+    semaphore = asyncio.Semaphore(max_inflight)
+
+    async def run(idx: int, model: str) -> Dict[str, Any]:
+        async with semaphore:
+            response = await query_model(
+                model, messages, pre_serialized=messages_json[model], response_format=response_format
+            )
+        return {"model": model, "instance": idx, "response": response}
+
+    tasks = [asyncio.create_task(run(idx, model)) for idx, model in enumerate(models)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Don't leave requests running if the consumer stops early
+        for task in tasks:
+            task.cancel()
+
+
 async def query_model_streaming(
     model: str,
     messages: List[Dict[str, str]],
     instance: int,
     on_chunk: Callable[[str, str, int, str], None],
-    timeout: float = 120.0
+    timeout: float = 120.0,
+    pre_serialized: Optional[bytes] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Query a single model via OpenRouter API with streaming.
@@ -129,6 +392,7 @@ async def query_model_streaming(
         instance: Index of this model in the council (for identifying chunks)
         on_chunk: Callback function (model, instance, chunk_text) -> None
         timeout: Request timeout in seconds
+        pre_serialized: Optional serialize_messages() output for messages
 
     Returns:
         Complete response dict with 'content' and 'response_time_ms', or None if failed
@@ -138,15 +402,18 @@ async def query_model_streaming(
         "Content-Type": "application/json",
     }
 
-    payload = {
-        "model": model,
-        "messages": messages,
-        "stream": True,
-    }
-    
-    # Enable reasoning mode for Grok models
-    if is_grok_model(model):
-        payload["reasoning"] = {"enabled": True}
+    if pre_serialized is None:
+        pre_serialized = serialize_messages(messages, cache_control=supports_cache_control(model))
+
+    # Replay an identical earlier request from the response cache if enabled,
+    # delivering the whole cached text as a single chunk
+    cache_key = response_cache_key(model, pre_serialized) if RESPONSE_CACHE_ENABLED else None
+    cached = await _cached_response(cache_key)
+    if cached is not None:
+        await on_chunk(model, instance, cached['content'])
+        return cached
+
+    body = build_request_body(model, pre_serialized, stream=True)
 
     start_time = time.time()
     full_content = ""
@@ -154,43 +421,54 @@ async def query_model_streaming(
 
     try:
         async with httpx.AsyncClient(timeout=timeout) as client:
-            async with client.stream(
-                "POST",
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            ) as response:
-                response.raise_for_status()
-
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data_str = line[6:]
-                        if data_str.strip() == "[DONE]":
-                            break
-                        try:
-                            import json
-                            data = json.loads(data_str)
-                            if "choices" in data and len(data["choices"]) > 0:
-                                delta = data["choices"][0].get("delta", {})
-                                chunk_text = delta.get("content", "")
-                                if chunk_text:
-                                    full_content += chunk_text
-                                    # Call the callback with chunk info
-                                    await on_chunk(model, instance, chunk_text)
-                                # Capture reasoning_details if present
-                                if "reasoning_details" in delta:
-                                    reasoning_details = delta.get("reasoning_details")
-                        except (json.JSONDecodeError, KeyError, IndexError):
-                            pass
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                async with client.stream(
+                    "POST",
+                    OPENROUTER_API_URL,
+                    headers=headers,
+                    content=body
+                ) as response:
+                    # Rate limited before any tokens were sent, so it is safe to retry
+                    if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                        delay = _retry_delay(response, attempt)
+                    else:
+                        response.raise_for_status()
+
+                        async for line in response.aiter_lines():
+                            if line.startswith("data: "):
+                                data_str = line[6:]
+                                if data_str.strip() == "[DONE]":
+                                    break
+                                try:
+                                    import json
+                                    data = json.loads(data_str)
+                                    if "choices" in data and len(data["choices"]) > 0:
+                                        delta = data["choices"][0].get("delta", {})
+                                        chunk_text = delta.get("content", "")
+                                        if chunk_text:
+                                            full_content += chunk_text
+                                            # Call the callback with chunk info
+                                            await on_chunk(model, instance, chunk_text)
+                                        # Capture reasoning_details if present
+                                        if "reasoning_details" in delta:
+                                            reasoning_details = delta.get("reasoning_details")
+                                except (json.JSONDecodeError, KeyError, IndexError):
+                                    pass
+                        break
+
+                # Back off outside the stream context so the connection is released
+                await asyncio.sleep(delay)
 
         end_time = time.time()
         response_time_ms = round((end_time - start_time) * 1000)
 
-        return {
+        result = {
             'content': full_content,
             'reasoning_details': reasoning_details,
             'response_time_ms': response_time_ms
         }
+        _store_response(cache_key, model, result)
+        return result
 
     except Exception as e:
         print(f"Error streaming model {model}: {e}")
@@ -200,7 +478,8 @@ async def query_model_streaming(
 async def query_models_parallel_streaming(
     models: List[str],
     messages: List[Dict[str, str]],
-    on_chunk: Callable[[str, int, str], None]
+    on_chunk: Callable[[str, int, str], None],
+    max_inflight: int = DEFAULT_MAX_INFLIGHT
 ) -> List[Dict[str, Any]]:
     """
     Query multiple models in parallel with streaming.
@@ -210,13 +489,21 @@ async def query_models_parallel_streaming(
         models: List of OpenRouter model identifiers (may contain duplicates)
         messages: List of message dicts to send to each model
         on_chunk: Async callback function (model, instance, chunk_text) -> None
+        max_inflight: Maximum number of requests in flight at once
 
     Returns:
         List of dicts, each containing 'model', 'instance', and response data.
     """
-    # Create streaming tasks for all models
+    # Serialize the shared messages once rather than once per model
+    messages_json = serialize_messages_for_models(models, messages)
+
+    # Create streaming tasks for all models, bounded by max_inflight
+    semaphore = asyncio.Semaphore(max_inflight)
     tasks = [
-        query_model_streaming(model, messages, idx, on_chunk)
+        _bounded(
+            semaphore,
+            query_model_streaming(model, messages, idx, on_chunk, pre_serialized=messages_json[model])
+        )
         for idx, model in enumerate(models)
     ]
 
@@ -1,6 +1,6 @@
 """Storage module for conversations - delegates to SQLite database with user associations."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from . import database as db
 
@@ -33,6 +33,20 @@ def get_conversation(conversation_id: str, user_id: str = None) -> Optional[Dict
     return db.get_conversation(conversation_id, user_id)
 
 
+def get_conversation_summary(conversation_id: str, user_id: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Load a conversation's metadata from storage without its messages.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+        user_id: Optional user ID to verify ownership
+
+    Returns:
+        Metadata dict (including 'message_count' and 'chairman_model') or None if not found
+    """
+    return db.get_conversation_summary(conversation_id, user_id)
+
+
 def save_conversation(conversation: Dict[str, Any]):
     """
     Save a conversation to storage.
@@ -43,19 +57,26 @@ def save_conversation(conversation: Dict[str, Any]):
     db.save_conversation(conversation)
 
 
-def list_conversations(user_id: str = None) -> List[Dict[str, Any]]:
+def list_conversations(
+    user_id: str = None,
+    limit: Optional[int] = None,
+    before: Optional[Tuple[str, str]] = None
+) -> List[Dict[str, Any]]:
     """
-    List all conversations for a user (metadata only).
+    List conversations for a user (metadata only), most recently updated first.
 
     Args:
         user_id: User's identifier. If None, returns empty list.
+        limit: Optional maximum number of conversations to return
+        before: Optional (updated_at, id) of the previous page's last
+            conversation, to fetch the next page
 
     Returns:
         List of conversation metadata dicts
     """
     if user_id is None:
         return []
-    return db.list_conversations(user_id)
+    return db.list_conversations(user_id, limit, before)
 
 
 def search_conversations(user_id: str = None, search_query: str = "") -> List[Dict[str, Any]]:
@@ -86,26 +107,30 @@ def add_user_message(conversation_id: str, content: str, user_id: str = None):
     db.add_user_message(conversation_id, content, user_id)
 
 
-def add_assistant_message(
-    conversation_id: str,
-    stage1: List[Dict[str, Any]],
-    fact_check: List[Dict[str, Any]],
-    stage3: List[Dict[str, Any]],
-    stage4: Dict[str, Any],
-    user_id: str = None
-):
+def create_assistant_message(conversation_id: str, user_id: str = None) -> int:
     """
-    Add an assistant message with all 4 stages to a conversation.
+    Add an assistant message whose stages are filled in as they complete.
 
     Args:
         conversation_id: Conversation identifier
-        stage1: List of individual model responses
-        fact_check: List of fact-check analyses from each model
-        stage3: List of model rankings (informed by fact-checks)
-        stage4: Final synthesized response with fact-check validation
         user_id: Optional user ID to verify ownership
+
+    Returns:
+        ID of the new message
+    """
+    return db.create_assistant_message(conversation_id, user_id)
+
+
+def update_assistant_message_stage(message_id: int, stage: str, payload: Any):
+    """
+    Store one stage's results on an assistant message.
+
+    Args:
+        message_id: ID returned by create_assistant_message()
+        stage: One of "stage1", "fact_check", "stage3", "stage4"
+        payload: The stage's results
     """
-    db.add_assistant_message(conversation_id, stage1, fact_check, stage3, stage4, user_id)
+    db.update_assistant_message_stage(message_id, stage, payload)
 
 
 def update_conversation_title(conversation_id: str, title: str, user_id: str = None):
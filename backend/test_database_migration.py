@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test script for database schema migration.
+Upgrades a database created with the original schema (user_version 0) and
+checks the migrated message counts, indexes and response cache table, then
+checks that an up-to-date database is left alone.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+from backend import database
+
+# Schema as created before versioning: no message_count column, the
+# user_id-only conversations index, and a response cache keyed on a
+# text created_at column
+ORIGINAL_SCHEMA = """
+    CREATE TABLE conversations (
+        id TEXT PRIMARY KEY,
+        user_id TEXT NOT NULL,
+        title TEXT NOT NULL DEFAULT 'New Conversation',
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    CREATE TABLE messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        conversation_id TEXT NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT,
+        stage1 TEXT,
+        fact_check TEXT,
+        stage3 TEXT,
+        stage4 TEXT,
+        timestamp TEXT NOT NULL,
+        FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
+    );
+    CREATE INDEX idx_conversations_user_id ON conversations(user_id);
+    CREATE INDEX idx_messages_conversation_id ON messages(conversation_id);
+    CREATE TABLE model_configurations (
+        id TEXT PRIMARY KEY,
+        user_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        council_models TEXT NOT NULL,
+        chairman_model TEXT NOT NULL,
+        is_default INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL
+    );
+    CREATE INDEX idx_model_configurations_user_id ON model_configurations(user_id);
+    CREATE TABLE response_cache (
+        key TEXT PRIMARY KEY,
+        model TEXT NOT NULL,
+        content TEXT NOT NULL,
+        reasoning_details TEXT,
+        response_time_ms INTEGER,
+        created_at TEXT NOT NULL
+    );
+"""
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open a connection configured like the application's."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _index_names(conn: sqlite3.Connection) -> set:
+    """Names of the explicitly created indexes on conversations."""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'conversations' AND sql IS NOT NULL"
+    )
+    return {row["name"] for row in rows}
+
+
+def test_upgrade_original_schema():
+    """Test that a version-0 database is fully migrated."""
+    print("Test 1: Upgrade a database with the original schema")
+    print("-" * 70)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "council.db")
+        conn = _connect(path)
+        conn.executescript(ORIGINAL_SCHEMA)
+        conn.executemany(
+            "INSERT INTO conversations (id, user_id, created_at, updated_at) VALUES (?, 'u', 't', 't')",
+            [("busy",), ("empty",)]
+        )
+        conn.executemany(
+            "INSERT INTO messages (conversation_id, role, content, timestamp) VALUES ('busy', ?, 'x', 't')",
+            [("user",), ("assistant",), ("user",)]
+        )
+        conn.execute(
+            "INSERT INTO response_cache (key, model, content, created_at) VALUES ('k', 'm', 'c', 't')"
+        )
+        conn.commit()
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+
+        database._create_schema(conn)
+
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == database._SCHEMA_VERSION, (
+            "Schema version should be recorded after migrating"
+        )
+        print(f"✓ user_version set to {database._SCHEMA_VERSION}")
+
+        counts = dict(conn.execute("SELECT id, message_count FROM conversations").fetchall())
+        assert counts == {"busy": 3, "empty": 0}, f"Wrong backfilled message counts: {counts}"
+        print(f"✓ message_count backfilled: {counts}")
+
+        indexes = _index_names(conn)
+        assert "idx_conversations_user_id" not in indexes, "Old user_id index should be dropped"
+        assert "idx_conversations_user_updated_id" in indexes, "Covering list index should be created"
+        print(f"✓ Conversation indexes: {sorted(indexes)}")
+
+        cache_columns = {row["name"] for row in conn.execute("PRAGMA table_info(response_cache)")}
+        assert "created_at_ms" in cache_columns and "created_at" not in cache_columns, (
+            f"Response cache should be rebuilt with created_at_ms: {cache_columns}"
+        )
+        assert conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0] == 0
+        print("✓ Response cache rebuilt with created_at_ms")
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        print("✓ WAL journal mode enabled")
+        conn.close()
+    print()
+
+
+def test_current_schema_is_skipped():
+    """Test that the user_version gate skips an up-to-date database."""
+    print("Test 2: Up-to-date database is left alone")
+    print("-" * 70)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "council.db")
+        conn = _connect(path)
+        database._create_schema(conn)
+
+        # Changes a rerun of the migrations would undo
+        conn.execute("DROP INDEX idx_conversations_user_updated_id")
+        conn.execute("CREATE INDEX idx_conversations_user_id ON conversations(user_id)")
+        conn.commit()
+
+        database._create_schema(conn)
+        indexes = _index_names(conn)
+        assert indexes == {"idx_conversations_user_id"}, (
+            f"Schema setup should be skipped at the current version: {indexes}"
+        )
+        print("✓ Migrations skipped at the current user_version")
+        conn.close()
+    print()
+
+
+def test_upgrade_version_1():
+    """Test that a version-1 database gets the tie-breaking list index."""
+    print("Test 3: Upgrade a version-1 database")
+    print("-" * 70)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "council.db")
+        conn = _connect(path)
+        database._create_schema(conn)
+        conn.execute("DROP INDEX idx_conversations_user_updated_id")
+        conn.execute("""
+            CREATE INDEX idx_conversations_user_updated
+            ON conversations(user_id, updated_at DESC, id, title, created_at, message_count)
+        """)
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+
+        database._create_schema(conn)
+        indexes = _index_names(conn)
+        assert indexes == {"idx_conversations_user_updated_id"}, f"Unexpected indexes: {indexes}"
+        print("✓ Version-1 list index replaced")
+        conn.close()
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_upgrade_original_schema()
+        test_current_schema_is_skipped()
+        test_upgrade_version_1()
+        print("All tests passed! ✓")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"✗ FAIL: {e}")
+        sys.exit(1)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the background database writer.
+Checks that writes run one at a time in submission order, that flush()
+waits for queued writes, and that failures are surfaced or logged.
+"""
+
+import asyncio
+import contextlib
+import io
+import sys
+import threading
+import time
+
+from backend import db_writer
+
+
+def test_submission_order():
+    """Test that queued writes run in order on a single thread."""
+    print("Test 1: Writes run in submission order")
+    print("-" * 70)
+    calls = []
+    threads = set()
+
+    def record(value):
+        # A short sleep gives out-of-order execution a chance to show up
+        time.sleep(0.001)
+        calls.append(value)
+        threads.add(threading.get_ident())
+
+    async def run():
+        for i in range(20):
+            db_writer.submit(record, i)
+        await db_writer.flush()
+
+    asyncio.run(run())
+    assert calls == list(range(20)), f"Writes ran out of order: {calls}"
+    assert len(threads) == 1, "Writes should all run on the writer thread"
+    assert threading.get_ident() not in threads, "Writes should not run on the caller's thread"
+    print("✓ 20 writes ran in order on one writer thread")
+    print()
+
+
+def test_flush_waits_for_queued_writes():
+    """Test that flush() returns only after earlier writes have finished."""
+    print("Test 2: flush() waits for queued writes")
+    print("-" * 70)
+    done = threading.Event()
+
+    def slow_write():
+        time.sleep(0.05)
+        done.set()
+
+    async def run():
+        db_writer.submit(slow_write)
+        assert not done.is_set(), "submit() should not wait for the write"
+        await db_writer.flush()
+        assert done.is_set(), "flush() returned before the queued write finished"
+
+    asyncio.run(run())
+    print("✓ submit() returned immediately; flush() waited for the write")
+    print()
+
+
+def test_write_returns_and_raises():
+    """Test that write() returns the result and propagates exceptions."""
+    print("Test 3: write() results and errors")
+    print("-" * 70)
+
+    def fail():
+        raise ValueError("boom")
+
+    async def run():
+        assert await db_writer.write(lambda a, b: a + b, 2, 3) == 5
+        try:
+            await db_writer.write(fail)
+        except ValueError as e:
+            assert str(e) == "boom"
+        else:
+            raise AssertionError("write() should re-raise the write's exception")
+
+    asyncio.run(run())
+    print("✓ write() returned the result and re-raised the failure")
+    print()
+
+
+def test_submit_logs_failures():
+    """Test that a failed fire-and-forget write is logged, and later writes still run."""
+    print("Test 4: submit() logs failures")
+    print("-" * 70)
+    calls = []
+
+    def fail():
+        raise RuntimeError("disk full")
+
+    async def run():
+        db_writer.submit(fail)
+        db_writer.submit(calls.append, "after")
+        await db_writer.flush()
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        asyncio.run(run())
+
+    assert "background database write failed: disk full" in output.getvalue(), (
+        f"Failure was not logged: {output.getvalue()!r}"
+    )
+    assert calls == ["after"], "A failed write should not stop later writes"
+    print("✓ Failure logged and later writes still ran")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_submission_order()
+        test_flush_waits_for_queued_writes()
+        test_write_returns_and_raises()
+        test_submit_logs_failures()
+        print("All tests passed! ✓")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"✗ FAIL: {e}")
+        sys.exit(1)
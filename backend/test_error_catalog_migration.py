@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the error catalog's JSON Lines migration.
+Checks that errors in a legacy JSON catalog are carried over the first time
+the JSON Lines catalog is created, and only then.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from backend import error_catalog
+
+
+def _use_catalog_files(tmp: str):
+    """Point the catalog at files in tmp; returns the previous paths."""
+    previous = (error_catalog.ERROR_CATALOG_FILE, error_catalog._LEGACY_CATALOG_FILE)
+    error_catalog.ERROR_CATALOG_FILE = os.path.join(tmp, "error_catalog.jsonl")
+    error_catalog._LEGACY_CATALOG_FILE = os.path.join(tmp, "error_catalog.json")
+    error_catalog._invalidate_cache()
+    return previous
+
+
+def test_legacy_catalog_migration():
+    """Test that a legacy JSON catalog is carried over to JSON Lines."""
+    print("Test 1: Legacy JSON catalog carried over")
+    print("-" * 70)
+    legacy_errors = [
+        {"id": "1", "model": "a/model", "error_type": "Other", "claim": "c1"},
+        {"id": "2", "model": "b/model", "error_type": "Other", "claim": "c2"},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = _use_catalog_files(tmp)
+        try:
+            with open(error_catalog._LEGACY_CATALOG_FILE, "w") as f:
+                json.dump({"errors": legacy_errors}, f)
+
+            assert error_catalog.get_all_errors() == legacy_errors, "Legacy errors should be loaded"
+            with open(error_catalog.ERROR_CATALOG_FILE) as f:
+                lines = [json.loads(line) for line in f]
+            assert lines == legacy_errors, f"JSON Lines catalog should hold the legacy errors: {lines}"
+            print(f"✓ {len(lines)} legacy errors written one per line")
+
+            error_catalog.add_errors([{"model": "c/model", "claim": "c3"}])
+            errors = error_catalog.get_all_errors()
+            assert [e["claim"] for e in errors] == ["c1", "c2", "c3"], "New errors should be appended"
+            print("✓ New errors appended after the migrated ones")
+
+            # Once the JSON Lines catalog exists, the legacy file is ignored
+            error_catalog.save_catalog({"errors": []})
+            assert error_catalog.get_all_errors() == [], "Cleared catalog should stay empty"
+            assert os.path.exists(error_catalog._LEGACY_CATALOG_FILE), "Legacy file should be left in place"
+            print("✓ Clearing the catalog doesn't re-import the legacy file")
+        finally:
+            error_catalog.ERROR_CATALOG_FILE, error_catalog._LEGACY_CATALOG_FILE = previous
+            error_catalog._invalidate_cache()
+    print()
+
+
+def test_new_catalog_without_legacy_file():
+    """Test that a fresh catalog starts empty when there is no legacy file."""
+    print("Test 2: Fresh catalog without a legacy file")
+    print("-" * 70)
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = _use_catalog_files(tmp)
+        try:
+            assert error_catalog.get_all_errors() == [], "Fresh catalog should be empty"
+            assert os.path.exists(error_catalog.ERROR_CATALOG_FILE), "Catalog file should be created"
+            print("✓ Empty catalog created")
+        finally:
+            error_catalog.ERROR_CATALOG_FILE, error_catalog._LEGACY_CATALOG_FILE = previous
+            error_catalog._invalidate_cache()
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_legacy_catalog_migration()
+        test_new_catalog_without_legacy_file()
+        print("All tests passed! ✓")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"✗ FAIL: {e}")
+        sys.exit(1)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for the in-memory TTL cache.
+Checks that entries expire after their time-to-live and that the least
+recently used entry is evicted when the cache is full.
+"""
+
+import sys
+
+from backend.ttl_cache import TTLCache
+
+
+class FakeTimer:
+    """Manually advanced clock, so expiry can be tested without sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_expiry():
+    """Test that entries expire after the TTL."""
+    print("Test 1: TTL expiry")
+    print("-" * 70)
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=60, timer=timer)
+
+    cache["key"] = "value"
+    assert cache.get("key") == "value", "Fresh entry should be returned"
+    assert "key" in cache, "Fresh entry should be in cache"
+    print("✓ Fresh entry returned")
+
+    timer.now = 59.9
+    assert cache.get("key") == "value", "Entry should live until its TTL"
+    print("✓ Entry still returned just before expiry")
+
+    timer.now = 60.0
+    assert cache.get("key") is None, "Expired entry should not be returned"
+    assert cache.get("key", "default") == "default", "Expired lookup should return default"
+    assert "key" not in cache, "Expired entry should not be in cache"
+    assert len(cache) == 0, "Expired entry should be dropped on lookup"
+    print("✓ Expired entry dropped")
+
+    cache["other"] = 1
+    timer.now = 200.0
+    assert cache.pop("other", "gone") == "gone", "pop() should not return an expired entry"
+    print("✓ pop() ignores expired entries")
+    print()
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted when full."""
+    print("Test 2: LRU eviction")
+    print("-" * 70)
+    cache = TTLCache(maxsize=2, ttl=60, timer=FakeTimer())
+
+    cache["a"] = 1
+    cache["b"] = 2
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache["c"] = 3
+
+    assert len(cache) == 2, "Cache should stay at maxsize"
+    assert "b" not in cache, "Least recently used entry should be evicted"
+    assert cache.get("a") == 1 and cache.get("c") == 3, "Recently used entries should remain"
+    print("✓ Least recently used entry evicted")
+
+    # Re-setting an existing key refreshes it instead of growing the cache
+    cache["a"] = 10
+    cache["d"] = 4
+    assert "c" not in cache, "Entry not touched since 'a' was reset should be evicted"
+    assert cache.get("a") == 10, "Updated entry should keep its new value"
+    print("✓ Updating an entry marks it as recently used")
+
+    cache.clear()
+    assert len(cache) == 0, "clear() should remove every entry"
+    print("✓ clear() empties the cache")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_ttl_expiry()
+        test_lru_eviction()
+        print("All tests passed! ✓")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"✗ FAIL: {e}")
+        sys.exit(1)